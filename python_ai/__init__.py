@@ -33,12 +33,13 @@ __author__ = 'ScamDunk Development Team'
 from .pipeline import ScamDetectionPipeline, RiskAssessment, format_risk_output
 from .data_ingestion import (
     create_asset_context,
+    create_asset_contexts_batch,
     load_stock_data,
     load_crypto_data,
     check_sec_flagged_list
 )
-from .feature_engineering import engineer_all_features, create_feature_vector
-from .anomaly_detection import detect_anomalies, AnomalyResult
+from .feature_engineering import engineer_all_features, create_feature_vector, create_feature_vectors
+from .anomaly_detection import detect_anomalies, detect_anomalies_batch, AnomalyResult
 from .ml_model import ScamDetectorRF, train_random_forest_model
 from .lstm_model import ScamDetectorLSTM, train_lstm_model
 
@@ -47,12 +48,15 @@ __all__ = [
     'RiskAssessment',
     'format_risk_output',
     'create_asset_context',
+    'create_asset_contexts_batch',
     'load_stock_data',
     'load_crypto_data',
     'check_sec_flagged_list',
     'engineer_all_features',
     'create_feature_vector',
+    'create_feature_vectors',
     'detect_anomalies',
+    'detect_anomalies_batch',
     'AnomalyResult',
     'ScamDetectorRF',
     'train_random_forest_model',
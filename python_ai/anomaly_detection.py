@@ -8,14 +8,20 @@ This module implements statistical anomaly detection using:
 - Combined anomaly scoring
 
 The module is configurable via threshold parameters.
+
+Frames are only read through ``df.columns``, ``len(df)`` and
+``df[col].to_numpy()``, so the detectors accept a pandas DataFrame or a
+Polars DataFrame with the same engineered columns.
 """
 
+import functools
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple, Union
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass, replace
+from types import MappingProxyType
 
-from config import ANOMALY_CONFIG
+from config import ANOMALY_CONFIG, ANOMALY_PARAMS
 
 
 @dataclass
@@ -27,12 +33,309 @@ class AnomalyResult:
     details: Dict[str, Union[float, bool, str]]
 
 
+@dataclass(slots=True)
+class DetectorResult:
+    """Fields shared by every individual detector's result."""
+    is_anomaly: bool
+    anomaly_score: float
+    anomaly_types: List[str]
+
+
+@dataclass(slots=True)
+class ZScoreAnalysis(DetectorResult):
+    """Z-score detector result for the latest row."""
+    return_z_short: float
+    return_z_long: float
+    price_z_long: float
+    volume_z_short: float
+    volume_z_long: float
+
+
+@dataclass(slots=True)
+class VolatilityAnalysis(DetectorResult):
+    """Keltner Channel / ATR detector result for the latest row."""
+    keltner_position: float
+    breakout_upper: bool
+    breakout_lower: bool
+    atr_percent: float
+
+
+@dataclass(slots=True)
+class SurgeAnalysis(DetectorResult):
+    """Price and volume surge detector result; price changes are in %."""
+    price_change_1d: float
+    price_change_7d: float
+    price_change_30d: float
+    volume_surge_factor: float
+    pump_pattern: bool
+
+
+@dataclass(slots=True)
+class PatternAnalysis(DetectorResult):
+    """Multi-day pattern detector result over the lookback window."""
+    lookback_period: Optional[int] = None
+    pattern_info: Optional[str] = None
+
+
+# Latest-row feature vector scored by _score_latest, with the value each field
+# takes when its column is absent from the frame. detect_anomalies packs this
+# vector once and every latest-row detector reads from it.
+_LATEST_COLS = (
+    # Z-score detector
+    'Return_ZScore_Short', 'Return_ZScore_Long', 'Price_ZScore_Long',
+    'Volume_ZScore_Short', 'Volume_ZScore_Long',
+    # Volatility detector
+    'Keltner_Position', 'Keltner_Breakout_Upper', 'Keltner_Breakout_Lower',
+    'ATR_Percent',
+    # Surge detector
+    'Price_Change_1d', 'Price_Change_7d', 'Price_Change_30d',
+    'Volume_Surge_Factor', 'Pump_Pattern',
+)
+_LATEST_DEFAULTS = np.array([
+    0, 0, 0, 0, 0,
+    0.5, 0, 0, 0,
+    0, 0, 0, 1, 0,
+], dtype=np.float64)
+(
+    _RET_Z_SHORT, _RET_Z_LONG, _PRICE_Z_LONG, _VOL_Z_SHORT, _VOL_Z_LONG,
+    _KELTNER_POS, _KELTNER_UPPER, _KELTNER_LOWER, _ATR_PCT,
+    _PRICE_1D, _PRICE_7D, _PRICE_30D, _VOL_SURGE, _PUMP_PATTERN,
+) = range(len(_LATEST_COLS))
+
+# Thresholds consumed by _score_latest, packed in this order, with the
+# fallback used when a threshold dict does not define the key.
+_THRESHOLD_KEYS = (
+    'z_score_threshold', 'volume_z_threshold',
+    'price_surge_1d_threshold', 'price_surge_7d_threshold', 'price_surge_extreme',
+    'volume_surge_moderate', 'volume_surge_extreme',
+)
+_THRESHOLD_FALLBACKS = (2.5, 2.0, 0.10, 0.25, 0.50, 3.0, 5.0)
+(
+    _T_Z, _T_VOL_Z, _T_PRICE_1D, _T_PRICE_7D, _T_PRICE_EXTREME,
+    _T_VOL_MODERATE, _T_VOL_EXTREME,
+) = range(len(_THRESHOLD_KEYS))
+
+# Anomaly types dropped from the report when significant news explains the move.
+_NEWS_SUPPRESSED = frozenset({'daily_price_surge', 'weekly_price_pump'})
+
+# Window columns read by detect_pattern_anomalies, with their positions in the
+# stacked window array.
+_PATTERN_COLS = ('Close', 'Volume_Surge_Factor', 'Price_Change_1d', 'Return')
+_W_CLOSE, _W_VOL_SURGE, _W_PRICE_1D, _W_RETURN = range(len(_PATTERN_COLS))
+_PATTERN_LOOKBACK = 14
+
+# Number of distinct detect_anomalies inputs whose results are memoized
+_RESULT_CACHE_SIZE = 1024
+
+# Weights blending the zscore / volatility / surge / pattern component scores
+# into the combined anomaly score. Surge is most indicative of pump/dump.
+_COMPONENT_WEIGHTS = np.array([0.25, 0.20, 0.35, 0.20])
+
+# Per z-score column (_RET_Z_SHORT.._VOL_Z_LONG): whether its magnitude or its
+# signed value is compared, and which threshold it is compared against.
+_Z_USES_MAGNITUDE = np.array([True, True, True, False, False])
+_Z_THRESHOLD_INDEX = np.array([_T_Z, _T_Z, _T_Z, _T_VOL_Z, _T_VOL_Z])
+
+# Anomaly types flagged by _score_latest, in report order. Column i of the
+# flag mask corresponds to entry i; the slices split it per detector.
+_LATEST_ANOMALY_TYPES = (
+    'extreme_return_short_term', 'extreme_return_long_term',
+    'price_deviation_from_mean', 'volume_spike_short_term', 'volume_spike_long_term',
+    'keltner_upper_breakout', 'keltner_lower_breakout',
+    'extreme_keltner_high', 'extreme_keltner_low', 'extreme_volatility',
+    'daily_price_surge', 'weekly_price_pump', 'weekly_price_dump',
+    'extreme_weekly_price_move', 'extreme_volume_explosion', 'volume_explosion',
+    'pump_pattern_detected',
+)
+_ZSCORE_TYPES = slice(0, 5)
+_VOLATILITY_TYPES = slice(5, 10)
+_SURGE_TYPES = slice(10, 17)
+
+
+def _latest_vector(df: pd.DataFrame) -> np.ndarray:
+    """
+    Pack the last-row values of _LATEST_COLS into a float vector.
+
+    Columns missing from the frame keep their _LATEST_DEFAULTS value, matching
+    the defaults the detectors used with ``Series.get``.
+    """
+    feats = _LATEST_DEFAULTS.copy()
+    columns = df.columns
+    # Per-column reads: selecting a multi-column sub-frame would copy and
+    # consolidate every block just to keep one row.
+    for i, col in enumerate(_LATEST_COLS):
+        if col in columns:
+            feats[i] = df[col].to_numpy()[-1]
+    return feats
+
+
+def _mapping_vector(latest: Mapping[str, float]) -> np.ndarray:
+    """Pack a precomputed latest-row mapping into a _LATEST_COLS float vector."""
+    return np.array([
+        latest.get(col, default)
+        for col, default in zip(_LATEST_COLS, _LATEST_DEFAULTS.tolist())
+    ], dtype=np.float64)
+
+
+def _pack_thresholds(thresholds: dict) -> np.ndarray:
+    """Pack a threshold dict into a read-only float vector laid out as _THRESHOLD_KEYS."""
+    thresh = np.array([
+        thresholds.get(key, fallback)
+        for key, fallback in zip(_THRESHOLD_KEYS, _THRESHOLD_FALLBACKS)
+    ], dtype=np.float64)
+    thresh.setflags(write=False)
+    return thresh
+
+
+# The config is only read at import: the default threshold vector and the
+# pattern thresholds are bound once, as typed floats, instead of being looked
+# up per call.
+_DEFAULT_THRESHOLDS = _pack_thresholds(ANOMALY_CONFIG)
+_PUMP_DUMP_RISE = float(ANOMALY_PARAMS.pump_dump_rise)
+_PUMP_DUMP_FALL = float(ANOMALY_PARAMS.pump_dump_fall)
+
+
+def _threshold_vector(thresholds: dict = None, **overrides: Optional[float]) -> np.ndarray:
+    """
+    Return the threshold vector for a threshold dict (defaults to ANOMALY_CONFIG).
+
+    Keyword overrides that are not None take precedence, mirroring the
+    per-detector threshold arguments. Without a dict or overrides the
+    precomputed default vector is returned as-is.
+    """
+    overrides = {key: value for key, value in overrides.items() if value is not None}
+    if not thresholds and not overrides:
+        return _DEFAULT_THRESHOLDS
+    return _pack_thresholds({**(thresholds or ANOMALY_CONFIG), **overrides})
+
+
+def _score_latest(feats: np.ndarray, thresh: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score latest-row feature vectors for the z-score, volatility and surge detectors.
+
+    All arithmetic runs as NumPy ufuncs over the last axis, so a single
+    (len(_LATEST_COLS),) vector and an (N, len(_LATEST_COLS)) matrix of
+    tickers go through the same code.
+
+    Args:
+        feats: Latest-row values laid out as _LATEST_COLS
+        thresh: Thresholds laid out as _THRESHOLD_KEYS
+
+    Returns:
+        Tuple of (component scores [..., 3] ordered zscore/volatility/surge,
+        boolean flag mask [..., len(_LATEST_ANOMALY_TYPES)])
+    """
+    z_threshold = thresh[_T_Z]
+    price_threshold = thresh[_T_PRICE_7D]
+    volume_threshold = thresh[_T_VOL_MODERATE]
+
+    # Z-scores: magnitude for returns/price, direction kept for volume. All
+    # five share one array, so the max and the threshold checks are one
+    # reduction and one comparison each.
+    z = feats[..., _RET_Z_SHORT:_VOL_Z_LONG + 1]
+    z = np.where(_Z_USES_MAGNITUDE, np.abs(z), z)
+    max_z = np.maximum(z, 0).max(axis=-1)
+    z_flags = z > thresh[_Z_THRESHOLD_INDEX]
+    # Normalize score: z=3 -> 0.5, z=6 -> ~0.9
+    zscore_score = 1 - (1 / (1 + max_z / z_threshold))
+
+    # Volatility: Keltner position deviation + ATR as a share of price
+    keltner_position = feats[..., _KELTNER_POS]
+    atr_percent = feats[..., _ATR_PCT]
+    position_deviation = np.abs(keltner_position - 0.5) * 2  # 0-1+ scale
+    volatility_factor = np.minimum(atr_percent / 10, 1)  # 0-1 scale
+    volatility_score = np.minimum((position_deviation + volatility_factor) / 2, 1)
+
+    # Surges: 7-day price move and volume surge factor, each capped at 1
+    price_change_7d = feats[..., _PRICE_7D]
+    volume_surge = feats[..., _VOL_SURGE]
+    abs_price_7d = np.abs(price_change_7d)
+    price_score = np.minimum(abs_price_7d / price_threshold, 2) / 2
+    volume_score = np.minimum(volume_surge / volume_threshold, 2) / 2
+    surge_score = np.maximum(price_score, volume_score)
+
+    weekly_move = abs_price_7d > price_threshold
+    extreme_volume = volume_surge >= thresh[_T_VOL_EXTREME]
+    flags = np.concatenate([z_flags, np.stack([
+        feats[..., _KELTNER_UPPER] != 0,
+        feats[..., _KELTNER_LOWER] != 0,
+        keltner_position > 1.2,
+        keltner_position < -0.2,
+        atr_percent > 10,  # ATR > 10% of price is unusual
+        np.abs(feats[..., _PRICE_1D]) > thresh[_T_PRICE_1D],
+        weekly_move & (price_change_7d > 0),
+        weekly_move & ~(price_change_7d > 0),
+        abs_price_7d > thresh[_T_PRICE_EXTREME],
+        extreme_volume,
+        ~extreme_volume & (volume_surge >= volume_threshold),
+        feats[..., _PUMP_PATTERN] != 0,
+    ], axis=-1)], axis=-1)
+
+    scores = np.stack([zscore_score, volatility_score, surge_score], axis=-1)
+    return scores, flags
+
+
+def _flagged_types(flags: List[bool], types: slice) -> List[str]:
+    """Decode one detector's slice of a flag mask row into anomaly type names."""
+    return [name for name, hit in zip(_LATEST_ANOMALY_TYPES[types], flags[types]) if hit]
+
+
+def _zscore_analysis(
+    row: List[float], score: float, flags: List[bool]
+) -> ZScoreAnalysis:
+    """Build the z-score detector result from a scored latest-row vector."""
+    anomalies_found = _flagged_types(flags, _ZSCORE_TYPES)
+    return ZScoreAnalysis(
+        is_anomaly=len(anomalies_found) > 0,
+        anomaly_score=score,
+        anomaly_types=anomalies_found,
+        return_z_short=abs(row[_RET_Z_SHORT]),
+        return_z_long=abs(row[_RET_Z_LONG]),
+        price_z_long=abs(row[_PRICE_Z_LONG]),
+        volume_z_short=row[_VOL_Z_SHORT],
+        volume_z_long=row[_VOL_Z_LONG],
+    )
+
+
+def _volatility_analysis(
+    row: List[float], score: float, flags: List[bool]
+) -> VolatilityAnalysis:
+    """Build the volatility detector result from a scored latest-row vector."""
+    anomalies_found = _flagged_types(flags, _VOLATILITY_TYPES)
+    return VolatilityAnalysis(
+        is_anomaly=len(anomalies_found) > 0,
+        anomaly_score=score,
+        anomaly_types=anomalies_found,
+        keltner_position=row[_KELTNER_POS],
+        breakout_upper=bool(row[_KELTNER_UPPER]),
+        breakout_lower=bool(row[_KELTNER_LOWER]),
+        atr_percent=row[_ATR_PCT],
+    )
+
+
+def _surge_analysis(
+    row: List[float], score: float, flags: List[bool]
+) -> SurgeAnalysis:
+    """Build the surge detector result from a scored latest-row vector."""
+    anomalies_found = _flagged_types(flags, _SURGE_TYPES)
+    return SurgeAnalysis(
+        is_anomaly=len(anomalies_found) > 0,
+        anomaly_score=score,
+        anomaly_types=anomalies_found,
+        price_change_1d=abs(row[_PRICE_1D]) * 100,  # Convert to %
+        price_change_7d=row[_PRICE_7D] * 100,
+        price_change_30d=row[_PRICE_30D] * 100,
+        volume_surge_factor=row[_VOL_SURGE],
+        pump_pattern=bool(row[_PUMP_PATTERN]),
+    )
+
+
 def detect_zscore_anomalies(
     df: pd.DataFrame,
     z_threshold: float = None,
     volume_z_threshold: float = None,
     thresholds: dict = None
-) -> Dict[str, Union[bool, float, List[str]]]:
+) -> ZScoreAnalysis:
     """
     Detect anomalies based on Z-score analysis.
 
@@ -43,61 +346,19 @@ def detect_zscore_anomalies(
         thresholds: Optional threshold dict (defaults to ANOMALY_CONFIG)
 
     Returns:
-        Dictionary with Z-score anomaly analysis
+        ZScoreAnalysis for the latest row
     """
-    _thresholds = thresholds or ANOMALY_CONFIG
-    z_threshold = z_threshold or _thresholds.get('z_score_threshold', 2.5)
-    volume_z_threshold = volume_z_threshold or _thresholds.get('volume_z_threshold', 2.0)
-
-    latest = df.iloc[-1]
-
-    # Get Z-scores (use absolute values for magnitude)
-    return_z_short = abs(latest.get('Return_ZScore_Short', 0))
-    return_z_long = abs(latest.get('Return_ZScore_Long', 0))
-    price_z_long = abs(latest.get('Price_ZScore_Long', 0))
-    volume_z_short = latest.get('Volume_ZScore_Short', 0)  # Keep direction for volume
-    volume_z_long = latest.get('Volume_ZScore_Long', 0)
-
-    anomalies_found = []
-
-    # Check return Z-scores
-    if return_z_short > z_threshold:
-        anomalies_found.append('extreme_return_short_term')
-    if return_z_long > z_threshold:
-        anomalies_found.append('extreme_return_long_term')
-
-    # Check price deviation from mean
-    if price_z_long > z_threshold:
-        anomalies_found.append('price_deviation_from_mean')
-
-    # Check volume spikes (usually positive = anomaly)
-    if volume_z_short > volume_z_threshold:
-        anomalies_found.append('volume_spike_short_term')
-    if volume_z_long > volume_z_threshold:
-        anomalies_found.append('volume_spike_long_term')
-
-    # Calculate combined score (0-1 scale)
-    max_z = max(return_z_short, return_z_long, price_z_long,
-                max(0, volume_z_short), max(0, volume_z_long))
-
-    # Normalize score: z=3 -> 0.5, z=6 -> ~0.9
-    normalized_score = 1 - (1 / (1 + max_z / z_threshold))
-
-    return {
-        'is_anomaly': len(anomalies_found) > 0,
-        'anomaly_score': normalized_score,
-        'anomaly_types': anomalies_found,
-        'return_z_short': return_z_short,
-        'return_z_long': return_z_long,
-        'price_z_long': price_z_long,
-        'volume_z_short': volume_z_short,
-        'volume_z_long': volume_z_long,
-    }
+    feats = _latest_vector(df)
+    thresh = _threshold_vector(
+        thresholds, z_score_threshold=z_threshold, volume_z_threshold=volume_z_threshold
+    )
+    scores, flags = _score_latest(feats, thresh)
+    return _zscore_analysis(feats.tolist(), float(scores[0]), flags.tolist())
 
 
 def detect_volatility_anomalies(
     df: pd.DataFrame
-) -> Dict[str, Union[bool, float, List[str]]]:
+) -> VolatilityAnalysis:
     """
     Detect anomalies based on volatility indicators (Keltner Channels, ATR).
 
@@ -105,48 +366,11 @@ def detect_volatility_anomalies(
         df: DataFrame with volatility indicators
 
     Returns:
-        Dictionary with volatility anomaly analysis
+        VolatilityAnalysis for the latest row
     """
-    latest = df.iloc[-1]
-
-    anomalies_found = []
-
-    # Keltner Channel breakouts
-    keltner_position = latest.get('Keltner_Position', 0.5)
-    breakout_upper = latest.get('Keltner_Breakout_Upper', 0)
-    breakout_lower = latest.get('Keltner_Breakout_Lower', 0)
-
-    if breakout_upper:
-        anomalies_found.append('keltner_upper_breakout')
-    if breakout_lower:
-        anomalies_found.append('keltner_lower_breakout')
-
-    # Extreme Keltner position (outside 0-1 range indicates breakout)
-    if keltner_position > 1.2:
-        anomalies_found.append('extreme_keltner_high')
-    elif keltner_position < -0.2:
-        anomalies_found.append('extreme_keltner_low')
-
-    # ATR anomaly (extremely high volatility)
-    atr_percent = latest.get('ATR_Percent', 0)
-    if atr_percent > 10:  # ATR > 10% of price is unusual
-        anomalies_found.append('extreme_volatility')
-
-    # Calculate score based on Keltner position deviation
-    position_deviation = abs(keltner_position - 0.5) * 2  # 0-1+ scale
-    volatility_factor = min(atr_percent / 10, 1)  # 0-1 scale
-
-    score = min((position_deviation + volatility_factor) / 2, 1)
-
-    return {
-        'is_anomaly': len(anomalies_found) > 0,
-        'anomaly_score': score,
-        'anomaly_types': anomalies_found,
-        'keltner_position': keltner_position,
-        'breakout_upper': bool(breakout_upper),
-        'breakout_lower': bool(breakout_lower),
-        'atr_percent': atr_percent,
-    }
+    feats = _latest_vector(df)
+    scores, flags = _score_latest(feats, _threshold_vector())
+    return _volatility_analysis(feats.tolist(), float(scores[1]), flags.tolist())
 
 
 def detect_surge_anomalies(
@@ -154,7 +378,7 @@ def detect_surge_anomalies(
     price_surge_threshold: float = None,
     volume_surge_threshold: float = None,
     thresholds: dict = None
-) -> Dict[str, Union[bool, float, List[str]]]:
+) -> SurgeAnalysis:
     """
     Detect price and volume surge anomalies.
 
@@ -165,67 +389,38 @@ def detect_surge_anomalies(
         thresholds: Optional threshold dict (defaults to ANOMALY_CONFIG)
 
     Returns:
-        Dictionary with surge anomaly analysis
+        SurgeAnalysis for the latest row
     """
-    _thresholds = thresholds or ANOMALY_CONFIG
-    price_threshold = price_surge_threshold or _thresholds.get('price_surge_7d_threshold', 0.25)
-    volume_threshold = volume_surge_threshold or _thresholds.get('volume_surge_moderate', 3.0)
-
-    latest = df.iloc[-1]
-
-    anomalies_found = []
-
-    # Price surges
-    price_change_1d = abs(latest.get('Price_Change_1d', 0))
-    price_change_7d = latest.get('Price_Change_7d', 0)  # Keep direction
-    price_change_30d = latest.get('Price_Change_30d', 0)
-
-    if price_change_1d > _thresholds.get('price_surge_1d_threshold', 0.10):
-        anomalies_found.append('daily_price_surge')
-
-    if abs(price_change_7d) > price_threshold:
-        if price_change_7d > 0:
-            anomalies_found.append('weekly_price_pump')
-        else:
-            anomalies_found.append('weekly_price_dump')
-
-    if abs(price_change_7d) > _thresholds.get('price_surge_extreme', 0.50):
-        anomalies_found.append('extreme_weekly_price_move')
+    feats = _latest_vector(df)
+    thresh = _threshold_vector(
+        thresholds,
+        price_surge_7d_threshold=price_surge_threshold,
+        volume_surge_moderate=volume_surge_threshold,
+    )
+    scores, flags = _score_latest(feats, thresh)
+    return _surge_analysis(feats.tolist(), float(scores[2]), flags.tolist())
 
-    # Volume surges
-    volume_surge = latest.get('Volume_Surge_Factor', 1)
-    if volume_surge >= _thresholds.get('volume_surge_extreme', 5.0):
-        anomalies_found.append('extreme_volume_explosion')
-    elif volume_surge >= volume_threshold:
-        anomalies_found.append('volume_explosion')
 
-    # Pump pattern (price up + volume up)
-    pump_pattern = latest.get('Pump_Pattern', 0)
-    if pump_pattern:
-        anomalies_found.append('pump_pattern_detected')
+def _pattern_window(df: pd.DataFrame, lookback: int) -> np.ndarray:
+    """
+    Return the last ``lookback`` rows of _PATTERN_COLS as one (lookback, 4) array.
 
-    # Calculate score
-    price_score = min(abs(price_change_7d) / price_threshold, 2) / 2  # Cap at 1
-    volume_score = min(volume_surge / volume_threshold, 2) / 2  # Cap at 1
-    score = max(price_score, volume_score)
-
-    return {
-        'is_anomaly': len(anomalies_found) > 0,
-        'anomaly_score': score,
-        'anomaly_types': anomalies_found,
-        'price_change_1d': price_change_1d * 100,  # Convert to %
-        'price_change_7d': price_change_7d * 100,
-        'price_change_30d': price_change_30d * 100,
-        'volume_surge_factor': volume_surge,
-        'pump_pattern': bool(pump_pattern),
-    }
+    Columns are read one at a time and stacked: selecting a multi-column
+    sub-frame in pandas copies and consolidates blocks and is several times
+    slower for a window this small. Absent optional columns are NaN.
+    """
+    columns = df.columns
+    return np.column_stack([
+        df[col].to_numpy()[-lookback:] if col in columns else np.full(min(lookback, len(df)), np.nan)
+        for col in _PATTERN_COLS
+    ])
 
 
 def detect_pattern_anomalies(
     df: pd.DataFrame,
-    lookback: int = 14,
+    lookback: int = _PATTERN_LOOKBACK,
     thresholds: dict = None
-) -> Dict[str, Union[bool, float, List[str]]]:
+) -> PatternAnalysis:
     """
     Detect suspicious patterns in recent data.
 
@@ -235,122 +430,370 @@ def detect_pattern_anomalies(
         thresholds: Optional threshold dict (defaults to ANOMALY_CONFIG)
 
     Returns:
-        Dictionary with pattern anomaly analysis
+        PatternAnalysis over the lookback window
     """
     if len(df) < lookback:
-        return {
-            'is_anomaly': False,
-            'anomaly_score': 0,
-            'anomaly_types': [],
-            'pattern_info': 'Insufficient data for pattern analysis'
-        }
+        return _insufficient_pattern_result()
+
+    columns = df.columns
+    return _pattern_analysis(
+        _pattern_window(df, lookback), lookback, thresholds,
+        check_pump_dump='Price_Change_7d' in columns,
+        check_coordination='Volume_Surge_Factor' in columns,
+    )
+
+
+def _insufficient_pattern_result() -> PatternAnalysis:
+    """Pattern result for a window shorter than the lookback."""
+    return PatternAnalysis(
+        is_anomaly=False,
+        anomaly_score=0,
+        anomaly_types=[],
+        pattern_info='Insufficient data for pattern analysis'
+    )
 
-    _thresholds = thresholds or ANOMALY_CONFIG
-    recent = df.tail(lookback)
+
+def _skipped_pattern_result() -> PatternAnalysis:
+    """Pattern result for a ticker whose other detectors already decided it."""
+    return PatternAnalysis(
+        is_anomaly=False,
+        anomaly_score=0,
+        anomaly_types=[],
+        pattern_info='Skipped: other detectors already flag an anomaly'
+    )
+
+
+def _pattern_analysis(
+    window: np.ndarray,
+    lookback: int,
+    thresholds: dict = None,
+    check_pump_dump: bool = True,
+    check_coordination: bool = True
+) -> PatternAnalysis:
+    """Pattern analysis over a (lookback, 4) window laid out as _PATTERN_COLS."""
+    if len(window) < lookback:
+        return _insufficient_pattern_result()
+
+    if thresholds:
+        pump_rise_threshold = thresholds.get('pump_dump_rise', 0.20)
+        pump_fall_threshold = thresholds.get('pump_dump_fall', -0.15)
+    else:
+        pump_rise_threshold, pump_fall_threshold = _PUMP_DUMP_RISE, _PUMP_DUMP_FALL
     anomalies_found = []
+    close = window[:, _W_CLOSE]
 
     # Pattern 1: Pump and Dump (rapid rise followed by drop)
-    if 'Price_Change_7d' in recent.columns:
-        # Check if there was a pump followed by a dump
-        max_price_idx = recent['Close'].idxmax()
-        max_price_position = recent.index.get_loc(max_price_idx)
+    if check_pump_dump:
+        # Check if there was a pump followed by a dump. argmax gives the peak
+        # position directly; gaps are masked out first so a missing close
+        # never wins, matching the skipna behaviour of Series.idxmax.
+        if np.isnan(close).any():
+            max_price_position = int(np.where(np.isnan(close), -np.inf, close).argmax())
+        else:
+            max_price_position = int(close.argmax())
 
         if max_price_position > lookback // 3 and max_price_position < lookback * 2 // 3:
-            # Price peaked in the middle of the window
-            pre_peak = recent.iloc[:max_price_position + 1]
-            post_peak = recent.iloc[max_price_position:]
-
-            if len(pre_peak) > 2 and len(post_peak) > 2:
-                pre_peak_return = (pre_peak['Close'].iloc[-1] / pre_peak['Close'].iloc[0]) - 1
-                post_peak_return = (post_peak['Close'].iloc[-1] / post_peak['Close'].iloc[0]) - 1
+            # Price peaked in the middle of the window; the pre-peak leg is
+            # close[:peak + 1] and the post-peak leg is close[peak:]
+            if max_price_position + 1 > 2 and len(close) - max_price_position > 2:
+                pre_peak_return = (close[max_price_position] / close[0]) - 1
+                post_peak_return = (close[-1] / close[max_price_position]) - 1
 
-                pump_rise_threshold = _thresholds.get('pump_dump_rise', 0.20)
-                pump_fall_threshold = _thresholds.get('pump_dump_fall', -0.15)
                 if pre_peak_return > pump_rise_threshold and post_peak_return < pump_fall_threshold:
                     anomalies_found.append('pump_and_dump_pattern')
 
     # Pattern 2: Coordinated volume/price (both spike together)
-    if 'Volume_Surge_Factor' in recent.columns:
-        high_vol_days = (recent['Volume_Surge_Factor'] > 3).sum()
-        high_price_move_days = (recent['Price_Change_1d'].abs() > 0.05).sum()
+    if check_coordination:
+        high_vol_days = np.count_nonzero(window[:, _W_VOL_SURGE] > 3)
+        high_price_move_days = np.count_nonzero(np.abs(window[:, _W_PRICE_1D]) > 0.05)
 
         if high_vol_days >= 3 and high_price_move_days >= 3:
             anomalies_found.append('coordinated_volume_price_activity')
 
     # Pattern 3: Unusual consistency (too smooth/manipulated)
-    returns = recent['Return'].dropna()
-    if len(returns) > 5:
+    # NaN compares False, so counting positives needs no filtered copy
+    returns = window[:, _W_RETURN]
+    if len(returns) - np.count_nonzero(np.isnan(returns)) > 5:
         # Check for unusually low variance (possible manipulation)
-        positive_streak = (returns > 0).sum()
+        positive_streak = np.count_nonzero(returns > 0)
         if positive_streak > lookback * 0.8:
             anomalies_found.append('suspicious_positive_streak')
 
     # Calculate score
     score = min(len(anomalies_found) * 0.3, 1)
 
-    return {
-        'is_anomaly': len(anomalies_found) > 0,
-        'anomaly_score': score,
-        'anomaly_types': anomalies_found,
-        'lookback_period': lookback,
-    }
+    return PatternAnalysis(
+        is_anomaly=len(anomalies_found) > 0,
+        anomaly_score=score,
+        anomaly_types=anomalies_found,
+        lookback_period=lookback,
+    )
 
 
 def detect_anomalies(
-    df: pd.DataFrame,
+    df: pd.DataFrame = None,
     news_flag: bool = False,
     sensitivity: float = 1.0,
-    thresholds: dict = None
+    thresholds: dict = None,
+    *,
+    latest: Mapping[str, float] = None,
+    window: np.ndarray = None,
+    include_pattern: bool = True
 ) -> AnomalyResult:
     """
     Main anomaly detection function combining all detection methods.
 
+    Callers that already hold the latest row and recent window can pass them
+    in, in which case they are not read from ``df`` again (and ``df`` may be
+    omitted when both are given).
+
     Args:
-        df: DataFrame with all engineered features
+        df: DataFrame (pandas or Polars) with all engineered features
         news_flag: Whether significant news exists (reduces false positives)
         sensitivity: Sensitivity multiplier (>1 = more sensitive)
         thresholds: Optional threshold dict (defaults to ANOMALY_CONFIG)
+        latest: Optional latest row as a mapping of engineered column name to
+            value (e.g. ``df.iloc[-1]`` or its ``to_dict()``)
+        window: Optional (14, 4) array of the last 14 rows of Close,
+            Volume_Surge_Factor, Price_Change_1d and Return, in that order
+        include_pattern: If False, skip the pattern detector when the other
+            detectors already guarantee is_anomaly. is_anomaly is unchanged,
+            but anomaly_score is then a lower bound and pattern types are
+            omitted - use it for yes/no screening only
 
     Returns:
         AnomalyResult with comprehensive anomaly analysis
-    """
-    # Run all anomaly detectors
-    zscore_result = detect_zscore_anomalies(df, thresholds=thresholds)
-    volatility_result = detect_volatility_anomalies(df)
-    surge_result = detect_surge_anomalies(df, thresholds=thresholds)
-    pattern_result = detect_pattern_anomalies(df, thresholds=thresholds)
 
-    # Collect all anomaly types
-    all_anomaly_types = (
-        zscore_result['anomaly_types'] +
-        volatility_result['anomaly_types'] +
-        surge_result['anomaly_types'] +
-        pattern_result['anomaly_types']
+    The result depends only on the latest row, the last 14 rows of the
+    pattern columns and the other arguments. Results are memoized on those
+    values, so repeated calls for the same bar (e.g. scoring and then
+    explaining a ticker) only pay for reading the inputs.
+    """
+    if df is None and (latest is None or window is None):
+        raise ValueError("detect_anomalies needs df unless both latest and window are given")
+
+    feats = _latest_vector(df) if latest is None else _mapping_vector(latest)
+
+    if window is not None:
+        pattern_window = np.asarray(window, dtype=np.float64)
+        check_pump_dump = check_coordination = True
+    else:
+        columns = df.columns
+        # A short frame gets an empty window, which scores as insufficient
+        if len(df) < _PATTERN_LOOKBACK:
+            pattern_window = np.empty((0, len(_PATTERN_COLS)))
+        else:
+            pattern_window = _pattern_window(df, _PATTERN_LOOKBACK)
+        check_pump_dump = 'Price_Change_7d' in columns
+        check_coordination = 'Volume_Surge_Factor' in columns
+
+    try:
+        threshold_key = tuple(sorted(thresholds.items())) if thresholds else None
+        hash(threshold_key)
+    except TypeError:
+        # Unhashable threshold values: score without memoizing
+        return _score_inputs(
+            feats, pattern_window, check_pump_dump, check_coordination,
+            bool(news_flag), float(sensitivity), thresholds, include_pattern
+        )
+
+    result = _detect_anomalies_cached(
+        np.ascontiguousarray(feats, dtype=np.float64).tobytes(),
+        np.ascontiguousarray(pattern_window, dtype=np.float64).tobytes(),
+        check_pump_dump, check_coordination,
+        bool(news_flag), float(sensitivity), threshold_key, include_pattern
     )
+    # Cached results are shared; hand out a copy down to the detector
+    # results and component scores so callers can annotate what they receive
+    return _copy_result(result)
 
-    # Calculate combined score (weighted average)
-    weights = {
-        'zscore': 0.25,
-        'volatility': 0.2,
-        'surge': 0.35,  # Surge is most indicative of pump/dump
-        'pattern': 0.2,
+
+def _copy_result(result: AnomalyResult) -> AnomalyResult:
+    """Copy of a cached AnomalyResult that shares no mutable state with it."""
+    details = {
+        key: _copy_detail(value)
+        for key, value in result.details.items()
     }
+    return replace(result, anomaly_types=list(result.anomaly_types), details=details)
+
+
+def _copy_detail(value):
+    """Copy one details entry: detector results, dicts, or plain scalars."""
+    if isinstance(value, DetectorResult):
+        return replace(value, anomaly_types=list(value.anomaly_types))
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+@functools.lru_cache(maxsize=_RESULT_CACHE_SIZE)
+def _detect_anomalies_cached(
+    feats_bytes: bytes,
+    window_bytes: bytes,
+    check_pump_dump: bool,
+    check_coordination: bool,
+    news_flag: bool,
+    sensitivity: float,
+    threshold_key: Optional[Tuple],
+    include_pattern: bool
+) -> AnomalyResult:
+    """Memoized detect_anomalies, keyed on the raw float64 bytes of its packed inputs."""
+    return _score_inputs(
+        np.frombuffer(feats_bytes),
+        np.frombuffer(window_bytes).reshape(-1, len(_PATTERN_COLS)),
+        check_pump_dump, check_coordination, news_flag, sensitivity,
+        dict(threshold_key) if threshold_key is not None else None, include_pattern
+    )
 
-    combined_score = (
-        zscore_result['anomaly_score'] * weights['zscore'] +
-        volatility_result['anomaly_score'] * weights['volatility'] +
-        surge_result['anomaly_score'] * weights['surge'] +
-        pattern_result['anomaly_score'] * weights['pattern']
+
+def _score_inputs(
+    feats: np.ndarray,
+    pattern_window: np.ndarray,
+    check_pump_dump: bool,
+    check_coordination: bool,
+    news_flag: bool,
+    sensitivity: float,
+    thresholds: Optional[dict],
+    include_pattern: bool
+) -> AnomalyResult:
+    """Score one packed latest-row vector and pattern window."""
+    def pattern_for(_: int) -> PatternAnalysis:
+        return _pattern_analysis(
+            pattern_window, _PATTERN_LOOKBACK, thresholds,
+            check_pump_dump=check_pump_dump,
+            check_coordination=check_coordination,
+        )
+
+    return _combine_results(
+        feats[np.newaxis], pattern_for, news_flag, sensitivity, thresholds, include_pattern
+    )[0]
+
+
+def detect_anomalies_batch(
+    dfs: Sequence[pd.DataFrame],
+    news_flag: Union[bool, Sequence[bool]] = False,
+    sensitivity: float = 1.0,
+    thresholds: dict = None,
+    include_pattern: bool = True,
+    dtype: np.dtype = np.float64
+) -> List[AnomalyResult]:
+    """
+    Run anomaly detection over many tickers at once.
+
+    The latest rows of all frames are stacked into one (N, F) matrix and
+    scored in a single vectorized pass; only the pattern detector, which
+    needs each ticker's own window, runs per frame. Results are identical
+    to calling detect_anomalies on each frame.
+
+    Args:
+        dfs: DataFrames (pandas or Polars) with all engineered features, one per ticker
+        news_flag: News flag for all tickers, or one flag per ticker
+        sensitivity: Sensitivity multiplier (>1 = more sensitive)
+        thresholds: Optional threshold dict (defaults to ANOMALY_CONFIG)
+        include_pattern: If False, skip the pattern detector for tickers the
+            other detectors already flag (see detect_anomalies)
+        dtype: Float type of the stacked latest-row matrix. np.float32 halves
+            its memory traffic for large universes; thresholds stay float64,
+            so only values within float32 rounding of a threshold can flip.
+
+    Returns:
+        List of AnomalyResult, in the same order as dfs
+    """
+    if len(dfs) == 0:
+        return []
+
+    feats = np.vstack([_latest_vector(df) for df in dfs]).astype(dtype, copy=False)
+    return _combine_results(
+        feats,
+        lambda i: detect_pattern_anomalies(dfs[i], thresholds=thresholds),
+        news_flag, sensitivity, thresholds, include_pattern,
     )
 
+
+def _combine_results(
+    feats: np.ndarray,
+    pattern_for: Callable[[int], PatternAnalysis],
+    news_flag: Union[bool, Sequence[bool]],
+    sensitivity: float,
+    thresholds: dict,
+    include_pattern: bool = True
+) -> List[AnomalyResult]:
+    """
+    Score an (N, F) latest-row matrix and blend it with per-ticker pattern results.
+
+    ``pattern_for(i)`` runs the pattern detector for ticker i. With
+    include_pattern=False it is skipped for tickers whose latest-row score
+    alone already guarantees is_anomaly.
+    """
+    n = len(feats)
+
+    # Score every ticker's latest row in one pass for the z-score,
+    # volatility and surge detectors
+    scores, flags = _score_latest(feats, _threshold_vector(thresholds))
+    news_flags = np.broadcast_to(np.asarray(news_flag, dtype=bool), (n,))
+
+    if include_pattern:
+        pattern_results = [pattern_for(i) for i in range(n)]
+    else:
+        # The pattern score only adds to the combined score, so the score
+        # without it is a lower bound. Above 0.4 the ticker is an anomaly
+        # regardless; with news the 40% cut means it must clear 0.4 / 0.6.
+        partial_scores = np.minimum((scores @ _COMPONENT_WEIGHTS[:3]) * sensitivity, 1.0)
+        decided = partial_scores > np.where(news_flags, 0.4 / 0.6, 0.4)
+        pattern_results = [
+            _skipped_pattern_result() if decided[i] else pattern_for(i)
+            for i in range(n)
+        ]
+    pattern_scores = np.array([p.anomaly_score for p in pattern_results], dtype=np.float64)
+
+    # Calculate combined score (weighted average)
+    component_scores = np.column_stack([scores, pattern_scores])
+    combined_scores = component_scores @ _COMPONENT_WEIGHTS
+
     # Apply sensitivity multiplier
-    combined_score = min(combined_score * sensitivity, 1.0)
+    combined_scores = np.minimum(combined_scores * sensitivity, 1.0)
+
+    # Reduce score by 40% where there's a news explanation
+    news_adjusted = news_flags & (combined_scores > 0.3)
+    combined_scores = np.where(news_adjusted, combined_scores * 0.6, combined_scores)
+
+    return [
+        _assemble_result(
+            feats[i].tolist(), scores[i].tolist(), flags[i].tolist(),
+            pattern_results[i], float(combined_scores[i]),
+            bool(news_flags[i]), bool(news_adjusted[i]), sensitivity,
+        )
+        for i in range(n)
+    ]
+
+
+def _assemble_result(
+    row: List[float],
+    scores: List[float],
+    flags: List[bool],
+    pattern_result: PatternAnalysis,
+    combined_score: float,
+    news_flag: bool,
+    news_adjusted: bool,
+    sensitivity: float
+) -> AnomalyResult:
+    """Build one ticker's AnomalyResult from its scored latest row and pattern analysis."""
+    zscore_score, volatility_score, surge_score = scores
+    zscore_result = _zscore_analysis(row, zscore_score, flags)
+    volatility_result = _volatility_analysis(row, volatility_score, flags)
+    surge_result = _surge_analysis(row, surge_score, flags)
+
+    # Collect all anomaly types
+    all_anomaly_types = (
+        zscore_result.anomaly_types +
+        volatility_result.anomaly_types +
+        surge_result.anomaly_types +
+        pattern_result.anomaly_types
+    )
 
-    # Reduce score if there's a news explanation
-    if news_flag and combined_score > 0.3:
-        combined_score *= 0.6  # Reduce by 40% if news exists
-        all_anomaly_types = [t for t in all_anomaly_types
-                           if t not in ['daily_price_surge', 'weekly_price_pump']]
+    # A news explanation covers ordinary price surges
+    if news_adjusted and not _NEWS_SUPPRESSED.isdisjoint(all_anomaly_types):
+        all_anomaly_types = [t for t in all_anomaly_types if t not in _NEWS_SUPPRESSED]
 
     # Determine if this is an anomaly (threshold: 0.4)
     is_anomaly = combined_score > 0.4 or len(all_anomaly_types) >= 3
@@ -364,10 +807,10 @@ def detect_anomalies(
         'news_adjusted': news_flag,
         'sensitivity': sensitivity,
         'component_scores': {
-            'zscore': zscore_result['anomaly_score'],
-            'volatility': volatility_result['anomaly_score'],
-            'surge': surge_result['anomaly_score'],
-            'pattern': pattern_result['anomaly_score'],
+            'zscore': zscore_result.anomaly_score,
+            'volatility': volatility_result.anomaly_score,
+            'surge': surge_result.anomaly_score,
+            'pattern': pattern_result.anomaly_score,
         }
     }
 
@@ -379,6 +822,30 @@ def detect_anomalies(
     )
 
 
+# Human-readable explanation for each anomaly type. Unknown types fall back to
+# a title-cased version of the type name.
+_ANOMALY_MESSAGES = MappingProxyType({
+    'extreme_return_short_term': 'Unusually large price movement in recent days',
+    'extreme_return_long_term': 'Abnormal price trend over the past month',
+    'price_deviation_from_mean': 'Price significantly deviates from historical average',
+    'volume_spike_short_term': 'Abnormal trading volume spike in recent days',
+    'volume_spike_long_term': 'Trading volume significantly above historical average',
+    'keltner_upper_breakout': 'Price broke above volatility band (potential overbought)',
+    'keltner_lower_breakout': 'Price broke below volatility band (potential oversold)',
+    'extreme_volatility': 'Extremely high price volatility',
+    'daily_price_surge': 'Large single-day price movement',
+    'weekly_price_pump': 'Significant price increase over 7 days (potential pump)',
+    'weekly_price_dump': 'Significant price decrease over 7 days (potential dump)',
+    'extreme_weekly_price_move': 'Extreme price movement exceeding 100% in 7 days',
+    'volume_explosion': 'Trading volume 5x+ above normal (suspicious)',
+    'extreme_volume_explosion': 'Trading volume 10x+ above normal (highly suspicious)',
+    'pump_pattern_detected': 'Combined price pump + volume explosion detected',
+    'pump_and_dump_pattern': 'Classic pump-and-dump pattern detected',
+    'coordinated_volume_price_activity': 'Coordinated volume/price movements suggest manipulation',
+    'suspicious_positive_streak': 'Unusually consistent positive returns (possible manipulation)',
+})
+
+
 def get_anomaly_explanation(result: AnomalyResult) -> str:
     """
     Generate human-readable explanation of anomaly detection.
@@ -392,43 +859,18 @@ def get_anomaly_explanation(result: AnomalyResult) -> str:
     if not result.is_anomaly:
         return "No significant anomalies detected. Market behavior appears within normal ranges."
 
-    explanations = []
-
-    # Map anomaly types to explanations
-    anomaly_messages = {
-        'extreme_return_short_term': 'Unusually large price movement in recent days',
-        'extreme_return_long_term': 'Abnormal price trend over the past month',
-        'price_deviation_from_mean': 'Price significantly deviates from historical average',
-        'volume_spike_short_term': 'Abnormal trading volume spike in recent days',
-        'volume_spike_long_term': 'Trading volume significantly above historical average',
-        'keltner_upper_breakout': 'Price broke above volatility band (potential overbought)',
-        'keltner_lower_breakout': 'Price broke below volatility band (potential oversold)',
-        'extreme_volatility': 'Extremely high price volatility',
-        'daily_price_surge': 'Large single-day price movement',
-        'weekly_price_pump': 'Significant price increase over 7 days (potential pump)',
-        'weekly_price_dump': 'Significant price decrease over 7 days (potential dump)',
-        'extreme_weekly_price_move': 'Extreme price movement exceeding 100% in 7 days',
-        'volume_explosion': 'Trading volume 5x+ above normal (suspicious)',
-        'extreme_volume_explosion': 'Trading volume 10x+ above normal (highly suspicious)',
-        'pump_pattern_detected': 'Combined price pump + volume explosion detected',
-        'pump_and_dump_pattern': 'Classic pump-and-dump pattern detected',
-        'coordinated_volume_price_activity': 'Coordinated volume/price movements suggest manipulation',
-        'suspicious_positive_streak': 'Unusually consistent positive returns (possible manipulation)',
-    }
-
-    for anomaly_type in result.anomaly_types:
-        if anomaly_type in anomaly_messages:
-            explanations.append(f"  - {anomaly_messages[anomaly_type]}")
-        else:
-            explanations.append(f"  - {anomaly_type.replace('_', ' ').title()}")
+    explanations = [
+        f"  - {_ANOMALY_MESSAGES.get(t) or t.replace('_', ' ').title()}"
+        for t in result.anomaly_types
+    ]
 
     # Add quantitative details
     details = result.details
-    surge = details.get('surge_analysis', {})
-    if surge.get('price_change_7d', 0) != 0:
-        explanations.append(f"\n  7-day price change: {surge['price_change_7d']:.1f}%")
-    if surge.get('volume_surge_factor', 1) > 2:
-        explanations.append(f"  Volume surge factor: {surge['volume_surge_factor']:.1f}x normal")
+    surge = details.get('surge_analysis')
+    if surge is not None and surge.price_change_7d != 0:
+        explanations.append(f"\n  7-day price change: {surge.price_change_7d:.1f}%")
+    if surge is not None and surge.volume_surge_factor > 2:
+        explanations.append(f"  Volume surge factor: {surge.volume_surge_factor:.1f}x normal")
 
     header = f"ANOMALY DETECTED (Score: {result.anomaly_score:.2f})\n"
     body = "\n".join(explanations)
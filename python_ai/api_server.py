@@ -14,10 +14,13 @@ Run with: uvicorn api_server:app --host 0.0.0.0 --port 8000
 import os
 import sys
 import secrets
-from typing import Optional, Dict, Any, List, Literal
+from typing import Optional, Dict, Any, List, Literal, Set
 from datetime import datetime
 import logging
 import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,6 +34,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
+from data_ingestion import DataAPIError
+
 AI_API_SECRET = os.environ.get("AI_API_SECRET")
 
 # In production we MUST NOT fail open. If the secret is unset we refuse to start
@@ -72,22 +77,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.middleware("http")
-async def verify_api_key(request: Request, call_next):
-    # Always allow CORS preflight through so the browser is not blocked by a 401
-    # before CORS headers are applied (PY-L1).
-    if request.method == "OPTIONS":
-        return await call_next(request)
-    # Health/root are always reachable so the platform health check works.
-    if request.url.path in ("/", "/health"):
-        return await call_next(request)
-
-    provided = request.headers.get("X-API-Key")
-    if AI_API_SECRET:
+# Health/root are always reachable so the platform health check works.
+_OPEN_PATHS = frozenset({"/", "/health"})
+
+# The secret is fixed at import, so pick the middleware once instead of
+# re-checking it on every request. CORS preflight (OPTIONS) always passes
+# through so the browser is not blocked by a 401 before CORS headers are
+# applied (PY-L1).
+if AI_API_SECRET:
+    @app.middleware("http")
+    async def verify_api_key(request: Request, call_next):
+        if request.method == "OPTIONS" or request.url.path in _OPEN_PATHS:
+            return await call_next(request)
         # Constant-time comparison to avoid leaking the secret via timing.
-        if not secrets.compare_digest(provided or "", AI_API_SECRET):
+        if not secrets.compare_digest(request.headers.get("X-API-Key") or "", AI_API_SECRET):
             return JSONResponse(status_code=401, content={"detail": "Invalid or missing API key"})
-    else:
+        return await call_next(request)
+else:
+    @app.middleware("http")
+    async def verify_api_key(request: Request, call_next):
+        if request.method == "OPTIONS" or request.url.path in _OPEN_PATHS:
+            return await call_next(request)
         # No secret configured: fail closed on every non-health route rather
         # than leaving the service open (it only reaches here in non-production
         # because production refuses to start without a secret).
@@ -95,11 +105,170 @@ async def verify_api_key(request: Request, call_next):
             status_code=403,
             content={"detail": "Service is not configured with an API key; requests are refused."},
         )
-    return await call_next(request)
 
 # Pipeline will be initialized lazily
 pipeline = None
 
+# Dedicated pool for the blocking pipeline.analyze call (data fetch + scoring),
+# so /analyze traffic neither blocks the event loop nor starves the default
+# executor used by the batch endpoints. Size with ANALYZE_WORKERS.
+ANALYZE_WORKERS = int(os.environ.get("ANALYZE_WORKERS", os.cpu_count() or 1))
+analysis_executor = ThreadPoolExecutor(max_workers=ANALYZE_WORKERS, thread_name_prefix="analyze")
+
+# Adaptive micro-batching of /analyze when ML models are loaded: concurrent
+# requests arriving within ANALYZE_BATCH_MAX_LATENCY_MS of each other (up to
+# ANALYZE_BATCH_MAX_SIZE) share a single RF/LSTM predict call.
+ANALYZE_BATCH_MAX_SIZE = int(os.environ.get("ANALYZE_BATCH_MAX_SIZE", 16))
+ANALYZE_BATCH_MAX_LATENCY_MS = float(os.environ.get("ANALYZE_BATCH_MAX_LATENCY_MS", 20))
+
+
+class AnalyzeBatcher:
+    """Collects concurrent analyze calls and runs the model step once per batch.
+
+    Data loading and feature engineering still run per ticker (in parallel on
+    the analysis pool); only the model step (predict_models and calibrate_batch)
+    is shared. Each caller awaits a future that resolves to its own
+    RiskAssessment, or raises its own error.
+
+    Everything runs in this process (event loop plus analysis thread pool),
+    so queued requests and the prepared feature arrays are handed over by
+    reference; nothing is pickled or copied between the request and the
+    model call. Scaling out is done with more worker processes, each with its
+    own batcher, rather than a separate inference process.
+    """
+
+    def __init__(self, max_size: int, max_latency_ms: float):
+        self.max_size = max(1, max_size)
+        self.max_latency = max_latency_ms / 1000
+        self.queue: Optional[asyncio.Queue] = None
+        self.collector: Optional[asyncio.Task] = None
+        # The event loop only holds weak references to tasks, so running
+        # dispatches are kept here until they finish
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def submit(self, p, kwargs: Dict[str, Any]):
+        """Queue one analyze() call on pipeline ``p`` and wait for its result."""
+        if self.collector is None or self.collector.done():
+            self.queue = asyncio.Queue()
+            self.collector = asyncio.create_task(self._collect())
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((p, kwargs, future))
+        return await future
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_latency
+            while len(batch) < self.max_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch without waiting so the next batch can start filling
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def close(self):
+        """Stop collecting and let in-flight dispatches resolve their callers."""
+        if self.collector is not None:
+            self.collector.cancel()
+            await asyncio.gather(self.collector, return_exceptions=True)
+            self.collector = None
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    @staticmethod
+    async def _dispatch(batch):
+        from pipeline import PreparedAnalysis
+
+        loop = asyncio.get_running_loop()
+        p = batch[0][0]
+
+        def resolve(future, result):
+            if future.done():  # caller went away
+                return
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+        prepared = await asyncio.gather(
+            *(loop.run_in_executor(analysis_executor, functools.partial(p.prepare_analysis, **kwargs))
+              for _, kwargs, _ in batch),
+            return_exceptions=True,
+        )
+        ready = [i for i, r in enumerate(prepared) if isinstance(r, PreparedAnalysis)]
+        for i, r in enumerate(prepared):
+            if i not in ready:
+                resolve(batch[i][2], r)
+        if not ready:
+            return
+
+        def predict_and_calibrate(items):
+            predictions = p.predict_models(items)
+            return predictions, p.calibrate_batch(items, predictions)
+
+        try:
+            predictions, calibrations = await loop.run_in_executor(
+                analysis_executor, predict_and_calibrate, [prepared[i] for i in ready]
+            )
+        except Exception as e:
+            for i in ready:
+                resolve(batch[i][2], e)
+            return
+
+        finished = await asyncio.gather(
+            *(loop.run_in_executor(
+                analysis_executor,
+                functools.partial(p.finish_analysis, prepared[i], *prediction, calibration=calibration),
+              )
+              for i, prediction, calibration in zip(ready, predictions, calibrations)),
+            return_exceptions=True,
+        )
+        for i, result in zip(ready, finished):
+            resolve(batch[i][2], result)
+
+
+analyze_batcher = AnalyzeBatcher(ANALYZE_BATCH_MAX_SIZE, ANALYZE_BATCH_MAX_LATENCY_MS)
+
+# Short-TTL cache of /analyze responses. Scan traffic is dominated by a hot set
+# of tickers, and a hit skips data fetch, feature engineering and scoring
+# entirely. Only touched from the event loop, so no lock is needed. Set
+# ANALYSIS_CACHE_TTL=0 or ANALYSIS_CACHE_MAX_SIZE=0 to disable.
+_ANALYSIS_CACHE: Dict[tuple, tuple] = {}
+try:
+    ANALYSIS_CACHE_TTL = float(os.environ.get("ANALYSIS_CACHE_TTL", "300"))
+    ANALYSIS_CACHE_MAX_SIZE = int(os.environ.get("ANALYSIS_CACHE_MAX_SIZE", "4096"))
+except (TypeError, ValueError):
+    ANALYSIS_CACHE_TTL = 300.0
+    ANALYSIS_CACHE_MAX_SIZE = 4096
+
+
+def _analysis_cache_get(key: tuple):
+    entry = _ANALYSIS_CACHE.get(key)
+    if entry is None:
+        return None
+    ts, value = entry
+    if (time.time() - ts) > ANALYSIS_CACHE_TTL:
+        _ANALYSIS_CACHE.pop(key, None)
+        return None
+    return value
+
+
+def _analysis_cache_set(key: tuple, value) -> None:
+    if ANALYSIS_CACHE_TTL <= 0 or ANALYSIS_CACHE_MAX_SIZE <= 0:
+        return
+    _ANALYSIS_CACHE.pop(key, None)
+    while len(_ANALYSIS_CACHE) >= ANALYSIS_CACHE_MAX_SIZE:
+        # Dicts keep insertion order: drop the oldest entry
+        _ANALYSIS_CACHE.pop(next(iter(_ANALYSIS_CACHE)))
+    _ANALYSIS_CACHE[key] = (time.time(), value)
+
 # Startup event to log when app is ready
 @app.on_event("startup")
 async def startup_event():
@@ -111,7 +280,8 @@ async def startup_event():
         logger.info(f"Memory usage at startup: {mem:.1f} MB")
     except Exception:
         pass
-    logger.info("API ready to receive requests (models load on first analyze request)")
+    logger.info("API ready to receive requests (models load in the background)")
+    start_pipeline_load()
 
     # Start background keep-alive logging
     async def keep_alive_log():
@@ -127,6 +297,8 @@ async def startup_event():
 async def shutdown_event():
     logger.warning("=== ScamDunk AI API Shutting Down ===")
     logger.warning("Received shutdown signal")
+    await analyze_batcher.close()
+    analysis_executor.shutdown(wait=False, cancel_futures=True)
 
 pipeline_lock = asyncio.Lock()
 
@@ -137,12 +309,19 @@ class AnalysisRequest(BaseModel):
     Matches the TS↔Python contract:
     { ticker, asset_type, use_live_data, days, sec_flagged, news_flag }
     """
-    ticker: str = Field(..., max_length=10, description="Stock ticker or crypto symbol")
-    asset_type: Literal["stock", "crypto"] = Field(default="stock", description="Asset type: 'stock' or 'crypto'")
-    days: int = Field(default=90, ge=1, le=365, description="Days of historical data to analyze (1-365)")
-    use_live_data: bool = Field(default=True, description="Use live API data (real market data from yfinance)")
-    sec_flagged: Optional[bool] = Field(default=None, description="SEC flag result from upstream regulatory database check. Overrides internal SEC list when provided.")
-    news_flag: bool = Field(default=False, description="Whether the upstream layer found a legitimate news catalyst for recent price/volume activity (reduces false positives).")
+    # Stock ticker or crypto symbol
+    ticker: str = Field(..., max_length=10)
+    asset_type: Literal["stock", "crypto"] = "stock"
+    # Days of historical data to analyze
+    days: int = Field(default=90, ge=1, le=365)
+    # Use live market data (yfinance) rather than synthetic data
+    use_live_data: bool = True
+    # SEC flag from the upstream regulatory database check; overrides the
+    # internal SEC list when provided
+    sec_flagged: Optional[bool] = None
+    # Whether the upstream layer found a legitimate news catalyst for recent
+    # price/volume activity (reduces false positives)
+    news_flag: bool = False
 
 
 def _severity_from_weight(weight: int) -> str:
@@ -252,21 +431,32 @@ async def get_pipeline():
         except Exception as e:
             global pipeline_init_error
             pipeline_init_error = f"{type(e).__name__}: {e}"
-            logger.error(f"Failed to initialize pipeline: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Failed to initialize pipeline: {e}")
             return None
 
 
-@app.on_event("startup")
-async def startup_load_pipeline():
-    """Eagerly load models at startup instead of waiting for first request"""
-    logger.info("Startup: eagerly loading AI pipeline...")
-    result = await get_pipeline()
-    if result is not None:
-        logger.info("Startup: pipeline loaded successfully")
-    else:
-        logger.error(f"Startup: pipeline failed to load - {pipeline_init_error}")
+# Reference to the background load so the task is not garbage collected
+pipeline_load_task: Optional[asyncio.Task] = None
+
+
+def start_pipeline_load():
+    """Start loading models in the background instead of waiting for first request.
+
+    Called from the startup hook, which returns immediately so the server
+    accepts connections (and /health reports "initializing") while models
+    load; /analyze requests that arrive meanwhile wait on the pipeline lock.
+    """
+    global pipeline_load_task
+
+    async def load():
+        logger.info("Startup: loading AI pipeline in the background...")
+        result = await get_pipeline()
+        if result is not None:
+            logger.info("Startup: pipeline loaded successfully")
+        else:
+            logger.error(f"Startup: pipeline failed to load - {pipeline_init_error}")
+
+    pipeline_load_task = asyncio.create_task(load())
 
 
 # Root endpoint - always works
@@ -319,6 +509,18 @@ async def health_check():
 async def analyze_asset(request: AnalysisRequest):
     """Run full hybrid AI analysis on an asset"""
 
+    # Normalise once; the pipeline, cache key and response all use this form
+    ticker = request.ticker.upper()
+
+    # Every request field that can change the result is part of the key
+    cache_key = (
+        ticker, request.asset_type, request.days,
+        request.use_live_data, request.sec_flagged, request.news_flag,
+    )
+    cached = _analysis_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     # Get or initialize pipeline
     p = await get_pipeline()
 
@@ -329,26 +531,35 @@ async def analyze_asset(request: AnalysisRequest):
         )
 
     try:
-        # Run the full pipeline analysis in a thread pool to avoid blocking the event loop
-        loop = asyncio.get_running_loop()
-        assessment = await loop.run_in_executor(
-            None,
-            lambda: p.analyze(
-                ticker=request.ticker,
-                asset_type=request.asset_type,
-                use_synthetic=not request.use_live_data,
-                is_scam_scenario=False,
-                # Plumb the upstream news flag through so the news-aware
-                # false-positive reduction can actually activate (PY-H7).
-                news_flag=request.news_flag,
-                sec_flagged_override=request.sec_flagged
-            )
+        analyze_kwargs = dict(
+            ticker=ticker,
+            asset_type=request.asset_type,
+            use_synthetic=not request.use_live_data,
+            is_scam_scenario=False,
+            # Plumb the upstream news flag through so the news-aware
+            # false-positive reduction can actually activate (PY-H7).
+            news_flag=request.news_flag,
+            sec_flagged_override=request.sec_flagged
         )
+        if p.rf_available or p.lstm_available:
+            # Share the model call with concurrent requests
+            assessment = await analyze_batcher.submit(p, analyze_kwargs)
+        else:
+            # Rule-based scoring has no shared model call to amortize; run the
+            # full pipeline analysis on the analysis pool to avoid blocking the event loop
+            loop = asyncio.get_running_loop()
+            assessment = await loop.run_in_executor(
+                analysis_executor, functools.partial(p.analyze, **analyze_kwargs)
+            )
+
+        # Response models are filled from trusted pipeline output, so they are
+        # built with model_construct (no field validation); FastAPI still
+        # validates and serializes the final response against response_model.
 
         # Use pipeline-computed signals directly (no more fragile string matching)
         signals = []
         for sig in assessment.signals:
-            signals.append(SignalDetail(
+            signals.append(SignalDetail.model_construct(
                 code=sig.code,
                 category=sig.category,
                 description=sig.description,
@@ -358,30 +569,29 @@ async def analyze_asset(request: AnalysisRequest):
 
         total_score = assessment.signal_total_score
 
-        # Build feature summary
-        features = {}
-        if assessment.detailed_report.get('feature_highlights'):
-            features = assessment.detailed_report['feature_highlights']
+        # Pull the report sections once; `or {}` only allocates on a miss
+        report = assessment.detailed_report
+        features = report.get('feature_highlights') or {}
+        data_summary = report.get('data_summary') or {}
+        contextual_flags = report.get('contextual_flags') or {}
+        market_cap = data_summary.get('market_cap')
 
         # Get explanations from key indicators and signal descriptions
         explanations = [s.description for s in assessment.signals]
         if not explanations and assessment.explanation:
-            for line in assessment.explanation.split('\n'):
-                line = line.strip()
-                if line.startswith('-') or line.startswith('>'):
-                    explanations.append(line.lstrip('->').strip())
-                elif line and not line.startswith('Risk') and not line.startswith('Key'):
-                    explanations.append(line)
+            lines = (line.strip() for line in assessment.explanation.splitlines())
+            explanations = [
+                line.lstrip('->').strip() if line.startswith(('-', '>')) else line
+                for line in lines
+                if line and not line.startswith(('Risk', 'Key'))
+            ]
 
         # Extract stock info from detailed report
-        data_summary = assessment.detailed_report.get('data_summary', {})
-        contextual_flags = assessment.detailed_report.get('contextual_flags', {})
-
-        stock_info = StockInfo(
+        stock_info = StockInfo.model_construct(
             company_name=data_summary.get('company_name') or data_summary.get('short_name'),
             exchange=data_summary.get('exchange'),
             last_price=data_summary.get('current_price') or data_summary.get('last_price'),
-            market_cap=data_summary.get('market_cap'),
+            market_cap=market_cap,
             avg_volume=data_summary.get('avg_daily_volume') or data_summary.get('avg_volume')
         )
 
@@ -389,7 +599,7 @@ async def analyze_asset(request: AnalysisRequest):
         news_ver = None
         if assessment.news_verification:
             nv = assessment.news_verification
-            news_ver = NewsVerificationResult(
+            news_ver = NewsVerificationResult.model_construct(
                 has_legitimate_catalyst=nv.get('has_legitimate_catalyst', False),
                 has_sec_filings=nv.get('has_sec_filings', False),
                 has_promotional_signals=nv.get('has_promotional_signals', False),
@@ -398,52 +608,48 @@ async def analyze_asset(request: AnalysisRequest):
                 recommended_level=nv.get('recommended_level', 'HIGH'),
             )
 
-        return AnalysisResponse(
-            ticker=request.ticker.upper(),
+        # Without validation nothing coerces NumPy scalars, so cast explicitly
+        response = AnalysisResponse.model_construct(
+            ticker=ticker,
             asset_type=request.asset_type,
             risk_level=assessment.risk_level,
-            risk_probability=assessment.combined_probability,
-            risk_score=total_score,
-            rf_probability=assessment.rf_probability,
-            lstm_probability=assessment.lstm_probability,
-            anomaly_score=assessment.anomaly_score,
+            risk_probability=float(assessment.combined_probability),
+            risk_score=int(total_score),
+            rf_probability=None if assessment.rf_probability is None else float(assessment.rf_probability),
+            lstm_probability=None if assessment.lstm_probability is None else float(assessment.lstm_probability),
+            anomaly_score=float(assessment.anomaly_score),
             signals=signals,
             features=features,
             explanations=explanations if explanations else assessment.key_indicators,
-            sec_flagged=assessment.sec_flagged,
-            is_otc=contextual_flags.get('is_otc', False),
-            is_micro_cap=(
-                data_summary.get('market_cap') is not None
-                and data_summary['market_cap'] < 50_000_000
-            ),
+            sec_flagged=bool(assessment.sec_flagged),
+            is_otc=bool(contextual_flags.get('is_otc', False)),
+            is_micro_cap=market_cap is not None and market_cap < 50_000_000,
             # Honour the pipeline's data-availability verdict (PY-H8) instead of
             # hardcoding True. Thin history / missing fundamentals -> False.
-            data_available=assessment.data_available,
+            data_available=bool(assessment.data_available),
             analysis_timestamp=assessment.timestamp,
             stock_info=stock_info,
             news_verification=news_ver
         )
+        _analysis_cache_set(cache_key, response)
+        return response
 
-    except Exception as e:
-        # Check if this is a DataAPIError (service unavailable)
-        from data_ingestion import DataAPIError
-        if isinstance(e, DataAPIError):
-            logger.error(f"DATA API UNAVAILABLE for {request.ticker}: {e.api_name} - {e.original_error}")
-            raise HTTPException(
-                status_code=503,
-                detail={
-                    "error": "service_unavailable",
-                    "message": "The scanning system is currently offline. Please try again later.",
-                    "api_name": e.api_name,
-                    "ticker": e.ticker,
-                    "asset_type": e.asset_type,
-                    "original_error": e.original_error
-                }
-            )
-
-        logger.error(f"Analysis failed for {request.ticker}: {e}")
-        import traceback
-        traceback.print_exc()
+    except DataAPIError as e:
+        # Data provider unavailable: report as a service outage, not a bug
+        logger.error(f"DATA API UNAVAILABLE for {request.ticker}: {e.api_name} - {e.original_error}")
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "service_unavailable",
+                "message": "The scanning system is currently offline. Please try again later.",
+                "api_name": e.api_name,
+                "ticker": e.ticker,
+                "asset_type": e.asset_type,
+                "original_error": e.original_error
+            }
+        )
+    except Exception:
+        logger.exception("Analysis failed for %s", request.ticker)
         raise HTTPException(status_code=500, detail="Internal analysis error")
 
 
@@ -457,9 +663,10 @@ async def check_sec_flagged(ticker: str):
     a real regulatory source — it exists for diagnostics/fallback only.
     """
     from config import SEC_FLAGGED_TICKERS
-    flagged = ticker.upper() in SEC_FLAGGED_TICKERS
+    ticker = ticker.upper()
+    flagged = ticker in SEC_FLAGGED_TICKERS
     return {
-        "ticker": ticker.upper(),
+        "ticker": ticker,
         "sec_flagged": flagged,
         "authoritative": False,
         "source": "local_demo_list_fallback",
@@ -480,7 +687,7 @@ async def get_model_status():
     if p is None:
         return {
             "status": "not_initialized",
-            "message": "Models will be loaded on first /analyze request",
+            "message": "Models are loading (or load on the first /analyze request)",
             "ml_models_enabled": ml_models_enabled(),
             "rf_model": None,
             "lstm_model": None
@@ -602,4 +809,14 @@ async def domain_check(request: DomainCheckRequest):
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Multiple worker processes need the app as an import string. Each worker
+    # loads its own pipeline after the fork. loop/http "auto" pick uvloop and
+    # httptools when installed (uvicorn[standard]) and fall back to asyncio/h11.
+    uvicorn.run(
+        "api_server:app",
+        host="0.0.0.0",
+        port=port,
+        workers=int(os.environ.get("WORKERS", os.cpu_count() or 1)),
+        loop="auto",
+        http="auto",
+    )
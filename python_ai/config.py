@@ -1,18 +1,72 @@
 """
 Configuration settings for the Scam Detection System.
 All thresholds and parameters are easily adjustable here.
+
+This is the only configuration module; every other module imports its
+constants from here so all callers share one set of thresholds.
 """
 
+from __future__ import annotations
+
+import functools
+import os
+import sys
+from dataclasses import dataclass
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+__all__ = [
+    'CONFIG_VERSION',
+    'RISK_THRESHOLDS',
+    'ANOMALY_CONFIG',
+    'OTC_THRESHOLDS',
+    'MAJOR_EXCHANGE_THRESHOLDS',
+    'WATCHLIST_THRESHOLDS',
+    'ThresholdTier',
+    'threshold_tier',
+    'tier_thresholds',
+    'get_thresholds',
+    'FEATURE_CONFIG',
+    'RF_FEATURE_NAMES',
+    'RF_MODEL_CONFIG',
+    'LSTM_MODEL_CONFIG',
+    'ENSEMBLE_CONFIG',
+    'SEC_FLAGGED_TICKERS',
+    'SEC_LIST_LAST_UPDATE',
+    'MODEL_PATHS',
+    'PREFERRED_LSTM_BACKENDS',
+    'resolve_lstm_path',
+    'MARKET_THRESHOLDS',
+    'OTC_EXCHANGES',
+    'OTC_EXCHANGE_SUBSTRINGS',
+    'is_otc_exchange',
+    'AnomalyConfig',
+    'FeatureConfig',
+    'EnsembleConfig',
+    'MarketThresholds',
+    'ANOMALY_PARAMS',
+    'FEATURE_PARAMS',
+    'ENSEMBLE_PARAMS',
+    'MARKET_LIMITS',
+]
+
+# The config mappings below are read-only (MappingProxyType) so no caller can
+# change a threshold at runtime behind another thread's or a cache's back.
+# Bump CONFIG_VERSION whenever a value changes; caches that depend on the
+# configuration can key on it.
+CONFIG_VERSION = '2024.12.1'
+
 # =============================================================================
 # RISK CALIBRATION THRESHOLDS
 # =============================================================================
 # These thresholds map probability scores to categorical risk levels
 
-RISK_THRESHOLDS = {
+RISK_THRESHOLDS = MappingProxyType({
     'LOW': 0.25,       # Probability < 0.25 = Low Risk (was 0.3)
     'MEDIUM': 0.55,    # 0.25 <= Probability < 0.55 = Medium Risk (was 0.7)
     'HIGH': 1.0,       # Probability >= 0.55 = High Risk (lowered from 0.7)
-}
+})
 # Research justification: Lowering HIGH threshold from 0.70 to 0.55
 # reduces the overly wide MEDIUM range and catches more suspicious stocks
 
@@ -20,7 +74,7 @@ RISK_THRESHOLDS = {
 # ANOMALY DETECTION PARAMETERS
 # =============================================================================
 
-ANOMALY_CONFIG = {
+ANOMALY_CONFIG = MappingProxyType({
     # Z-score thresholds for anomaly detection - lowered for more sensitivity
     'z_score_threshold': 2.5,           # was 3.0 - catches more anomalies
     'volume_z_threshold': 2.5,          # Volume Z-score threshold
@@ -42,10 +96,10 @@ ANOMALY_CONFIG = {
     # Pump-and-dump pattern thresholds - lowered to catch smaller schemes
     'pump_dump_rise': 0.20,             # was 0.30 - 20% rise before peak
     'pump_dump_fall': -0.15,            # was -0.20 - 15% fall after peak
-}
+})
 
 # --- OTC-tiered threshold system ---
-OTC_THRESHOLDS = {
+OTC_THRESHOLDS = MappingProxyType({
     "price_surge_7d_threshold": 0.10,
     "price_surge_3d_threshold": 0.08,
     "volume_surge_moderate": 2.0,
@@ -56,9 +110,9 @@ OTC_THRESHOLDS = {
     "volume_z_threshold": 1.5,
     "price_surge_1d_threshold": 0.08,
     "price_surge_extreme": 0.35,
-}
+})
 
-MAJOR_EXCHANGE_THRESHOLDS = {
+MAJOR_EXCHANGE_THRESHOLDS = MappingProxyType({
     "price_surge_7d_threshold": 0.25,
     "price_surge_3d_threshold": 0.15,
     "volume_surge_moderate": 3.0,
@@ -69,9 +123,9 @@ MAJOR_EXCHANGE_THRESHOLDS = {
     "volume_z_threshold": 2.0,
     "price_surge_1d_threshold": 0.10,
     "price_surge_extreme": 0.50,
-}
+})
 
-WATCHLIST_THRESHOLDS = {
+WATCHLIST_THRESHOLDS = MappingProxyType({
     "price_surge_7d_threshold": 0.05,
     "price_surge_3d_threshold": 0.04,
     "volume_surge_moderate": 1.5,
@@ -82,25 +136,53 @@ WATCHLIST_THRESHOLDS = {
     "volume_z_threshold": 1.2,
     "price_surge_1d_threshold": 0.05,
     "price_surge_extreme": 0.25,
-}
+})
 
 
-def get_thresholds(is_otc: bool, on_watchlist: bool = False) -> dict:
-    """Select threshold tier based on stock context."""
+class ThresholdTier(IntEnum):
+    """Threshold tiers, in the order of _THRESHOLD_TIERS."""
+    MAJOR_EXCHANGE = 0
+    OTC = 1
+    WATCHLIST = 2
+
+
+# Each tier merged over ANOMALY_CONFIG once at import, indexed by ThresholdTier.
+_THRESHOLD_TIERS = tuple(
+    MappingProxyType({**ANOMALY_CONFIG, **overrides})
+    for overrides in (MAJOR_EXCHANGE_THRESHOLDS, OTC_THRESHOLDS, WATCHLIST_THRESHOLDS)
+)
+
+
+def threshold_tier(is_otc: bool, on_watchlist: bool = False) -> ThresholdTier:
+    """Select the threshold tier for a stock context; watchlist wins over OTC."""
     if on_watchlist:
-        return {**ANOMALY_CONFIG, **WATCHLIST_THRESHOLDS}
-    if is_otc:
-        return {**ANOMALY_CONFIG, **OTC_THRESHOLDS}
-    return {**ANOMALY_CONFIG, **MAJOR_EXCHANGE_THRESHOLDS}
+        return ThresholdTier.WATCHLIST
+    return ThresholdTier.OTC if is_otc else ThresholdTier.MAJOR_EXCHANGE
+
+
+def tier_thresholds(tier: ThresholdTier) -> Mapping[str, float]:
+    """Return the shared, read-only merged thresholds for a tier."""
+    return _THRESHOLD_TIERS[tier]
+
+
+def get_thresholds(is_otc: bool, on_watchlist: bool = False) -> dict:
+    """Select threshold tier based on stock context, as a mutable copy."""
+    return dict(_THRESHOLD_TIERS[threshold_tier(is_otc, on_watchlist)])
 
 
 # =============================================================================
 # FEATURE ENGINEERING PARAMETERS
 # =============================================================================
 
-FEATURE_CONFIG = {
+FEATURE_CONFIG = MappingProxyType({
     # ATR period
     'atr_period': 14,
+    # ATR smoothing: 'sma' (simple rolling mean, what the anomaly thresholds
+    # were tuned on) or 'wilder' (Wilder's RMA, the textbook ATR)
+    'atr_smoothing': 'sma',
+    # RSI smoothing of average gain/loss: 'sma' (what the overbought
+    # thresholds were tuned on) or 'wilder' (Wilder's RMA, the textbook RSI)
+    'rsi_smoothing': 'sma',
 
     # Keltner Channel settings
     'keltner_period': 20,
@@ -109,7 +191,12 @@ FEATURE_CONFIG = {
     # Moving average periods
     'ma_short': 7,
     'ma_long': 30,
-}
+
+    # Frames with at least this many rows roll their windows on the GPU with
+    # cuDF when it is installed (None keeps everything on the CPU). GPU
+    # rolling sums may differ from pandas in the last bits.
+    'gpu_min_rows': None,
+})
 
 # =============================================================================
 # RANDOM FOREST FEATURE CONTRACT
@@ -154,34 +241,38 @@ RF_FEATURE_NAMES = [
 # MODEL CONFIGURATION
 # =============================================================================
 
-RF_MODEL_CONFIG = {
+RF_MODEL_CONFIG = MappingProxyType({
     'n_estimators': 100,
     'max_depth': 10,
     'min_samples_split': 5,
     'min_samples_leaf': 2,
     'random_state': 42,
-}
+})
 
-LSTM_MODEL_CONFIG = {
+LSTM_MODEL_CONFIG = MappingProxyType({
     'sequence_length': 30,              # Number of time steps
     'lstm_units_1': 64,                 # First LSTM layer units
     'lstm_units_2': 32,                 # Second LSTM layer units
     'dense_units': 16,                  # Dense layer units
     'dropout_rate': 0.2,
     'epochs': 50,
-    'batch_size': 32,
+    'batch_size': 32,                   # Training batch size
     'validation_split': 0.2,
-}
+    # Inference batch sizes (Keras predict), chosen by whether a GPU is
+    # visible; independent of training so they can change without retraining
+    'infer_batch_size_cpu': 64,
+    'infer_batch_size_gpu': 1024,
+})
 
 # =============================================================================
 # MODEL ENSEMBLE WEIGHTS
 # =============================================================================
 
-ENSEMBLE_CONFIG = {
+ENSEMBLE_CONFIG = MappingProxyType({
     'rf_weight': 0.5,                   # Random Forest weight
     'lstm_weight': 0.5,                 # LSTM weight
     'use_max_strategy': False,          # If True, use max instead of weighted avg
-}
+})
 
 # =============================================================================
 # SEC FLAGGED STOCKS (SIMULATED DAILY UPDATE)
@@ -189,7 +280,10 @@ ENSEMBLE_CONFIG = {
 # In production, this would be fetched from SEC API daily
 # For demonstration, this is a static list simulating flagged tickers
 
-SEC_FLAGGED_TICKERS = {
+# Immutable, upper-cased and interned once here, so lookups only need to
+# upper-case the queried ticker and the set is shared read-only across forked
+# workers.
+SEC_FLAGGED_TICKERS = frozenset(sys.intern(t.upper()) for t in (
     'SCAM',      # Example flagged ticker
     'PUMP',      # Example flagged ticker
     'DUMP',      # Example flagged ticker
@@ -198,7 +292,7 @@ SEC_FLAGGED_TICKERS = {
     'HALT',      # Example halted ticker
     'XYZQ',      # Example flagged OTC
     'ABCD',      # Example flagged penny stock
-}
+))
 
 # Last updated timestamp (simulated)
 SEC_LIST_LAST_UPDATE = '2024-12-10'
@@ -207,24 +301,50 @@ SEC_LIST_LAST_UPDATE = '2024-12-10'
 # DATA PATHS
 # =============================================================================
 
-MODEL_PATHS = {
+MODEL_PATHS = MappingProxyType({
     'rf_model': 'models/random_forest_scam_detector.joblib',
+    'rf_onnx': 'models/random_forest_scam_detector.onnx',
     'lstm_model': 'models/lstm_scam_detector.keras',
+    'lstm_tflite': 'models/lstm_scam_detector.tflite',
     'scaler': 'models/feature_scaler.joblib',
-}
+})
+
+# LSTM inference backends, most preferred first. The Keras model is always
+# loaded (it holds the scaler metadata and is the fallback); a backend earlier
+# in this list only takes over inference when its artifact is present.
+PREFERRED_LSTM_BACKENDS = ('tflite', 'keras')
+
+
+def resolve_lstm_path(model_path: str = None) -> tuple[str, str]:
+    """Return (backend, path) of the preferred LSTM artifact present on disk.
+
+    Artifacts for the other backends are looked up next to the Keras model
+    (MODEL_PATHS['lstm_model'] unless model_path is given). Falls back to the
+    Keras model when nothing preferred exists.
+    """
+    keras_path = model_path or MODEL_PATHS['lstm_model']
+    candidates = {
+        'tflite': os.path.splitext(keras_path)[0] + '.tflite',
+        'keras': keras_path,
+    }
+    for backend in PREFERRED_LSTM_BACKENDS:
+        path = candidates[backend]
+        if os.path.exists(path):
+            return backend, path
+    return 'keras', keras_path
 
 # =============================================================================
 # MARKET CAP AND LIQUIDITY THRESHOLDS
 # =============================================================================
 
-MARKET_THRESHOLDS = {
+MARKET_THRESHOLDS = MappingProxyType({
     'micro_cap': 50_000_000,            # < $50M = micro cap (high risk)
     'small_cap': 300_000_000,           # < $300M = small cap
     'mid_cap': 2_000_000_000,           # < $2B = mid cap
 
     'micro_liquidity': 150_000,         # < $150K daily volume = micro liquidity
     'low_liquidity': 500_000,           # < $500K = low liquidity
-}
+})
 
 # =============================================================================
 # OTC EXCHANGES (Higher risk indicators)
@@ -233,7 +353,7 @@ MARKET_THRESHOLDS = {
 # YHD) that real OTC stocks report. The previous set only had the long-form
 # names ('OTC', 'PINK', ...) which Yahoo never returns, so is_otc never fired
 # for real OTC stocks and every OTC threshold tier / probability floor was dead.
-OTC_EXCHANGES = {
+OTC_EXCHANGES = frozenset(sys.intern(e) for e in (
     'OTC', 'OTCBB', 'OTCQX', 'OTCQB', 'PINK', 'GREY', 'GRAY', 'OTC MARKETS',
     # Yahoo / yfinance short exchange codes for OTC venues:
     'PNK',   # Pink Sheets / OTC Pink
@@ -241,7 +361,7 @@ OTC_EXCHANGES = {
     'OQB',   # OTCQB
     'YHD',   # Yahoo OTC / other OTC
     'OOTC',  # Other OTC
-}
+))
 
 # Substrings that, if present in an exchange / fullExchangeName / quoteType
 # string, indicate an OTC / pink-sheet venue. Matched case-insensitively.
@@ -258,12 +378,68 @@ def is_otc_exchange(*values: str) -> bool:
     Matches exact membership in OTC_EXCHANGES OR any OTC substring, so it works
     for both the short Yahoo codes (PNK/OQX/OQB) and the descriptive names.
     """
-    for value in values:
-        if not value:
-            continue
-        upper = str(value).upper().strip()
-        if upper in OTC_EXCHANGES:
-            return True
-        if any(sub in upper for sub in OTC_EXCHANGE_SUBSTRINGS):
-            return True
-    return False
+    return any(_is_otc_value(str(value)) for value in values if value)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_otc_value(value: str) -> bool:
+    """Classify one exchange string; memoized since venues are a small set."""
+    upper = value.upper().strip()
+    return upper in OTC_EXCHANGES or any(sub in upper for sub in OTC_EXCHANGE_SUBSTRINGS)
+
+
+# =============================================================================
+# TYPED VIEWS
+# =============================================================================
+# Frozen, slotted views of the dicts above for scalar reads on the per-request
+# path (attribute loads instead of dict lookups). The dicts stay the source of
+# truth and the public API: threshold tiers are merged with ** and passed
+# around as dicts, and model configs are handed to the model constructors.
+
+@dataclass(slots=True, frozen=True)
+class AnomalyConfig:
+    z_score_threshold: float
+    volume_z_threshold: float
+    short_window: int
+    long_window: int
+    price_surge_1d_threshold: float
+    price_surge_7d_threshold: float
+    price_surge_extreme: float
+    volume_surge_moderate: float
+    volume_surge_extreme: float
+    pump_dump_rise: float
+    pump_dump_fall: float
+
+
+@dataclass(slots=True, frozen=True)
+class FeatureConfig:
+    atr_period: int
+    atr_smoothing: str
+    rsi_smoothing: str
+    keltner_period: int
+    keltner_multiplier: float
+    ma_short: int
+    ma_long: int
+    gpu_min_rows: Optional[int]
+
+
+@dataclass(slots=True, frozen=True)
+class EnsembleConfig:
+    rf_weight: float
+    lstm_weight: float
+    use_max_strategy: bool
+
+
+@dataclass(slots=True, frozen=True)
+class MarketThresholds:
+    micro_cap: float
+    small_cap: float
+    mid_cap: float
+    micro_liquidity: float
+    low_liquidity: float
+
+
+ANOMALY_PARAMS = AnomalyConfig(**ANOMALY_CONFIG)
+FEATURE_PARAMS = FeatureConfig(**FEATURE_CONFIG)
+ENSEMBLE_PARAMS = EnsembleConfig(**ENSEMBLE_CONFIG)
+MARKET_LIMITS = MarketThresholds(**MARKET_THRESHOLDS)
@@ -9,19 +9,185 @@ This module computes technical and contextual features:
 - Regulatory flag feature (SEC flagged list)
 """
 
+import functools
+
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from config import (
     ANOMALY_CONFIG,
-    FEATURE_CONFIG,
-    MARKET_THRESHOLDS,
+    ANOMALY_PARAMS,
+    FEATURE_PARAMS,
+    MARKET_LIMITS,
     OTC_EXCHANGES,
     RF_FEATURE_NAMES,
 )
 
 
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray, fill: float) -> np.ndarray:
+    """
+    numerator / denominator, with `fill` wherever the denominator is zero or
+    the quotient is missing (the pandas replace(0, nan) / fillna(fill) idiom
+    without the intermediate copies).
+    """
+    quotient = np.full(np.shape(numerator), fill, dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        np.divide(numerator, denominator, out=quotient, where=denominator != 0)
+    quotient[np.isnan(quotient)] = fill
+    return quotient
+
+
+def _zscore(values: np.ndarray, mean: np.ndarray, std: np.ndarray) -> np.ndarray:
+    """(values - mean) / std with zero std treated as missing and missing z-scores as 0."""
+    return _safe_divide(values - mean, std, 0)
+
+
+def _with_columns(df: pd.DataFrame, columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Return a copy of df with the given columns appended (or replaced) in one
+    concat, instead of growing the frame one column insert at a time.
+    """
+    new = pd.DataFrame(columns, index=df.index)
+    return pd.concat([df.drop(columns=list(columns), errors='ignore'), new], axis=1)
+
+
+def _frame_arrays(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """NumPy views of every column of df, keyed by column name."""
+    return {column: df[column].to_numpy() for column in df.columns}
+
+
+def _forward_fill(values: np.ndarray) -> np.ndarray:
+    """Carry the last present value over missing ones (leading gaps stay missing)."""
+    missing = np.isnan(values)
+    if not missing.any():
+        return values
+    last_present = np.where(missing, 0, np.arange(len(values)))
+    np.maximum.accumulate(last_present, out=last_present)
+    return values[last_present]
+
+
+def _pct_change(filled: np.ndarray, periods: int) -> np.ndarray:
+    """
+    Series.pct_change(periods) of an already forward-filled array: the
+    first `periods` values are missing and a zero base gives +/-inf.
+    """
+    change = np.full(len(filled), np.nan)
+    if periods < len(filled):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change[periods:] = filled[periods:] / filled[:-periods] - 1
+    return change
+
+
+# Key under which _close_prev caches its result in an arrays dict. It is not
+# a column name, so it never reaches the output frame.
+_CLOSE_PREV_KEY = '_close_prev'
+
+
+def _close_prev(arrays: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Previous bar's close (NaN on the first bar), built once per arrays dict
+    and shared by the True Range and RSI steps.
+    """
+    close_prev = arrays.get(_CLOSE_PREV_KEY)
+    if close_prev is None:
+        close = arrays['Close'].astype(np.float64, copy=False)
+        close_prev = np.empty_like(close)
+        close_prev[:1] = np.nan
+        close_prev[1:] = close[:-1]
+        arrays[_CLOSE_PREV_KEY] = close_prev
+    return close_prev
+
+
+@functools.lru_cache(maxsize=None)
+def _load_cudf():
+    """Import cuDF on first use; None when it is missing or has no usable GPU."""
+    try:
+        import cudf
+    except Exception:  # ImportError, or CUDA runtime/driver errors at import
+        return None
+    return cudf
+
+
+def _rolling_mean_std(block: np.ndarray, windows: Tuple[int, ...]) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Rolling mean and sample std of every column of a 2-D block, per window.
+
+    Large blocks (FEATURE_PARAMS.gpu_min_rows) are rolled with cuDF when it
+    is available; any GPU failure, e.g. running out of device memory, falls
+    back to the pandas path.
+    """
+    min_rows = FEATURE_PARAMS.gpu_min_rows
+    if min_rows is not None and len(block) >= min_rows and _load_cudf() is not None:
+        cudf = _load_cudf()
+        try:
+            # NaNs become nulls so a window holding one is short of
+            # observations, as in pandas
+            gpu_block = cudf.from_pandas(pd.DataFrame(block), nan_as_null=True)
+            results = []
+            for window in windows:
+                roll = gpu_block.rolling(window=window)
+                results.append((
+                    roll.mean().to_pandas().to_numpy(dtype=np.float64, na_value=np.nan),
+                    roll.std().to_pandas().to_numpy(dtype=np.float64, na_value=np.nan),
+                ))
+            return results
+        except Exception as e:
+            print(f"cuDF rolling failed ({e}); falling back to pandas")
+
+    # Short windows stay on pandas rolling too: a two-pass std over a
+    # sliding_window_view is not faster at these lengths, is slower on long
+    # histories (it materialises n * window deviations), and differs from
+    # pandas in the last bits, which would shift every z-score.
+    frame = pd.DataFrame(block)
+    results = []
+    for window in windows:
+        roll = frame.rolling(window=window)
+        results.append((roll.mean().to_numpy(), roll.std().to_numpy()))
+    return results
+
+
+def _rolling_statistics_arrays(
+    arrays: Dict[str, np.ndarray],
+    short_window: int = None,
+    long_window: int = None
+) -> Dict[str, np.ndarray]:
+    """Rolling statistic columns computed from the Return, Volume and Close arrays."""
+    short_window = short_window or ANOMALY_PARAMS.short_window
+    long_window = long_window or ANOMALY_PARAMS.long_window
+
+    # The three sources share both windows, so each window is rolled once
+    # over a stacked (n, 3) block rather than once per source; the per-column
+    # results are identical to rolling each Series on its own.
+    sources = ('Return', 'Volume', 'Close')
+    stacked = np.column_stack([arrays[source] for source in sources])
+    (mean_short, std_short), (mean_long, std_long) = _rolling_mean_std(
+        stacked, (short_window, long_window)
+    )
+
+    columns = {}
+    for i, source in enumerate(sources):
+        values = arrays[source]
+        columns[f'{source}_Mean_Short'] = mean_short[:, i]
+        columns[f'{source}_Std_Short'] = std_short[:, i]
+        columns[f'{source}_Mean_Long'] = mean_long[:, i]
+        columns[f'{source}_Std_Long'] = std_long[:, i]
+
+        if source == 'Close':
+            # Price Z-score (deviation from the long rolling mean)
+            columns['Price_ZScore_Long'] = _zscore(
+                values, columns['Close_Mean_Long'], columns['Close_Std_Long']
+            )
+        else:
+            columns[f'{source}_ZScore_Short'] = _zscore(
+                values, columns[f'{source}_Mean_Short'], columns[f'{source}_Std_Short']
+            )
+            columns[f'{source}_ZScore_Long'] = _zscore(
+                values, columns[f'{source}_Mean_Long'], columns[f'{source}_Std_Long']
+            )
+    return columns
+
+
 def compute_rolling_statistics(
     df: pd.DataFrame,
     short_window: int = None,
@@ -38,58 +204,58 @@ def compute_rolling_statistics(
     Returns:
         DataFrame with additional rolling statistics columns
     """
-    df = df.copy()
-
-    short_window = short_window or ANOMALY_CONFIG['short_window']
-    long_window = long_window or ANOMALY_CONFIG['long_window']
-
-    # Rolling statistics for returns
-    df['Return_Mean_Short'] = df['Return'].rolling(window=short_window).mean()
-    df['Return_Std_Short'] = df['Return'].rolling(window=short_window).std()
-    df['Return_Mean_Long'] = df['Return'].rolling(window=long_window).mean()
-    df['Return_Std_Long'] = df['Return'].rolling(window=long_window).std()
-
-    # Z-scores for returns
-    df['Return_ZScore_Short'] = (
-        (df['Return'] - df['Return_Mean_Short']) / df['Return_Std_Short'].replace(0, np.nan)
-    ).fillna(0)
-
-    df['Return_ZScore_Long'] = (
-        (df['Return'] - df['Return_Mean_Long']) / df['Return_Std_Long'].replace(0, np.nan)
-    ).fillna(0)
-
-    # Rolling statistics for volume
-    df['Volume_Mean_Short'] = df['Volume'].rolling(window=short_window).mean()
-    df['Volume_Std_Short'] = df['Volume'].rolling(window=short_window).std()
-    df['Volume_Mean_Long'] = df['Volume'].rolling(window=long_window).mean()
-    df['Volume_Std_Long'] = df['Volume'].rolling(window=long_window).std()
-
-    # Z-scores for volume
-    df['Volume_ZScore_Short'] = (
-        (df['Volume'] - df['Volume_Mean_Short']) / df['Volume_Std_Short'].replace(0, np.nan)
-    ).fillna(0)
-
-    df['Volume_ZScore_Long'] = (
-        (df['Volume'] - df['Volume_Mean_Long']) / df['Volume_Std_Long'].replace(0, np.nan)
-    ).fillna(0)
-
-    # Rolling price statistics
-    df['Close_Mean_Short'] = df['Close'].rolling(window=short_window).mean()
-    df['Close_Std_Short'] = df['Close'].rolling(window=short_window).std()
-    df['Close_Mean_Long'] = df['Close'].rolling(window=long_window).mean()
-    df['Close_Std_Long'] = df['Close'].rolling(window=long_window).std()
+    # All 21 columns are added in a single concat; per-column inserts into the
+    # growing frame cost more than the rolling passes themselves.
+    return _with_columns(
+        df, _rolling_statistics_arrays(_frame_arrays(df), short_window, long_window)
+    )
 
-    # Price Z-score (deviation from rolling mean)
-    df['Price_ZScore_Long'] = (
-        (df['Close'] - df['Close_Mean_Long']) / df['Close_Std_Long'].replace(0, np.nan)
-    ).fillna(0)
 
-    return df
+def _atr_arrays(
+    arrays: Dict[str, np.ndarray],
+    period: int = None,
+    smoothing: str = None
+) -> Dict[str, np.ndarray]:
+    """True Range, ATR and ATR_Percent computed from the High, Low and Close arrays."""
+    period = period or FEATURE_PARAMS.atr_period
+    smoothing = smoothing or FEATURE_PARAMS.atr_smoothing
+    if smoothing not in ('sma', 'wilder'):
+        raise ValueError(f"Unknown ATR smoothing: {smoothing!r}")
+
+    high = arrays['High'].astype(np.float64, copy=False)
+    low = arrays['Low'].astype(np.float64, copy=False)
+    close = arrays['Close'].astype(np.float64, copy=False)
+    close_prev = _close_prev(arrays)
+
+    # True Range is max of the three components, ignoring missing ones (the
+    # first bar has no previous close), as a NaN-skipping ufunc reduction
+    true_range = np.fmax.reduce([
+        high - low,
+        np.abs(high - close_prev),
+        np.abs(low - close_prev),
+    ])
+
+    # Average True Range (smoothed). Wilder's RMA is a one-pass recurrence
+    # (alpha = 1/period) with the same warm-up as the rolling mean.
+    true_range_series = pd.Series(true_range)
+    if smoothing == 'wilder':
+        smoothed = true_range_series.ewm(alpha=1.0 / period, adjust=False, min_periods=period)
+    else:
+        smoothed = true_range_series.rolling(window=period)
+    atr = smoothed.mean().to_numpy()
+
+    return {
+        'True_Range': true_range,
+        'ATR': atr,
+        # ATR as percentage of price (normalized volatility)
+        'ATR_Percent': (atr / close) * 100,
+    }
 
 
 def compute_atr(
     df: pd.DataFrame,
-    period: int = None
+    period: int = None,
+    smoothing: str = None
 ) -> pd.DataFrame:
     """
     Compute Average True Range (ATR) - measure of volatility.
@@ -97,28 +263,48 @@ def compute_atr(
     Args:
         df: DataFrame with High, Low, Close columns
         period: ATR period (default from config)
+        smoothing: 'sma' for a simple rolling mean of the True Range or
+            'wilder' for Wilder's RMA (default from config)
 
     Returns:
         DataFrame with ATR column
     """
-    df = df.copy()
-    period = period or FEATURE_CONFIG['atr_period']
+    return _with_columns(df, _atr_arrays(_frame_arrays(df), period, smoothing))
 
-    # True Range components
-    high_low = df['High'] - df['Low']
-    high_close_prev = abs(df['High'] - df['Close'].shift(1))
-    low_close_prev = abs(df['Low'] - df['Close'].shift(1))
 
-    # True Range is max of the three
-    df['True_Range'] = pd.concat([high_low, high_close_prev, low_close_prev], axis=1).max(axis=1)
+def _keltner_arrays(
+    arrays: Dict[str, np.ndarray],
+    period: int = None,
+    multiplier: float = None
+) -> Dict[str, np.ndarray]:
+    """Keltner Channel columns computed from the Close and ATR arrays."""
+    period = period or FEATURE_PARAMS.keltner_period
+    multiplier = multiplier or FEATURE_PARAMS.keltner_multiplier
+
+    close = arrays['Close'].astype(np.float64, copy=False)
+    atr = arrays['ATR'].astype(np.float64, copy=False)
 
-    # Average True Range (smoothed)
-    df['ATR'] = df['True_Range'].rolling(window=period).mean()
+    # Middle line: EMA of close
+    middle = pd.Series(close).ewm(span=period, adjust=False).mean().to_numpy()
 
-    # ATR as percentage of price (normalized volatility)
-    df['ATR_Percent'] = (df['ATR'] / df['Close']) * 100
+    # Upper and Lower bands
+    band = multiplier * atr
+    upper = middle + band
+    lower = middle - band
 
-    return df
+    # Position within channel (0-1 scale, can exceed bounds)
+    channel_width = upper - lower
+    position = _safe_divide(close - lower, channel_width, 0.5)
+
+    return {
+        'Keltner_Middle': middle,
+        'Keltner_Upper': upper,
+        'Keltner_Lower': lower,
+        'Keltner_Position': position,
+        # Breakout flags
+        'Keltner_Breakout_Upper': (close > upper).astype(np.uint8),
+        'Keltner_Breakout_Lower': (close < lower).astype(np.uint8),
+    }
 
 
 def compute_keltner_channels(
@@ -137,32 +323,94 @@ def compute_keltner_channels(
     Returns:
         DataFrame with Keltner Channel columns
     """
-    df = df.copy()
-    period = period or FEATURE_CONFIG['keltner_period']
-    multiplier = multiplier or FEATURE_CONFIG['keltner_multiplier']
-
     # Ensure ATR is computed
     if 'ATR' not in df.columns:
         df = compute_atr(df)
 
-    # Middle line: EMA of close
-    df['Keltner_Middle'] = df['Close'].ewm(span=period, adjust=False).mean()
+    return _with_columns(df, _keltner_arrays(_frame_arrays(df), period, multiplier))
 
-    # Upper and Lower bands
-    df['Keltner_Upper'] = df['Keltner_Middle'] + (multiplier * df['ATR'])
-    df['Keltner_Lower'] = df['Keltner_Middle'] - (multiplier * df['ATR'])
 
-    # Position within channel (0-1 scale, can exceed bounds)
-    channel_width = df['Keltner_Upper'] - df['Keltner_Lower']
-    df['Keltner_Position'] = (
-        (df['Close'] - df['Keltner_Lower']) / channel_width.replace(0, np.nan)
-    ).fillna(0.5)
+def _surge_arrays(
+    arrays: Dict[str, np.ndarray],
+    thresholds: dict = None
+) -> Dict[str, np.ndarray]:
+    """Surge metric columns computed from the Close, Volume and rolling volume arrays."""
+    _thresholds = thresholds or ANOMALY_CONFIG
+    short_window = _thresholds['short_window']
+    long_window = _thresholds['long_window']
 
-    # Breakout flags
-    df['Keltner_Breakout_Upper'] = (df['Close'] > df['Keltner_Upper']).astype(int)
-    df['Keltner_Breakout_Lower'] = (df['Close'] < df['Keltner_Lower']).astype(int)
+    # pct_change pads missing closes before differencing; fill once and
+    # difference the same buffer for every horizon
+    close = _forward_fill(arrays['Close'].astype(np.float64, copy=False))
+    volume_values = arrays['Volume']
+    volume = pd.Series(volume_values)
+    columns = {}
 
-    return df
+    # Volume surge factor: recent 7-day vs prior 30-day average
+    surge_factor = _safe_divide(arrays['Volume_Mean_Short'], arrays['Volume_Mean_Long'], 1)
+    columns['Volume_Surge_Factor'] = surge_factor
+
+    # Price surge percentages
+    change_1d = _pct_change(close, 1)
+    change_7d = _pct_change(close, short_window)
+    columns['Price_Change_1d'] = change_1d
+    columns['Price_Change_7d'] = change_7d
+    columns['Price_Change_30d'] = _pct_change(close, long_window)
+
+    # Absolute price surges (magnitude)
+    columns['Price_Surge_1d'] = np.abs(change_1d)
+    columns['Price_Surge_7d'] = np.abs(change_7d)
+    columns['Price_Surge_30d'] = np.abs(columns['Price_Change_30d'])
+
+    # Threshold flags, from two broadcast comparisons instead of one per flag:
+    # the 7-day change strictly beyond the surge threshold either way
+    # (positive = pump, negative = dump), and the volume surge factor at or
+    # above the moderate / extreme explosion levels
+    surge_threshold = _thresholds.get('price_surge_7d_threshold', 0.25)
+    explosion_levels = np.array([
+        _thresholds.get('volume_surge_moderate', 3.0),
+        _thresholds.get('volume_surge_extreme', 5.0),
+    ])
+    flags = np.column_stack([
+        np.column_stack([change_7d, -change_7d]) > surge_threshold,
+        surge_factor[:, np.newaxis] >= explosion_levels,
+    ]).view(np.uint8)
+    columns['Is_Pumping_7d'] = flags[:, 0]
+    columns['Is_Dumping_7d'] = flags[:, 1]
+    columns['Volume_Explosion_Moderate'] = flags[:, 2]
+    columns['Volume_Explosion_Extreme'] = flags[:, 3]
+
+    # Combined pump pattern: price up + volume explosion
+    columns['Pump_Pattern'] = flags[:, 0] & flags[:, 2]
+
+    # 3-day window features (early pump detection)
+    columns['Price_Change_3d'] = _pct_change(close, 3)
+
+    # 3-day volume surge vs 30-day average
+    vol_avg_3d = volume.rolling(window=3, min_periods=1).mean().to_numpy()
+    vol_avg_30d = volume.rolling(window=long_window, min_periods=5).mean().to_numpy()
+    columns['Volume_Surge_3d'] = _safe_divide(vol_avg_3d, vol_avg_30d, 1.0)
+
+    # Acceleration flags compare each day with the previous ones through
+    # lagged slices of one buffer and are written straight into uint8
+    # columns; days without enough history to compare stay 0, as the
+    # missing values of a shift() would.
+    n = len(close)
+
+    # Price acceleration: 3 consecutive days of increasing daily returns.
+    # rising[j] says whether day j + 1's return beat day j's.
+    rising = change_1d[1:] > change_1d[:-1]
+    price_acceleration = np.zeros(n, dtype=np.uint8)
+    price_acceleration[2:] = rising[1:] & rising[:-1] & (change_1d[2:] > 0)
+    columns['Price_Acceleration'] = price_acceleration
+
+    # Volume acceleration: 3+ consecutive days of increasing volume
+    vol_increasing = volume_values[1:] > volume_values[:-1]
+    volume_acceleration = np.zeros(n, dtype=np.uint8)
+    volume_acceleration[3:] = vol_increasing[2:] & vol_increasing[1:-1] & vol_increasing[:-2]
+    columns['Volume_Acceleration'] = volume_acceleration
+
+    return columns
 
 
 def compute_surge_metrics(df: pd.DataFrame, thresholds: dict = None) -> pd.DataFrame:
@@ -176,79 +424,98 @@ def compute_surge_metrics(df: pd.DataFrame, thresholds: dict = None) -> pd.DataF
     Returns:
         DataFrame with surge metric columns
     """
-    df = df.copy()
-
-    _thresholds = thresholds or ANOMALY_CONFIG
-    short_window = _thresholds['short_window']
-    long_window = _thresholds['long_window']
-
     # Ensure Return column exists (needed by compute_rolling_statistics)
     if 'Return' not in df.columns:
-        df['Return'] = df['Close'].pct_change().fillna(0)
+        df = _with_columns(df, {'Return': df['Close'].pct_change().fillna(0).to_numpy()})
 
     # Ensure rolling stats are computed
     if 'Volume_Mean_Long' not in df.columns:
         df = compute_rolling_statistics(df)
 
-    # Volume surge factor: recent 7-day vs prior 30-day average
-    df['Volume_Surge_Factor'] = (
-        df['Volume_Mean_Short'] / df['Volume_Mean_Long'].replace(0, np.nan)
-    ).fillna(1)
-
-    # Price surge percentages
-    df['Price_Change_1d'] = df['Close'].pct_change()
-    df['Price_Change_7d'] = df['Close'].pct_change(periods=short_window)
-    df['Price_Change_30d'] = df['Close'].pct_change(periods=long_window)
-
-    # Absolute price surges (magnitude)
-    df['Price_Surge_1d'] = df['Price_Change_1d'].abs()
-    df['Price_Surge_7d'] = df['Price_Change_7d'].abs()
-    df['Price_Surge_30d'] = df['Price_Change_30d'].abs()
-
-    # Directional surges (positive = pump, negative = dump)
-    df['Is_Pumping_7d'] = (df['Price_Change_7d'] > _thresholds.get('price_surge_7d_threshold', 0.25)).astype(int)
-    df['Is_Dumping_7d'] = (df['Price_Change_7d'] < -_thresholds.get('price_surge_7d_threshold', 0.25)).astype(int)
+    # One concat for all surge columns instead of a frame copy plus a
+    # column insert per metric
+    return _with_columns(df, _surge_arrays(_frame_arrays(df), thresholds))
 
-    # Volume explosion detection
-    df['Volume_Explosion_Moderate'] = (
-        df['Volume_Surge_Factor'] >= _thresholds.get('volume_surge_moderate', 3.0)
-    ).astype(int)
 
-    df['Volume_Explosion_Extreme'] = (
-        df['Volume_Surge_Factor'] >= _thresholds.get('volume_surge_extreme', 5.0)
-    ).astype(int)
-
-    # Combined pump pattern: price up + volume explosion
-    df['Pump_Pattern'] = (
-        (df['Is_Pumping_7d'] == 1) & (df['Volume_Explosion_Moderate'] == 1)
-    ).astype(int)
+def compute_rsi(
+    close: Union[pd.Series, np.ndarray],
+    period: int = 14,
+    smoothing: str = None
+) -> np.ndarray:
+    """
+    Compute the Relative Strength Index of a close series.
 
-    # 3-day window features (early pump detection)
-    df['Price_Change_3d'] = df['Close'].pct_change(periods=3)
+    Args:
+        close: Close prices
+        period: Averaging period for gains and losses
+        smoothing: 'sma' for rolling means of gains/losses or 'wilder' for
+            Wilder's RMA (default from config)
 
-    # 3-day volume surge vs 30-day average
-    vol_avg_3d = df['Volume'].rolling(window=3, min_periods=1).mean()
-    vol_avg_30d = df['Volume'].rolling(window=long_window, min_periods=5).mean()
-    df['Volume_Surge_3d'] = vol_avg_3d / vol_avg_30d.replace(0, np.nan)
-    df['Volume_Surge_3d'] = df['Volume_Surge_3d'].fillna(1.0)
-
-    # Price acceleration: 3 consecutive days of increasing daily returns
-    daily_returns = df['Close'].pct_change()
-    df['Price_Acceleration'] = (
-        (daily_returns > daily_returns.shift(1)) &
-        (daily_returns.shift(1) > daily_returns.shift(2)) &
-        (daily_returns > 0)
-    ).astype(int)
+    Returns:
+        RSI values; 50 where there is no loss to compare against
+    """
+    delta = np.diff(np.asarray(close, dtype=np.float64), prepend=np.nan)
+    return _rsi_from_delta(delta, period, smoothing)
+
+
+def _rsi_from_delta(delta: np.ndarray, period: int, smoothing: str = None) -> np.ndarray:
+    """RSI from bar-to-bar close changes (NaN for the first bar)."""
+    smoothing = smoothing or FEATURE_PARAMS.rsi_smoothing
+    if smoothing not in ('sma', 'wilder'):
+        raise ValueError(f"Unknown RSI smoothing: {smoothing!r}")
+
+    # Gains and losses side by side, so both averages come from one
+    # smoothing call. Missing changes count as neither gain nor loss.
+    moves = np.column_stack([
+        np.where(delta > 0, delta, 0.0),
+        np.where(delta < 0, -delta, 0.0),
+    ])
+
+    if smoothing == 'wilder':
+        # One-pass recurrence; the first bar has no change so it stays out
+        moves[:1] = np.nan
+        averages = pd.DataFrame(moves).ewm(alpha=1.0 / period, adjust=False, min_periods=period).mean()
+    else:
+        averages = pd.DataFrame(moves).rolling(window=period).mean()
+
+    averages = averages.to_numpy()
+    avg_gain = averages[:, 0]
+    avg_loss = averages[:, 1]
+    rsi = 100 - (100 / (1 + avg_gain / np.where(avg_loss == 0, np.nan, avg_loss)))
+    rsi[np.isnan(rsi)] = 50
+    return rsi
+
+
+def _momentum_arrays(arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """ROC, RSI and money flow columns computed from the OHLCV arrays."""
+    close = arrays['Close'].astype(np.float64, copy=False)
+    columns = {}
+
+    # Rate of Change (ROC): the lagged close is a slice of the same buffer
+    # rather than a shifted copy
+    for lag in (7, 14):
+        roc = np.full(len(close), np.nan)
+        lagged = close[:-lag]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            roc[lag:] = ((close[lag:] - lagged) / lagged) * 100
+        columns[f'ROC_{lag}'] = roc
+
+    # Relative Strength Index (RSI), from the previous close already built
+    # for the True Range
+    columns['RSI_14'] = _rsi_from_delta(close - _close_prev(arrays), period=14)
 
-    # Volume acceleration: 3+ consecutive days of increasing volume
-    vol_increasing = df['Volume'] > df['Volume'].shift(1)
-    df['Volume_Acceleration'] = (
-        vol_increasing &
-        vol_increasing.shift(1) &
-        vol_increasing.shift(2)
-    ).astype(int)
+    # Money Flow (volume * direction)
+    typical_price = (arrays['High'] + arrays['Low'] + arrays['Close']) / 3
+    # +1 on an up move, -1 otherwise (flat, or no previous bar); the sign is
+    # taken from one diff rather than a comparison against a shifted copy
+    rising = np.diff(typical_price, prepend=np.nan) > 0
+    direction = rising.astype(int) * 2 - 1
+    money_flow = typical_price * arrays['Volume'] * direction
+    columns['Money_Flow_Direction'] = direction
+    columns['Money_Flow'] = money_flow
+    columns['Money_Flow_14'] = pd.Series(money_flow).rolling(window=14).sum().to_numpy()
 
-    return df
+    return columns
 
 
 def compute_momentum_indicators(df: pd.DataFrame) -> pd.DataFrame:
@@ -261,32 +528,89 @@ def compute_momentum_indicators(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with momentum indicator columns
     """
-    df = df.copy()
+    return _with_columns(df, _momentum_arrays(_frame_arrays(df)))
 
-    # Rate of Change (ROC)
-    df['ROC_7'] = ((df['Close'] - df['Close'].shift(7)) / df['Close'].shift(7)) * 100
-    df['ROC_14'] = ((df['Close'] - df['Close'].shift(14)) / df['Close'].shift(14)) * 100
 
-    # Relative Strength Index (RSI) - simplified
-    delta = df['Close'].diff()
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
-
-    avg_gain = gain.rolling(window=14).mean()
-    avg_loss = loss.rolling(window=14).mean()
+# Latest-row features of the RF vector: (feature name, engineered column,
+# value used when the column is missing).
+# NOTE: feature names are lowercase to match the shared RF_FEATURE_NAMES
+# contract (the engineered DataFrame columns are capitalised; the
+# feature-vector keys are not). compute_signals reads these same keys.
+_LATEST_ROW_FEATURES = (
+    # Price-based features
+    ('return_zscore_short', 'Return_ZScore_Short', 0),
+    ('return_zscore_long', 'Return_ZScore_Long', 0),
+    ('price_zscore_long', 'Price_ZScore_Long', 0),
+    # Volume features
+    ('volume_zscore_short', 'Volume_ZScore_Short', 0),
+    ('volume_zscore_long', 'Volume_ZScore_Long', 0),
+    ('volume_surge_factor', 'Volume_Surge_Factor', 1),
+    # Volatility features
+    ('atr_percent', 'ATR_Percent', 0),
+    ('keltner_position', 'Keltner_Position', 0.5),
+    ('keltner_breakout_upper', 'Keltner_Breakout_Upper', 0),
+    ('keltner_breakout_lower', 'Keltner_Breakout_Lower', 0),
+    # Surge metrics
+    ('price_change_1d', 'Price_Change_1d', 0),
+    ('price_change_7d', 'Price_Change_7d', 0),
+    ('price_change_30d', 'Price_Change_30d', 0),
+    ('is_pumping_7d', 'Is_Pumping_7d', 0),
+    ('is_dumping_7d', 'Is_Dumping_7d', 0),
+    ('volume_explosion_moderate', 'Volume_Explosion_Moderate', 0),
+    ('volume_explosion_extreme', 'Volume_Explosion_Extreme', 0),
+    ('pump_pattern', 'Pump_Pattern', 0),
+    # 3-day early detection features
+    ('price_change_3d', 'Price_Change_3d', 0),
+    ('volume_surge_3d', 'Volume_Surge_3d', 1.0),
+    ('price_acceleration', 'Price_Acceleration', 0),
+    ('volume_acceleration', 'Volume_Acceleration', 0),
+    # Momentum features
+    ('roc_7', 'ROC_7', 0),
+    ('roc_14', 'ROC_14', 0),
+    ('rsi_14', 'RSI_14', 50),
+)
 
-    rs = avg_gain / avg_loss.replace(0, np.nan)
-    df['RSI_14'] = 100 - (100 / (1 + rs))
-    df['RSI_14'] = df['RSI_14'].fillna(50)
+# Features copied from extract_contextual_features, with their defaults
+_CONTEXT_FEATURES = (
+    ('log_market_cap', 0), ('is_micro_cap', 0), ('is_small_cap', 0),
+    ('is_micro_liquidity', 0), ('is_low_liquidity', 0), ('is_otc', 0),
+    ('float_turnover', 0),
+    # CRITICAL: SEC regulatory flag
+    ('sec_flagged', 0),
+    # News and sentiment (placeholders)
+    ('has_news', 0), ('sentiment_score', 0),
+)
 
-    # Money Flow (volume * direction)
-    typical_price = (df['High'] + df['Low'] + df['Close']) / 3
-    money_flow = typical_price * df['Volume']
-    df['Money_Flow_Direction'] = np.where(typical_price > typical_price.shift(1), 1, -1)
-    df['Money_Flow'] = money_flow * df['Money_Flow_Direction']
-    df['Money_Flow_14'] = df['Money_Flow'].rolling(window=14).sum()
+# Window-aggregate features computed by create_feature_vector
+_WINDOW_FEATURES = (
+    'max_return_zscore_7d', 'max_volume_zscore_7d', 'pump_days_7d',
+    'vol_explosion_days_7d', 'keltner_breakout_days_7d',
+    'max_return_zscore_14d', 'max_volume_zscore_14d',
+    'high_volume_persistence_14d', 'reversal_14d',
+    'max_return_zscore_30d', 'max_volume_zscore_30d', 'max_rsi_30d',
+    'overbought_days_30d', 'pump_pattern_days_30d',
+)
 
-    return df
+# RF vector layout: feature names in model order, and each name's position
+FEATURE_ORDER = tuple(RF_FEATURE_NAMES)
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_ORDER)}
+_CONTEXT_INDEX = np.array([FEATURE_INDEX[name] for name, _ in _CONTEXT_FEATURES])
+
+# create_feature_vector must fill exactly the RF_FEATURE_NAMES contract so
+# serving features always line up with the trained model. If the two lists
+# drift apart, fail loudly at import rather than on the first request.
+_populated = (
+    [name for name, _, _ in _LATEST_ROW_FEATURES]
+    + [name for name, _ in _CONTEXT_FEATURES]
+    + list(_WINDOW_FEATURES)
+)
+if sorted(_populated) != sorted(RF_FEATURE_NAMES):
+    raise ValueError(
+        f"create_feature_vector populates {sorted(set(_populated) ^ set(RF_FEATURE_NAMES))} "
+        f"inconsistently with RF_FEATURE_NAMES. "
+        f"feature_engineering.py and config.RF_FEATURE_NAMES have drifted."
+    )
+del _populated
 
 
 def extract_contextual_features(
@@ -312,8 +636,8 @@ def extract_contextual_features(
     # Market cap features
     market_cap = fundamentals.get('market_cap', 0)
     features['market_cap'] = market_cap
-    features['is_micro_cap'] = int(market_cap < MARKET_THRESHOLDS['micro_cap'])
-    features['is_small_cap'] = int(market_cap < MARKET_THRESHOLDS['small_cap'])
+    features['is_micro_cap'] = int(market_cap < MARKET_LIMITS.micro_cap)
+    features['is_small_cap'] = int(market_cap < MARKET_LIMITS.small_cap)
     features['log_market_cap'] = np.log1p(market_cap)
 
     # Float and liquidity
@@ -321,8 +645,8 @@ def extract_contextual_features(
     avg_volume = fundamentals.get('avg_daily_volume', 0)
     features['float_shares'] = float_shares
     features['avg_daily_volume'] = avg_volume
-    features['is_micro_liquidity'] = int(avg_volume < MARKET_THRESHOLDS['micro_liquidity'])
-    features['is_low_liquidity'] = int(avg_volume < MARKET_THRESHOLDS['low_liquidity'])
+    features['is_micro_liquidity'] = int(avg_volume < MARKET_LIMITS.micro_liquidity)
+    features['is_low_liquidity'] = int(avg_volume < MARKET_LIMITS.low_liquidity)
 
     # Float turnover (if volume data available)
     if float_shares > 0:
@@ -351,92 +675,72 @@ def extract_contextual_features(
     return features
 
 
-def create_feature_vector(
-    price_df: pd.DataFrame,
-    fundamentals: Dict,
-    sec_flagged: Dict,
-    news_flag: bool = False,
-    sentiment_score: Optional[float] = None
-) -> Tuple[np.ndarray, List[str]]:
+def extract_contextual_features_batch(
+    fundamentals: Sequence[Dict],
+    sec_flagged: Sequence[Dict],
+    news_flags: Union[bool, Sequence[bool]] = False,
+    sentiment_scores: Optional[Sequence[Optional[float]]] = None
+) -> np.ndarray:
     """
-    Create a complete feature vector for ML model input.
+    Extract the RF contextual features for several tickers as one matrix.
 
     Args:
-        price_df: Preprocessed price DataFrame with all indicators
-        fundamentals: Fundamental data dictionary
-        sec_flagged: SEC flag status dictionary
-        news_flag: News availability flag
-        sentiment_score: Sentiment score
+        fundamentals: Fundamental data dictionary per ticker
+        sec_flagged: SEC flag status dictionary per ticker
+        news_flags: News availability flag, shared or per ticker
+        sentiment_scores: Optional sentiment score per ticker
 
     Returns:
-        Tuple of (feature_array, feature_names)
+        Array of shape (n_tickers, len(_CONTEXT_FEATURES)); row i holds the
+        values extract_contextual_features gives for ticker i
     """
-    # Get latest row of price data
-    latest = price_df.iloc[-1]
-
-    # Extract contextual features
-    ctx_features = extract_contextual_features(
-        fundamentals, sec_flagged, news_flag, sentiment_score
-    )
-
-    # Build feature dictionary
-    features = {}
-
-    # Price-based features
-    features['return_zscore_short'] = latest.get('Return_ZScore_Short', 0)
-    features['return_zscore_long'] = latest.get('Return_ZScore_Long', 0)
-    features['price_zscore_long'] = latest.get('Price_ZScore_Long', 0)
-
-    # Volume features
-    features['volume_zscore_short'] = latest.get('Volume_ZScore_Short', 0)
-    features['volume_zscore_long'] = latest.get('Volume_ZScore_Long', 0)
-    features['volume_surge_factor'] = latest.get('Volume_Surge_Factor', 1)
-
-    # Volatility features
-    features['atr_percent'] = latest.get('ATR_Percent', 0)
-    features['keltner_position'] = latest.get('Keltner_Position', 0.5)
-    features['keltner_breakout_upper'] = latest.get('Keltner_Breakout_Upper', 0)
-    features['keltner_breakout_lower'] = latest.get('Keltner_Breakout_Lower', 0)
-
-    # Surge metrics
-    features['price_change_1d'] = latest.get('Price_Change_1d', 0)
-    features['price_change_7d'] = latest.get('Price_Change_7d', 0)
-    features['price_change_30d'] = latest.get('Price_Change_30d', 0)
-    features['is_pumping_7d'] = latest.get('Is_Pumping_7d', 0)
-    features['is_dumping_7d'] = latest.get('Is_Dumping_7d', 0)
-    features['volume_explosion_moderate'] = latest.get('Volume_Explosion_Moderate', 0)
-    features['volume_explosion_extreme'] = latest.get('Volume_Explosion_Extreme', 0)
-    features['pump_pattern'] = latest.get('Pump_Pattern', 0)
-
-    # 3-day early detection features
-    # NOTE: keys are lowercase to match the shared RF_FEATURE_NAMES contract
-    # (the engineered DataFrame columns are capitalised; the feature-vector keys
-    # are not). compute_signals reads these same lowercase keys.
-    features['price_change_3d'] = latest.get('Price_Change_3d', 0)
-    features['volume_surge_3d'] = latest.get('Volume_Surge_3d', 1.0)
-    features['price_acceleration'] = latest.get('Price_Acceleration', 0)
-    features['volume_acceleration'] = latest.get('Volume_Acceleration', 0)
+    n = len(fundamentals)
+    if isinstance(news_flags, bool):
+        news_flags = [news_flags] * n
+    if sentiment_scores is None:
+        sentiment_scores = [None] * n
+    if not n == len(sec_flagged) == len(news_flags) == len(sentiment_scores):
+        raise ValueError("extract_contextual_features_batch needs one entry per ticker in every argument")
+
+    def field(key: str) -> np.ndarray:
+        return np.array([f.get(key, 0) for f in fundamentals], dtype=np.float64)
+
+    market_cap = field('market_cap')
+    float_shares = field('float_shares')
+    avg_volume = field('avg_daily_volume')
+    float_turnover = np.zeros(n)
+    np.divide(avg_volume, float_shares, out=float_turnover, where=float_shares > 0)
+
+    columns = {
+        'log_market_cap': np.log1p(market_cap),
+        'is_micro_cap': market_cap < MARKET_LIMITS.micro_cap,
+        'is_small_cap': market_cap < MARKET_LIMITS.small_cap,
+        'is_micro_liquidity': avg_volume < MARKET_LIMITS.micro_liquidity,
+        'is_low_liquidity': avg_volume < MARKET_LIMITS.low_liquidity,
+        'is_otc': [
+            bool(f.get('exchange', 'UNKNOWN').upper() in OTC_EXCHANGES or f.get('is_otc', False))
+            for f in fundamentals
+        ],
+        'float_turnover': float_turnover,
+        'sec_flagged': [bool(s.get('is_flagged', False)) for s in sec_flagged],
+        'has_news': [bool(flag) for flag in news_flags],
+        'sentiment_score': [0.0 if s is None else s for s in sentiment_scores],
+    }
+    return np.column_stack([
+        np.asarray(columns[name], dtype=np.float64).reshape(n) for name, _ in _CONTEXT_FEATURES
+    ])
 
-    # Momentum features
-    features['roc_7'] = latest.get('ROC_7', 0)
-    features['roc_14'] = latest.get('ROC_14', 0)
-    features['rsi_14'] = latest.get('RSI_14', 50)
-
-    # Contextual features
-    features['log_market_cap'] = ctx_features.get('log_market_cap', 0)
-    features['is_micro_cap'] = ctx_features.get('is_micro_cap', 0)
-    features['is_small_cap'] = ctx_features.get('is_small_cap', 0)
-    features['is_micro_liquidity'] = ctx_features.get('is_micro_liquidity', 0)
-    features['is_low_liquidity'] = ctx_features.get('is_low_liquidity', 0)
-    features['is_otc'] = ctx_features.get('is_otc', 0)
-    features['float_turnover'] = ctx_features.get('float_turnover', 0)
 
-    # CRITICAL: SEC regulatory flag
-    features['sec_flagged'] = ctx_features.get('sec_flagged', 0)
+def _fill_price_features(feature_array: np.ndarray, price_df: pd.DataFrame) -> None:
+    """Write the latest-row and window-aggregate features of price_df into feature_array."""
+    columns = price_df.columns
 
-    # News and sentiment (placeholders)
-    features['has_news'] = ctx_features.get('has_news', 0)
-    features['sentiment_score'] = ctx_features.get('sentiment_score', 0)
+    # Latest-row features, read per column: taking price_df.iloc[-1] would
+    # box every column of the frame into an object row just to read a few.
+    for name, column, default in _LATEST_ROW_FEATURES:
+        feature_array[FEATURE_INDEX[name]] = (
+            price_df[column].to_numpy()[-1] if column in columns else default
+        )
 
     # ---------------------------------------------------------------
     # WINDOW AGGREGATE FEATURES (not just latest row)
@@ -446,15 +750,33 @@ def create_feature_vector(
     # even if the latest single row looks normal.
     # ---------------------------------------------------------------
     n = len(price_df)
+    features = {}
+
+    # Window reductions run on NumPy views of single columns; like the pandas
+    # reductions they replace, they skip missing values.
+    def tail(column: str, days: int) -> Optional[np.ndarray]:
+        """Last `days` values of one column, or None if the column is absent."""
+        return price_df[column].to_numpy()[-days:] if column in columns else None
+
+    def nanmax(values: np.ndarray) -> float:
+        present = values[~np.isnan(values)]
+        return float(present.max()) if present.size else float('nan')
+
+    def max_abs(column: str, days: int) -> float:
+        values = tail(column, days)
+        return nanmax(np.abs(values)) if values is not None else 0
+
+    def count(column: str, days: int) -> int:
+        values = tail(column, days)
+        return int(np.nansum(values)) if values is not None else 0
 
     # 7-day window aggregates
     if n >= 7:
-        tail_7 = price_df.tail(7)
-        features['max_return_zscore_7d'] = float(tail_7['Return_ZScore_Short'].abs().max()) if 'Return_ZScore_Short' in tail_7.columns else 0
-        features['max_volume_zscore_7d'] = float(tail_7['Volume_ZScore_Short'].abs().max()) if 'Volume_ZScore_Short' in tail_7.columns else 0
-        features['pump_days_7d'] = int(tail_7['Is_Pumping_7d'].sum()) if 'Is_Pumping_7d' in tail_7.columns else 0
-        features['vol_explosion_days_7d'] = int(tail_7['Volume_Explosion_Moderate'].sum()) if 'Volume_Explosion_Moderate' in tail_7.columns else 0
-        features['keltner_breakout_days_7d'] = int(tail_7['Keltner_Breakout_Upper'].sum()) if 'Keltner_Breakout_Upper' in tail_7.columns else 0
+        features['max_return_zscore_7d'] = max_abs('Return_ZScore_Short', 7)
+        features['max_volume_zscore_7d'] = max_abs('Volume_ZScore_Short', 7)
+        features['pump_days_7d'] = count('Is_Pumping_7d', 7)
+        features['vol_explosion_days_7d'] = count('Volume_Explosion_Moderate', 7)
+        features['keltner_breakout_days_7d'] = count('Keltner_Breakout_Upper', 7)
     else:
         features['max_return_zscore_7d'] = 0
         features['max_volume_zscore_7d'] = 0
@@ -464,17 +786,18 @@ def create_feature_vector(
 
     # 14-day window aggregates
     if n >= 14:
-        tail_14 = price_df.tail(14)
-        features['max_return_zscore_14d'] = float(tail_14['Return_ZScore_Long'].abs().max()) if 'Return_ZScore_Long' in tail_14.columns else 0
-        features['max_volume_zscore_14d'] = float(tail_14['Volume_ZScore_Long'].abs().max()) if 'Volume_ZScore_Long' in tail_14.columns else 0
+        features['max_return_zscore_14d'] = max_abs('Return_ZScore_Long', 14)
+        features['max_volume_zscore_14d'] = max_abs('Volume_ZScore_Long', 14)
         # Persistence: how many of last 14 days had above-normal volume
-        features['high_volume_persistence_14d'] = int((tail_14['Volume_Surge_Factor'] > 2.0).sum()) if 'Volume_Surge_Factor' in tail_14.columns else 0
+        surge_14 = tail('Volume_Surge_Factor', 14)
+        features['high_volume_persistence_14d'] = int((surge_14 > 2.0).sum()) if surge_14 is not None else 0
         # Reversal: did price go up sharply then reverse?
-        if 'Close' in tail_14.columns and len(tail_14) >= 14:
-            first_half = tail_14.head(7)['Close']
-            second_half = tail_14.tail(7)['Close']
-            first_change = (first_half.iloc[-1] - first_half.iloc[0]) / max(first_half.iloc[0], 0.01)
-            second_change = (second_half.iloc[-1] - second_half.iloc[0]) / max(second_half.iloc[0], 0.01)
+        close_14 = tail('Close', 14)
+        if close_14 is not None:
+            first_half = close_14[:7]
+            second_half = close_14[-7:]
+            first_change = (first_half[-1] - first_half[0]) / max(first_half[0], 0.01)
+            second_change = (second_half[-1] - second_half[0]) / max(second_half[0], 0.01)
             # Reversal pattern: first half up, second half down (or vice versa)
             features['reversal_14d'] = 1 if (first_change > 0.10 and second_change < -0.05) else 0
         else:
@@ -487,15 +810,15 @@ def create_feature_vector(
 
     # 30-day window aggregates
     if n >= 30:
-        tail_30 = price_df.tail(30)
-        features['max_return_zscore_30d'] = float(tail_30['Return_ZScore_Long'].abs().max()) if 'Return_ZScore_Long' in tail_30.columns else 0
-        features['max_volume_zscore_30d'] = float(tail_30['Volume_ZScore_Long'].abs().max()) if 'Volume_ZScore_Long' in tail_30.columns else 0
+        features['max_return_zscore_30d'] = max_abs('Return_ZScore_Long', 30)
+        features['max_volume_zscore_30d'] = max_abs('Volume_ZScore_Long', 30)
+        rsi_30 = tail('RSI_14', 30)
         # Max RSI in 30 days (captures peak overbought even if it cooled off)
-        features['max_rsi_30d'] = float(tail_30['RSI_14'].max()) if 'RSI_14' in tail_30.columns else 50
+        features['max_rsi_30d'] = nanmax(rsi_30) if rsi_30 is not None else 50
         # Days above RSI 70 in last 30 days (overbought persistence)
-        features['overbought_days_30d'] = int((tail_30['RSI_14'] > 70).sum()) if 'RSI_14' in tail_30.columns else 0
+        features['overbought_days_30d'] = int((rsi_30 > 70).sum()) if rsi_30 is not None else 0
         # Pump pattern persistence
-        features['pump_pattern_days_30d'] = int(tail_30['Pump_Pattern'].sum()) if 'Pump_Pattern' in tail_30.columns else 0
+        features['pump_pattern_days_30d'] = count('Pump_Pattern', 30)
     else:
         features['max_return_zscore_30d'] = 0
         features['max_volume_zscore_30d'] = 0
@@ -503,21 +826,85 @@ def create_feature_vector(
         features['overbought_days_30d'] = 0
         features['pump_pattern_days_30d'] = 0
 
-    # Emit the vector in the EXACT order/count defined by the shared
-    # RF_FEATURE_NAMES contract so serving features always line up with the
-    # trained model. Any name in the contract that was not populated above is a
-    # programming error (the two lists have drifted) and must fail loudly.
-    missing = [name for name in RF_FEATURE_NAMES if name not in features]
-    if missing:
-        raise ValueError(
-            f"create_feature_vector is missing required RF features: {missing}. "
-            f"feature_engineering.py and config.RF_FEATURE_NAMES have drifted."
-        )
+    for name, value in features.items():
+        feature_array[FEATURE_INDEX[name]] = value
+
+
+def create_feature_vector(
+    price_df: pd.DataFrame,
+    fundamentals: Dict,
+    sec_flagged: Dict,
+    news_flag: bool = False,
+    sentiment_score: Optional[float] = None,
+    out: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, List[str]]:
+    """
+    Create a complete feature vector for ML model input.
+
+    Args:
+        price_df: Preprocessed price DataFrame with all indicators
+        fundamentals: Fundamental data dictionary
+        sec_flagged: SEC flag status dictionary
+        news_flag: News availability flag
+        sentiment_score: Sentiment score
+        out: Optional float64 buffer of len(FEATURE_ORDER) to fill instead
+            of allocating a new array (e.g. one row of a batch matrix)
 
-    feature_names = list(RF_FEATURE_NAMES)
-    feature_array = np.array([features[name] for name in feature_names])
+    Returns:
+        Tuple of (feature_array, feature_names)
+    """
+    # Extract contextual features
+    ctx_features = extract_contextual_features(
+        fundamentals, sec_flagged, news_flag, sentiment_score
+    )
 
-    return feature_array, feature_names
+    # Filled in place at the fixed FEATURE_ORDER positions
+    feature_array = np.empty(len(FEATURE_ORDER)) if out is None else out
+
+    # Contextual features (market cap, liquidity, OTC, SEC flag, news)
+    for name, default in _CONTEXT_FEATURES:
+        feature_array[FEATURE_INDEX[name]] = ctx_features.get(name, default)
+
+    _fill_price_features(feature_array, price_df)
+    return feature_array, list(FEATURE_ORDER)
+
+
+def create_feature_vectors(
+    price_dfs: Sequence[pd.DataFrame],
+    fundamentals: Sequence[Dict],
+    sec_flagged: Sequence[Dict],
+    news_flags: Union[bool, Sequence[bool]] = False,
+    sentiment_scores: Optional[Sequence[Optional[float]]] = None
+) -> Tuple[np.ndarray, List[str]]:
+    """
+    Create feature vectors for several tickers at once.
+
+    Row i equals create_feature_vector() for ticker i. The pipeline prepares
+    each ticker separately and uses create_feature_vector(); this is the
+    entry point for callers that already hold a batch of frames.
+
+    Args:
+        price_dfs: Preprocessed price DataFrames with all indicators
+        fundamentals: Fundamental data dictionary per ticker
+        sec_flagged: SEC flag status dictionary per ticker
+        news_flags: News availability flag, shared or per ticker
+        sentiment_scores: Optional sentiment score per ticker
+
+    Returns:
+        Tuple of (feature_matrix of shape (n_tickers, n_features), feature_names)
+    """
+    if not len(price_dfs) == len(fundamentals) == len(sec_flagged):
+        raise ValueError("create_feature_vectors needs one entry per ticker in every argument")
+
+    # Contextual features are computed column-wise for the whole batch; each
+    # ticker's price features are written straight into its row.
+    matrix = np.empty((len(price_dfs), len(FEATURE_ORDER)))
+    matrix[:, _CONTEXT_INDEX] = extract_contextual_features_batch(
+        fundamentals, sec_flagged, news_flags, sentiment_scores
+    )
+    for row, price_df in zip(matrix, price_dfs):
+        _fill_price_features(row, price_df)
+    return matrix, list(FEATURE_ORDER)
 
 
 def engineer_all_features(df: pd.DataFrame) -> pd.DataFrame:
@@ -530,11 +917,22 @@ def engineer_all_features(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with all engineered features
     """
-    df = compute_rolling_statistics(df)
-    df = compute_atr(df)
-    df = compute_keltner_channels(df)
-    df = compute_surge_metrics(df)
-    df = compute_momentum_indicators(df)
+    # Each step reads NumPy views of the input and of the columns added by
+    # the steps before it; the new columns join the frame in a single concat
+    # rather than one frame copy per step.
+    arrays = _frame_arrays(df)
+    added = {}
+    for step in (
+        _rolling_statistics_arrays,
+        _atr_arrays,
+        _keltner_arrays,
+        _surge_arrays,
+        _momentum_arrays,
+    ):
+        columns = step(arrays)
+        arrays.update(columns)
+        added.update(columns)
+    df = _with_columns(df, added)
 
     # Fill any remaining NaN values
     df = df.fillna(0)
@@ -13,6 +13,7 @@ Setup:
 """
 
 import os
+import re
 import json
 import time
 import requests
@@ -556,6 +557,30 @@ PROMOTIONAL_KEYWORDS = [
     'undervalued gem', '1000%', '500%', 'explode',
 ]
 
+
+def _compile_keywords(keywords: List[str]) -> Tuple['re.Pattern', Tuple[Tuple[str, str], ...]]:
+    """
+    Compile a keyword list for matching against lowercased titles.
+
+    Returns a single alternation over the lowercased keywords, which rejects
+    non-matching titles in one pass, and the (keyword, lowercased) pairs used
+    to report which keyword matched first in list order.
+    """
+    pairs = tuple((kw, kw.lower()) for kw in keywords)
+    return re.compile('|'.join(re.escape(low) for _, low in pairs)), pairs
+
+
+_LEGITIMATE_MATCHER = _compile_keywords(LEGITIMATE_CATALYST_KEYWORDS)
+_PROMOTIONAL_MATCHER = _compile_keywords(PROMOTIONAL_KEYWORDS)
+
+
+def _first_keyword(title_lower: str, matcher) -> Optional[str]:
+    """Return the first keyword (in list order) contained in a lowercased title."""
+    pattern, pairs = matcher
+    if pattern.search(title_lower) is None:
+        return None
+    return next(kw for kw, low in pairs if low in title_lower)
+
 SEC_EDGAR_HEADERS = {
     'User-Agent': 'ScamDunk Research Tool support@scamdunk.com',
     'Accept-Encoding': 'gzip, deflate',
@@ -698,21 +723,19 @@ def verify_legitimate_catalysts(ticker: str) -> Dict:
     for title in all_titles:
         title_lower = title.lower()
 
-        for keyword in LEGITIMATE_CATALYST_KEYWORDS:
-            if keyword.lower() in title_lower:
-                legitimate_matches.append({
-                    'title': title,
-                    'keyword': keyword,
-                })
-                break
-
-        for keyword in PROMOTIONAL_KEYWORDS:
-            if keyword.lower() in title_lower:
-                promotional_matches.append({
-                    'title': title,
-                    'keyword': keyword,
-                })
-                break
+        keyword = _first_keyword(title_lower, _LEGITIMATE_MATCHER)
+        if keyword is not None:
+            legitimate_matches.append({
+                'title': title,
+                'keyword': keyword,
+            })
+
+        keyword = _first_keyword(title_lower, _PROMOTIONAL_MATCHER)
+        if keyword is not None:
+            promotional_matches.append({
+                'title': title,
+                'keyword': keyword,
+            })
 
     has_legitimate = len(legitimate_matches) > 0
     has_promotional = len(promotional_matches) > 0
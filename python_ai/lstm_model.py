@@ -5,7 +5,7 @@ This module implements:
 - Sequence data preparation for time-series analysis
 - LSTM neural network for detecting temporal patterns
 - Training workflow with synthetic sequence data
-- Model persistence (save/load)
+- Model persistence (save/load), with a quantized TFLite copy for inference
 - Sequence-based scam probability prediction
 
 The LSTM model is designed to capture temporal patterns in price/volume
@@ -19,6 +19,7 @@ import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple, Union
 import os
+import threading
 import warnings
 from datetime import datetime
 
@@ -82,7 +83,7 @@ def _import_tensorflow():
 
 from sklearn.preprocessing import MinMaxScaler
 
-from config import LSTM_MODEL_CONFIG, MODEL_PATHS
+from config import LSTM_MODEL_CONFIG, MODEL_PATHS, resolve_lstm_path
 from model_integrity import verify_model_file
 
 
@@ -96,7 +97,7 @@ class ScamDetectorLSTM:
         Args:
             config: Configuration for LSTM model (optional)
         """
-        self.config = config or LSTM_MODEL_CONFIG
+        self.config = dict(config or LSTM_MODEL_CONFIG)
         self.model = None
         self.scaler = MinMaxScaler()
         self.is_trained = False
@@ -105,6 +106,15 @@ class ScamDetectorLSTM:
             'Close', 'Volume', 'Return', 'Volume_Surge_Factor',
             'Price_ZScore_Long', 'Volume_ZScore_Long'
         ]
+        # Quantized TFLite interpreter used for inference when its artifact is
+        # present; Keras is then only needed for training. The interpreter is
+        # not thread-safe, so calls are serialized.
+        self.tflite_interpreter = None
+        self._tflite_lock = threading.Lock()
+        # Scaled training sequences kept to calibrate int8 quantization on export
+        self._representative_sequences = None
+        # Keras inference batch size, resolved on first prediction
+        self._infer_batch_size = None
 
     def _build_model(self, input_shape: Tuple[int, int]):
         """
@@ -391,6 +401,9 @@ class ScamDetectorLSTM:
             print("Generating synthetic sequence data...")
             X, y = self.generate_synthetic_sequence_data()
 
+        # Any loaded TFLite interpreter belongs to the previous network
+        self.tflite_interpreter = None
+
         validation_split = validation_split or self.config.get('validation_split', 0.2)
         epochs = epochs or self.config.get('epochs', 50)
         batch_size = batch_size or self.config.get('batch_size', 32)
@@ -405,6 +418,7 @@ class ScamDetectorLSTM:
         indices = np.random.permutation(len(X_scaled))
         X_scaled = X_scaled[indices]
         y = y[indices]
+        self._representative_sequences = X_scaled[:200].astype(np.float32)
 
         # Build model
         print("Building LSTM model...")
@@ -490,6 +504,25 @@ class ScamDetectorLSTM:
         Returns:
             Tuple of (probability, prediction)
         """
+        probability = float(self.predict_lstm_probabilities(sequence_data)[0])
+        prediction = int(probability >= 0.5)
+
+        return probability, prediction
+
+    def predict_lstm_probabilities(
+        self,
+        sequence_data: np.ndarray
+    ) -> np.ndarray:
+        """
+        Predict scam probabilities for a batch of sequences in one model call.
+
+        Args:
+            sequence_data: Sequence array (n_samples, timesteps, features) or
+                a single (timesteps, features) sequence
+
+        Returns:
+            Array of scam probabilities, one per sequence
+        """
         if not self.is_trained:
             raise RuntimeError("Model not trained. Call train() first.")
 
@@ -515,10 +548,102 @@ class ScamDetectorLSTM:
         seq_scaled = seq_scaled.reshape(n_samples, n_timesteps, n_features)
 
         # Predict
-        probability = float(self.model.predict(seq_scaled, verbose=0)[0, 0])
-        prediction = int(probability >= 0.5)
+        if self.tflite_interpreter is not None:
+            return self._predict_tflite(seq_scaled)
+        return self.model.predict(seq_scaled, batch_size=self._inference_batch_size(), verbose=0)[:, 0]
+
+    def _inference_batch_size(self) -> int:
+        """Pick the configured inference batch size for the available device."""
+        if self._infer_batch_size is None:
+            key = 'infer_batch_size_gpu' if tf.config.list_physical_devices('GPU') else 'infer_batch_size_cpu'
+            self._infer_batch_size = self.config.get(key, self.config.get('batch_size', 32))
+        return self._infer_batch_size
+
+    def _predict_tflite(self, seq_scaled: np.ndarray) -> np.ndarray:
+        """Run scaled sequences through the TFLite interpreter."""
+        interpreter = self.tflite_interpreter
+        with self._tflite_lock:
+            input_detail = interpreter.get_input_details()[0]
+            if tuple(input_detail['shape']) != seq_scaled.shape:
+                interpreter.resize_tensor_input(input_detail['index'], seq_scaled.shape)
+                interpreter.allocate_tensors()
+            interpreter.set_tensor(input_detail['index'], seq_scaled.astype(np.float32))
+            interpreter.invoke()
+            output_index = interpreter.get_output_details()[0]['index']
+            return interpreter.get_tensor(output_index)[:, 0].astype(np.float64)
+
+    def export_tflite(
+        self,
+        tflite_path: str = None,
+        representative_sequences: np.ndarray = None
+    ) -> str:
+        """
+        Convert the trained Keras model to a quantized TFLite flatbuffer.
 
-        return probability, prediction
+        With representative sequences (already scaled, as in training) the
+        conversion calibrates int8 activations as well as weights; without
+        them it falls back to dynamic-range (int8 weight) quantization.
+
+        Args:
+            tflite_path: Output path (defaults to MODEL_PATHS['lstm_tflite'])
+            representative_sequences: Scaled (n, timesteps, features) samples
+                for calibration (defaults to those kept by train())
+
+        Returns:
+            Path of the written .tflite file
+        """
+        if not self.is_trained or self.model is None:
+            raise RuntimeError("Model not trained. Call train() first.")
+
+        if not _import_tensorflow():
+            raise RuntimeError("Cannot export LSTM model: TensorFlow not available")
+
+        tflite_path = tflite_path or MODEL_PATHS['lstm_tflite']
+        if representative_sequences is None:
+            representative_sequences = self._representative_sequences
+
+        converter = tf.lite.TFLiteConverter.from_keras_model(self.model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        # Recurrent layers may lower to TF ops without a builtin kernel
+        converter.target_spec.supported_ops = [
+            tf.lite.OpsSet.TFLITE_BUILTINS,
+            tf.lite.OpsSet.SELECT_TF_OPS,
+        ]
+        if representative_sequences is not None and len(representative_sequences):
+            samples = np.asarray(representative_sequences, dtype=np.float32)
+
+            def representative_dataset():
+                for sample in samples:
+                    yield [sample[np.newaxis]]
+
+            converter.representative_dataset = representative_dataset
+
+        tflite_model = converter.convert()
+
+        os.makedirs(os.path.dirname(tflite_path) if os.path.dirname(tflite_path) else '.', exist_ok=True)
+        with open(tflite_path, 'wb') as f:
+            f.write(tflite_model)
+
+        print(f"LSTM TFLite model saved to {tflite_path} ({len(tflite_model) / 1024:.0f} KB)")
+        return tflite_path
+
+    def _load_tflite(self, tflite_path: str) -> bool:
+        """Load the TFLite artifact if present and verified; Keras stays the fallback."""
+        self.tflite_interpreter = None
+        if not os.path.exists(tflite_path):
+            return False
+        if not verify_model_file(tflite_path):
+            print(f"Model integrity check failed for {tflite_path}")
+            return False
+        try:
+            interpreter = tf.lite.Interpreter(model_path=tflite_path)
+            interpreter.allocate_tensors()
+        except Exception as e:
+            print(f"Could not load TFLite model: {e} - using Keras for inference")
+            return False
+        self.tflite_interpreter = interpreter
+        print(f"LSTM TFLite model loaded from {tflite_path}")
+        return True
 
     def save(self, model_path: str = None):
         """
@@ -554,6 +679,19 @@ class ScamDetectorLSTM:
 
         print(f"LSTM model saved to {model_path}")
 
+        # Keep the inference artifact in sync with the Keras model. A failed
+        # conversion only costs the faster path, but the older .tflite must go:
+        # load() prefers it and would pair the old network with the new scaler.
+        # The path is built exactly as resolve_lstm_path() looks it up.
+        tflite_path = os.path.splitext(model_path)[0] + '.tflite'
+        try:
+            self.export_tflite(tflite_path)
+        except Exception as e:
+            print(f"TFLite export failed: {e}")
+            if os.path.exists(tflite_path):
+                os.remove(tflite_path)
+                print(f"Removed stale TFLite model {tflite_path}")
+
     def load(self, model_path: str = None) -> bool:
         """
         Load a trained LSTM model.
@@ -596,6 +734,10 @@ class ScamDetectorLSTM:
 
             self.is_trained = True
             print(f"LSTM model loaded from {model_path}")
+
+            backend, backend_path = resolve_lstm_path(model_path)
+            if backend == 'tflite':
+                self._load_tflite(backend_path)
             return True
 
         except Exception as e:
@@ -4,7 +4,7 @@ Machine Learning Model Module for Scam Detection System.
 This module implements:
 - Synthetic training data generation
 - RandomForestClassifier training and evaluation
-- Model persistence (save/load)
+- Model persistence (save/load), with an optional ONNX copy for inference
 - Scam probability prediction
 
 The model is trained on synthetic examples that mimic known
@@ -30,6 +30,14 @@ from sklearn.preprocessing import StandardScaler
 from config import RF_MODEL_CONFIG, MODEL_PATHS, RF_FEATURE_NAMES
 from model_integrity import verify_model_file
 
+# ONNX Runtime is OPTIONAL: when installed and an exported forest is present,
+# predictions run through its tree-ensemble kernel instead of sklearn.
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
 
 class ScamDetectorRF:
     """Random Forest-based scam detection model."""
@@ -41,12 +49,13 @@ class ScamDetectorRF:
         Args:
             model_config: Configuration for Random Forest (optional)
         """
-        self.config = model_config or RF_MODEL_CONFIG
+        self.config = dict(model_config or RF_MODEL_CONFIG)
         self.model = None
         self.scaler = StandardScaler()
         self.feature_names = None
         self.is_trained = False
         self.training_metrics = {}
+        self.onnx_session = None
 
     def _create_model(self) -> RandomForestClassifier:
         """Create a new Random Forest model with configured parameters."""
@@ -346,6 +355,8 @@ class ScamDetectorRF:
             X, y, feature_names = self.generate_synthetic_training_data()
 
         self.feature_names = feature_names
+        # Any loaded ONNX session belongs to the previous forest
+        self.onnx_session = None
 
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(
@@ -410,6 +421,30 @@ class ScamDetectorRF:
         if not self.is_trained:
             raise RuntimeError("Model not trained. Call train() first.")
 
+        probability = self.predict_scam_probabilities(features)[0]
+        prediction = int(probability >= 0.5)
+
+        return probability, prediction
+
+    def predict_scam_probabilities(
+        self,
+        features: np.ndarray
+    ) -> np.ndarray:
+        """
+        Predict scam probabilities for a batch of feature vectors.
+
+        One scaler transform and one predict_proba call cover the whole
+        batch, so the per-call overhead is paid once rather than per row.
+
+        Args:
+            features: Feature matrix (n_samples, n_features) or a single vector
+
+        Returns:
+            Array of scam probabilities, one per row
+        """
+        if not self.is_trained:
+            raise RuntimeError("Model not trained. Call train() first.")
+
         # Ensure 2D array
         if features.ndim == 1:
             features = features.reshape(1, -1)
@@ -418,10 +453,62 @@ class ScamDetectorRF:
         features_scaled = self.scaler.transform(features)
 
         # Predict
-        probability = self.model.predict_proba(features_scaled)[0, 1]
-        prediction = int(probability >= 0.5)
+        if self.onnx_session is not None:
+            probabilities = self.onnx_session.run(
+                ['probabilities'], {'X': features_scaled.astype(np.float32)}
+            )[0]
+            return probabilities[:, 1].astype(np.float64)
+        return self.model.predict_proba(features_scaled)[:, 1]
+
+    def export_onnx(self, onnx_path: str = None) -> str:
+        """
+        Export the trained forest to ONNX for ONNX Runtime inference.
 
-        return probability, prediction
+        Only the classifier is converted; features are still scaled by the
+        sklearn scaler before being passed in as float32.
+
+        Args:
+            onnx_path: Output path (defaults to MODEL_PATHS['rf_onnx'])
+
+        Returns:
+            Path of the written .onnx file
+        """
+        if not self.is_trained:
+            raise RuntimeError("Model not trained. Call train() first.")
+
+        from skl2onnx import convert_sklearn
+        from skl2onnx.common.data_types import FloatTensorType
+
+        onnx_path = onnx_path or MODEL_PATHS['rf_onnx']
+        onnx_model = convert_sklearn(
+            self.model,
+            initial_types=[('X', FloatTensorType([None, self.model.n_features_in_]))],
+            # Plain probability matrix instead of a list of per-class dicts
+            options={id(self.model): {'zipmap': False}},
+        )
+
+        os.makedirs(os.path.dirname(onnx_path) if os.path.dirname(onnx_path) else '.', exist_ok=True)
+        with open(onnx_path, 'wb') as f:
+            f.write(onnx_model.SerializeToString())
+
+        print(f"ONNX model saved to {onnx_path}")
+        return onnx_path
+
+    def _load_onnx(self, onnx_path: str) -> bool:
+        """Open an ONNX Runtime session for the exported forest, if available."""
+        self.onnx_session = None
+        if not ONNXRUNTIME_AVAILABLE or not os.path.exists(onnx_path):
+            return False
+        if not verify_model_file(onnx_path):
+            print(f"Model integrity check failed for {onnx_path}")
+            return False
+        try:
+            self.onnx_session = ort.InferenceSession(onnx_path, providers=['CPUExecutionProvider'])
+        except Exception as e:
+            print(f"Could not load ONNX model ({type(e).__name__}: {e}) - using sklearn for inference")
+            return False
+        print(f"ONNX model loaded from {onnx_path}")
+        return True
 
     def get_feature_importance(self, top_n: int = 10) -> Dict[str, float]:
         """
@@ -475,6 +562,19 @@ class ScamDetectorRF:
         print(f"Model saved to {model_path}")
         print(f"Scaler saved to {scaler_path}")
 
+        # Keep the ONNX inference copy in sync when the converter is installed.
+        # load() prefers that copy, so an export that fails or is skipped must
+        # not leave an older forest next to the new model and scaler.
+        onnx_path = os.path.splitext(model_path)[0] + '.onnx'
+        try:
+            self.export_onnx(onnx_path)
+        except Exception as e:
+            if not isinstance(e, ImportError):
+                print(f"ONNX export failed: {e}")
+            if os.path.exists(onnx_path):
+                os.remove(onnx_path)
+                print(f"Removed stale ONNX model {onnx_path}")
+
     def load(self, model_path: str = None, scaler_path: str = None) -> bool:
         """
         Load trained model and scaler from disk.
@@ -508,6 +608,8 @@ class ScamDetectorRF:
             self.is_trained = True
 
             print(f"Model loaded from {model_path}")
+
+            self._load_onnx(os.path.splitext(model_path)[0] + '.onnx')
             return True
 
         except FileNotFoundError:
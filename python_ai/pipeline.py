@@ -13,6 +13,7 @@ This module combines all components into a coherent pipeline:
 The pipeline provides a simple interface for end-to-end scam detection.
 """
 
+import bisect
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple, Union
@@ -25,9 +26,9 @@ warnings.filterwarnings('ignore')
 
 # Import all modules
 from config import (
-    RISK_THRESHOLDS, ANOMALY_CONFIG, ENSEMBLE_CONFIG,
-    SEC_FLAGGED_TICKERS, OTC_EXCHANGES, MARKET_THRESHOLDS,
-    RF_FEATURE_NAMES, get_thresholds
+    RISK_THRESHOLDS, ANOMALY_CONFIG, ENSEMBLE_PARAMS,
+    SEC_FLAGGED_TICKERS, OTC_EXCHANGES, MARKET_LIMITS,
+    RF_FEATURE_NAMES, threshold_tier, tier_thresholds
 )
 
 
@@ -59,16 +60,54 @@ from ml_model import ScamDetectorRF
 from lstm_model import ScamDetectorLSTM
 
 
-@dataclass
+# Ascending risk-level bounds and the level each bucket maps to: a
+# probability below bound i falls in level i, anything above the last bound
+# is HIGH.
+_RISK_BOUNDS = (RISK_THRESHOLDS['LOW'], RISK_THRESHOLDS['MEDIUM'])
+_RISK_BOUND_ARRAY = np.array(_RISK_BOUNDS, dtype=np.float64)
+_RISK_LEVELS = ('LOW', 'MEDIUM', 'HIGH')
+_RISK_LEVEL_ARRAY = np.array(_RISK_LEVELS)
+
+
+def _feature_dict(features, feature_names: List[str]) -> Dict[str, float]:
+    """
+    Map feature names to plain Python floats.
+
+    The signal rules compare, scale and format each value, which is several
+    times cheaper on Python floats than on NumPy scalars; tolist() unboxes the
+    whole vector in one call.
+    """
+    return dict(zip(feature_names, np.asarray(features, dtype=np.float64).tolist()))
+
+
+def calibrate_probabilities(probabilities) -> np.ndarray:
+    """Map an array of probabilities to risk level strings in one searchsorted call."""
+    buckets = np.searchsorted(_RISK_BOUND_ARRAY, np.asarray(probabilities, dtype=np.float64), side='right')
+    return _RISK_LEVEL_ARRAY[buckets]
+
+
+# Anomaly types that count as a severe pattern when combining predictions.
+_SEVERE_ANOMALIES = frozenset({
+    'pump_and_dump_pattern', 'pump_pattern_detected',
+    'extreme_volume_explosion', 'extreme_weekly_price_move',
+    'coordinated_volume_price_activity', 'extreme_volatility',
+})
+
+
+@dataclass(slots=True)
 class SignalDetail:
-    """Individual risk signal with code, category, description, and weight."""
+    """Individual risk signal with code, category, description, and weight.
+
+    Slotted: an assessment can carry dozens of these, and they are plain
+    records that never take extra attributes.
+    """
     code: str
     category: str  # STRUCTURAL, PATTERN, ALERT, BEHAVIORAL
     description: str
     weight: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskAssessment:
     """Container for the complete risk assessment output."""
     ticker: str
@@ -91,6 +130,28 @@ class RiskAssessment:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
+@dataclass(slots=True)
+class PreparedAnalysis:
+    """Per-ticker state between feature engineering and model prediction.
+
+    Produced by ScamDetectionPipeline.prepare_analysis so that the RF/LSTM
+    step can be run once for a whole batch of tickers.
+    """
+    ticker: str
+    asset_type: str
+    context: Dict
+    price_data: pd.DataFrame
+    price_data_fe: pd.DataFrame
+    fundamentals: Dict
+    sec_flagged: bool
+    news_flag: bool
+    use_synthetic: bool
+    thresholds: Dict
+    features: np.ndarray
+    feature_names: List[str]
+    anomaly_result: AnomalyResult
+
+
 class ScamDetectionPipeline:
     """Main pipeline for scam detection integrating all components."""
 
@@ -189,12 +250,7 @@ class ScamDetectionPipeline:
         Returns:
             Risk level string (LOW, MEDIUM, HIGH)
         """
-        if probability < RISK_THRESHOLDS['LOW']:
-            return 'LOW'
-        elif probability < RISK_THRESHOLDS['MEDIUM']:
-            return 'MEDIUM'
-        else:
-            return 'HIGH'
+        return _RISK_LEVELS[bisect.bisect_right(_RISK_BOUNDS, probability)]
 
     def compute_signals(
         self,
@@ -217,7 +273,7 @@ class ScamDetectionPipeline:
             List of SignalDetail objects.
         """
         signals: List[SignalDetail] = []
-        feat = dict(zip(feature_names, features))
+        feat = _feature_dict(features, feature_names)
 
         # ----- STRUCTURAL signals -----
         # NOTE: market_cap / avg_volume / exchange may be None when fundamentals
@@ -236,7 +292,7 @@ class ScamDetectionPipeline:
             ))
 
         market_cap = fundamentals.get('market_cap') or 0
-        if 0 < market_cap < MARKET_THRESHOLDS['small_cap']:
+        if 0 < market_cap < MARKET_LIMITS.small_cap:
             cap_str = f'${market_cap / 1e6:.1f}M'
             signals.append(SignalDetail(
                 code='SMALL_MARKET_CAP', category='STRUCTURAL',
@@ -245,7 +301,7 @@ class ScamDetectionPipeline:
             ))
 
         avg_volume = fundamentals.get('avg_daily_volume') or 0
-        if 0 < avg_volume < MARKET_THRESHOLDS['micro_liquidity']:
+        if 0 < avg_volume < MARKET_LIMITS.micro_liquidity:
             vol_k = f'${avg_volume / 1e3:.0f}K'
             signals.append(SignalDetail(
                 code='MICRO_LIQUIDITY', category='STRUCTURAL',
@@ -529,11 +585,11 @@ class ScamDetectionPipeline:
         # Blend in ML model probabilities as supplementary signal.
         ml_prob = rf_prob
         if lstm_prob is not None:
-            if ENSEMBLE_CONFIG['use_max_strategy']:
+            if ENSEMBLE_PARAMS.use_max_strategy:
                 ml_prob = max(rf_prob, lstm_prob)
             else:
-                rf_weight = ENSEMBLE_CONFIG['rf_weight']
-                lstm_weight = ENSEMBLE_CONFIG['lstm_weight']
+                rf_weight = ENSEMBLE_PARAMS.rf_weight
+                lstm_weight = ENSEMBLE_PARAMS.lstm_weight
                 ml_prob = (rf_prob * rf_weight + lstm_prob * lstm_weight)
 
         # Combine: anomaly score dominates, ML provides supplementary boost.
@@ -550,8 +606,9 @@ class ScamDetectionPipeline:
             combined = max(combined, SEC_FLAGGED_FLOOR)
 
         # OTC with any notable movement
-        price_change_7d = anomaly_result.details.get('surge_analysis', {}).get('price_change_7d', 0) / 100
-        volume_surge = anomaly_result.details.get('surge_analysis', {}).get('volume_surge_factor', 1)
+        surge = anomaly_result.details.get('surge_analysis')
+        price_change_7d = surge.price_change_7d / 100 if surge is not None else 0
+        volume_surge = surge.volume_surge_factor if surge is not None else 1
 
         if is_otc and (abs(price_change_7d) > 0.15 or volume_surge > 2.5):
             combined = max(combined, OTC_MOVEMENT_FLOOR)
@@ -561,10 +618,7 @@ class ScamDetectionPipeline:
             combined = max(combined, OTC_MICRO_CAP_FLOOR)
 
         # --- Severe patterns detection ---
-        severe_anomalies = ['pump_and_dump_pattern', 'pump_pattern_detected',
-                          'extreme_volume_explosion', 'extreme_weekly_price_move',
-                          'coordinated_volume_price_activity', 'extreme_volatility']
-        has_severe_pattern = any(a in anomaly_result.anomaly_types for a in severe_anomalies)
+        has_severe_pattern = not _SEVERE_ANOMALIES.isdisjoint(anomaly_result.anomaly_types)
 
         if has_severe_pattern:
             combined = max(combined, SEVERE_PATTERN_FLOOR)
@@ -593,7 +647,8 @@ class ScamDetectionPipeline:
         features: np.ndarray,
         feature_names: List[str],
         anomaly_result: AnomalyResult,
-        combined_prob: float
+        combined_prob: float,
+        risk_level: Optional[str] = None
     ) -> Tuple[str, List[str]]:
         """
         Generate human-readable explanation of the risk assessment.
@@ -604,6 +659,7 @@ class ScamDetectionPipeline:
             feature_names: Names of features
             anomaly_result: Anomaly detection result
             combined_prob: Combined probability score
+            risk_level: Calibrated level of combined_prob, if already known
 
         Returns:
             Tuple of (explanation_string, key_indicators_list)
@@ -612,7 +668,7 @@ class ScamDetectionPipeline:
         explanations = []
 
         # Create feature dictionary for easy access
-        feature_dict = dict(zip(feature_names, features))
+        feature_dict = _feature_dict(features, feature_names)
 
         # Check SEC flag (CRITICAL)
         if context['sec_flagged']['is_flagged']:
@@ -626,10 +682,10 @@ class ScamDetectionPipeline:
 
         # Check market cap (skip entirely when unknown — never assume a value)
         market_cap = context['fundamentals'].get('market_cap')
-        if market_cap and market_cap < MARKET_THRESHOLDS['micro_cap']:
+        if market_cap and market_cap < MARKET_LIMITS.micro_cap:
             key_indicators.append(f"Micro-cap (${market_cap/1e6:.1f}M)")
             explanations.append(f"Very small market cap: ${market_cap/1e6:.1f}M")
-        elif market_cap and market_cap < MARKET_THRESHOLDS['small_cap']:
+        elif market_cap and market_cap < MARKET_LIMITS.small_cap:
             key_indicators.append(f"Small-cap (${market_cap/1e6:.1f}M)")
 
         # Check price changes
@@ -667,7 +723,8 @@ class ScamDetectionPipeline:
             explanations.append("Large price move without identified news catalyst")
 
         # Build final explanation
-        risk_level = self.calibrate_probability(combined_prob)
+        if risk_level is None:
+            risk_level = self.calibrate_probability(combined_prob)
 
         if not explanations:
             if combined_prob < 0.3:
@@ -780,6 +837,83 @@ class ScamDetectionPipeline:
         Returns:
             RiskAssessment with complete analysis
         """
+        prepared = self.prepare_analysis(
+            ticker,
+            asset_type=asset_type,
+            price_data=price_data,
+            fundamentals=fundamentals,
+            news_flag=news_flag,
+            use_synthetic=use_synthetic,
+            is_scam_scenario=is_scam_scenario,
+            sec_flagged_override=sec_flagged_override
+        )
+        if isinstance(prepared, RiskAssessment):
+            return prepared
+        rf_prob, lstm_prob = self.predict_models([prepared])[0]
+        return self.finish_analysis(prepared, rf_prob, lstm_prob)
+
+    def analyze_batch(
+        self,
+        requests: List[Dict],
+        return_exceptions: bool = False
+    ) -> List[Union[RiskAssessment, Exception]]:
+        """
+        Analyze several assets, running the RF and LSTM models once for the batch.
+
+        Data loading, feature engineering and anomaly detection still run per
+        ticker; only the model step is shared, so each model is called with
+        one (B, F) matrix instead of B single rows.
+
+        Args:
+            requests: One dict of analyze() keyword arguments per asset
+            return_exceptions: If True, an asset that fails is returned as its
+                exception instead of aborting the whole batch
+
+        Returns:
+            One RiskAssessment (or exception) per request, in order
+        """
+        results: List[Union[RiskAssessment, PreparedAnalysis, Exception]] = []
+        for kwargs in requests:
+            try:
+                results.append(self.prepare_analysis(**kwargs))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+
+        prepared = [r for r in results if isinstance(r, PreparedAnalysis)]
+        predictions = self.predict_models(prepared)
+        calibrations = self.calibrate_batch(prepared, predictions)
+        finishing = dict(zip(map(id, prepared), zip(predictions, calibrations)))
+
+        for i, r in enumerate(results):
+            if isinstance(r, PreparedAnalysis):
+                prediction, calibration = finishing[id(r)]
+                try:
+                    results[i] = self.finish_analysis(r, *prediction, calibration=calibration)
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results[i] = e
+        return results
+
+    def prepare_analysis(
+        self,
+        ticker: str,
+        asset_type: str = 'stock',
+        price_data: pd.DataFrame = None,
+        fundamentals: Dict = None,
+        news_flag: bool = False,
+        use_synthetic: bool = True,
+        is_scam_scenario: bool = False,
+        sec_flagged_override: bool = None
+    ) -> Union[PreparedAnalysis, RiskAssessment]:
+        """
+        Run the per-ticker steps before model prediction (data, features, anomalies).
+
+        Takes the same arguments as analyze(). Returns the finished
+        RiskAssessment directly when there is too little history to score.
+        """
         print(f"\n{'='*60}")
         print(f"Analyzing: {ticker}")
         print(f"{'='*60}")
@@ -839,7 +973,7 @@ class ScamDetectionPipeline:
         exchange_str = fundamentals.get('exchange') or ''
         is_otc = bool(fundamentals.get('is_otc')) or exchange_str.upper() in OTC_EXCHANGES
         on_watchlist = fundamentals.get('on_watchlist', False)
-        thresholds = get_thresholds(is_otc=is_otc, on_watchlist=on_watchlist)
+        thresholds = tier_thresholds(threshold_tier(is_otc, on_watchlist))
         fundamentals['_thresholds'] = thresholds
 
         # Step 2: Feature engineering
@@ -861,48 +995,179 @@ class ScamDetectionPipeline:
         if anomaly_result.anomaly_types:
             print(f"   Types: {', '.join(anomaly_result.anomaly_types[:3])}")
 
+        return PreparedAnalysis(
+            ticker=ticker,
+            asset_type=asset_type,
+            context=context,
+            price_data=price_data,
+            price_data_fe=price_data_fe,
+            fundamentals=fundamentals,
+            sec_flagged=sec_flagged,
+            news_flag=news_flag,
+            use_synthetic=use_synthetic,
+            thresholds=thresholds,
+            features=features,
+            feature_names=feature_names,
+            anomaly_result=anomaly_result,
+        )
+
+    def predict_models(
+        self,
+        prepared: List[PreparedAnalysis]
+    ) -> List[Tuple[float, Optional[float]]]:
+        """
+        Run the RF and LSTM models for prepared tickers, one model call per batch.
+
+        Args:
+            prepared: Results of prepare_analysis()
+
+        Returns:
+            (rf_probability, lstm_probability) per ticker; LSTM is None when
+            unavailable
+        """
+        rf_probs = [0.0] * len(prepared)
+        lstm_probs: List[Optional[float]] = [None] * len(prepared)
+        if not prepared:
+            return []
+
         # Step 4: Random Forest prediction
         # NEVER train inside a request. Models are loaded once at startup. If
         # the RF model is unavailable or fails to predict, we degrade to a
         # rule-based-only score (rf_prob = 0.0) rather than retraining.
         print("\n[Step 4] Running Random Forest prediction...")
-        rf_prob = 0.0
         if not self.ml_enabled:
             print("   RF disabled (ML_MODELS_ENABLED is false) - rule-based scoring only")
         elif self.rf_available:
             try:
-                rf_prob, rf_pred = self.rf_detector.predict_scam_probability(features)
-                print(f"   RF Probability: {rf_prob:.3f}")
+                X = np.vstack([item.features for item in prepared])
+                rf_probs = list(self.rf_detector.predict_scam_probabilities(X))
+                for item, rf_prob in zip(prepared, rf_probs):
+                    print(f"   RF Probability ({item.ticker}): {rf_prob:.3f}")
             except Exception as e:
                 # Degrade gracefully — do NOT retrain in the request path.
                 print(f"   RF prediction failed: {e} - degrading to 0.0 (no retrain)")
-                rf_prob = 0.0
+                rf_probs = [0.0] * len(prepared)
         else:
             print("   RF model not available - degrading to rule-based scoring (no retrain)")
 
         # Step 5: LSTM prediction (if available)
         print("\n[Step 5] Running LSTM prediction...")
-        lstm_prob = None
         if not self.ml_enabled:
             print("   LSTM disabled (ML_MODELS_ENABLED is false)")
         elif self.lstm_available:
-            try:
-                sequence = self.lstm_detector.prepare_sequence_from_df(price_data_fe)
-                lstm_prob, lstm_pred = self.lstm_detector.predict_lstm_probability(sequence[0])
-                print(f"   LSTM Probability: {lstm_prob:.3f}")
-            except Exception as e:
-                print(f"   LSTM prediction failed: {e}")
-                lstm_prob = None
+            # A ticker whose sequence cannot be built keeps lstm_prob=None;
+            # the rest are scored together.
+            sequences = {}
+            for i, item in enumerate(prepared):
+                try:
+                    sequences[i] = self.lstm_detector.prepare_sequence_from_df(item.price_data_fe)[0]
+                except Exception as e:
+                    print(f"   LSTM prediction failed for {item.ticker}: {e}")
+            if sequences:
+                try:
+                    probs = self.lstm_detector.predict_lstm_probabilities(
+                        np.stack(list(sequences.values()))
+                    )
+                    for i, lstm_prob in zip(sequences, probs):
+                        lstm_probs[i] = float(lstm_prob)
+                        print(f"   LSTM Probability ({prepared[i].ticker}): {lstm_probs[i]:.3f}")
+                except Exception as e:
+                    print(f"   LSTM prediction failed: {e}")
         else:
             print("   LSTM model not available (will use rule-based scoring only)")
 
+        return list(zip(rf_probs, lstm_probs))
+
+    def _combined_probability(
+        self,
+        prepared: PreparedAnalysis,
+        rf_prob: float,
+        lstm_prob: Optional[float]
+    ) -> float:
+        """Combine one prepared ticker's model outputs with its structural priors."""
+        fundamentals = prepared.fundamentals
+        is_otc = fundamentals.get('is_otc', False)
+        # market_cap may be None when fundamentals are unavailable — treat
+        # unknown as "not micro-cap" so we never fabricate a micro-cap floor.
+        market_cap = fundamentals.get('market_cap')
+        is_micro_cap = market_cap is not None and market_cap < MARKET_LIMITS.micro_cap
+
+        return self.combine_predictions(
+            rf_prob, lstm_prob, prepared.anomaly_result, prepared.sec_flagged,
+            is_otc=is_otc, is_micro_cap=is_micro_cap
+        )
+
+    def calibrate_batch(
+        self,
+        prepared: List[PreparedAnalysis],
+        predictions: List[Tuple[float, Optional[float]]]
+    ) -> List[Tuple[float, str]]:
+        """
+        Combine model outputs for prepared tickers and bucket them in one call.
+
+        Args:
+            prepared: Results of prepare_analysis()
+            predictions: Matching (rf_probability, lstm_probability) pairs from
+                predict_models()
+
+        Returns:
+            (combined_probability, ml_risk_level) per ticker, to pass to
+            finish_analysis()
+        """
+        combined = [
+            self._combined_probability(item, *prediction)
+            for item, prediction in zip(prepared, predictions)
+        ]
+        return list(zip(combined, calibrate_probabilities(combined).tolist()))
+
+    def finish_analysis(
+        self,
+        prepared: PreparedAnalysis,
+        rf_prob: float,
+        lstm_prob: Optional[float],
+        calibration: Optional[Tuple[float, str]] = None
+    ) -> RiskAssessment:
+        """
+        Combine signals and model outputs into the final RiskAssessment.
+
+        Args:
+            prepared: Result of prepare_analysis()
+            rf_prob: Random Forest probability from predict_models()
+            lstm_prob: LSTM probability from predict_models(), or None
+            calibration: (combined_probability, ml_risk_level) from
+                calibrate_batch(); computed here when omitted
+
+        Returns:
+            RiskAssessment with complete analysis
+        """
+        ticker = prepared.ticker
+        asset_type = prepared.asset_type
+        context = prepared.context
+        price_data = prepared.price_data
+        fundamentals = prepared.fundamentals
+        sec_flagged = prepared.sec_flagged
+        news_flag = prepared.news_flag
+        use_synthetic = prepared.use_synthetic
+        features = prepared.features
+        feature_names = prepared.feature_names
+        anomaly_result = prepared.anomaly_result
+
         # Step 6: Compute direct risk signals (primary scoring method)
         print("\n[Step 6] Computing risk signals...")
         computed_signals = self.compute_signals(
             features, feature_names, fundamentals, sec_flagged,
             anomaly_result, price_data,
         )
-        signal_total_score = sum(s.weight for s in computed_signals)
+        # One pass over the signals for the total score and the
+        # PATTERN/ALERT evidence checks used below
+        signal_total_score = 0
+        has_alert = has_pattern_or_alert = False
+        for sig in computed_signals:
+            signal_total_score += sig.weight
+            if sig.category in ('PATTERN', 'ALERT'):
+                has_pattern_or_alert = True
+                if sig.code == 'ALERT_LIST_HIT':
+                    has_alert = True
         print(f"   Signals detected: {len(computed_signals)}")
         print(f"   Signal total score: {signal_total_score}")
         for sig in computed_signals[:5]:
@@ -917,10 +1182,6 @@ class ScamDetectionPipeline:
         # *being* manipulated, so it caps at MEDIUM. This is deliberately
         # conservative and SHOULD be recalibrated against a labelled dataset
         # (report Brier/reliability) before being treated as tuned.
-        has_alert = any(s.code == 'ALERT_LIST_HIT' for s in computed_signals)
-        has_pattern_or_alert = any(
-            s.category in ('PATTERN', 'ALERT') for s in computed_signals
-        )
         if has_alert:
             signal_risk_level = 'HIGH'
         elif signal_total_score >= 5 and has_pattern_or_alert:
@@ -935,17 +1196,11 @@ class ScamDetectionPipeline:
 
         # Step 7: ML model ensemble (supplementary)
         print("\n[Step 7] ML ensemble (supplementary)...")
-        is_otc = fundamentals.get('is_otc', False)
-        # market_cap may be None when fundamentals are unavailable — treat
-        # unknown as "not micro-cap" so we never fabricate a micro-cap floor.
-        market_cap = fundamentals.get('market_cap')
-        is_micro_cap = market_cap is not None and market_cap < MARKET_THRESHOLDS['micro_cap']
-
-        combined_prob = self.combine_predictions(
-            rf_prob, lstm_prob, anomaly_result, sec_flagged,
-            is_otc=is_otc, is_micro_cap=is_micro_cap
-        )
-        ml_risk_level = self.calibrate_probability(combined_prob)
+        if calibration is None:
+            combined_prob = self._combined_probability(prepared, rf_prob, lstm_prob)
+            ml_risk_level = self.calibrate_probability(combined_prob)
+        else:
+            combined_prob, ml_risk_level = calibration
         print(f"   ML combined probability: {combined_prob:.3f}")
         print(f"   ML risk level: {ml_risk_level}")
 
@@ -961,7 +1216,8 @@ class ScamDetectionPipeline:
         # Step 8: Generate explanation
         print("\n[Step 8] Generating explanation...")
         explanation, key_indicators = self.generate_explanation(
-            context, features, feature_names, anomaly_result, combined_prob
+            context, features, feature_names, anomaly_result, combined_prob,
+            risk_level=ml_risk_level
         )
 
         # Step 9: News verification for HIGH risk results
@@ -0,0 +1,144 @@
+"""
+Tests for the anomaly detection module.
+Verifies that the batch path and precomputed latest-row/window inputs score
+tickers exactly like the single-ticker detect_anomalies call.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+sys.path.insert(0, '.')
+from anomaly_detection import detect_anomalies, detect_anomalies_batch, detect_pattern_anomalies
+from feature_engineering import engineer_all_features
+
+
+@pytest.fixture
+def engineered_frames(sample_price_data, pump_price_data):
+    return [
+        engineer_all_features(sample_price_data.assign(Return=sample_price_data['Close'].pct_change())),
+        engineer_all_features(pump_price_data.assign(Return=pump_price_data['Close'].pct_change())),
+    ]
+
+
+def test_batch_matches_single_ticker(engineered_frames):
+    batch = detect_anomalies_batch(engineered_frames)
+    assert len(batch) == len(engineered_frames)
+    for df, result in zip(engineered_frames, batch):
+        single = detect_anomalies(df)
+        assert result.is_anomaly == single.is_anomaly
+        assert result.anomaly_score == pytest.approx(single.anomaly_score)
+        assert result.anomaly_types == single.anomaly_types
+        assert result.details == single.details
+
+
+def test_pump_scores_above_normal(engineered_frames):
+    normal, pump = detect_anomalies_batch(engineered_frames)
+    assert pump.anomaly_score > normal.anomaly_score
+    assert pump.is_anomaly
+
+
+def test_batch_accepts_per_ticker_news_flags(engineered_frames):
+    _, pump_without_news = detect_anomalies_batch(engineered_frames, news_flag=[False, False])
+    _, pump_with_news = detect_anomalies_batch(engineered_frames, news_flag=[False, True])
+    assert pump_with_news.details['news_adjusted'] is True
+    assert pump_with_news.anomaly_score < pump_without_news.anomaly_score
+    assert 'weekly_price_pump' not in pump_with_news.anomaly_types
+
+
+def test_precomputed_latest_and_window_match_frame(engineered_frames):
+    for df in engineered_frames:
+        window = np.column_stack([
+            df[col].to_numpy()[-14:]
+            for col in ('Close', 'Volume_Surge_Factor', 'Price_Change_1d', 'Return')
+        ])
+        result = detect_anomalies(latest=df.iloc[-1].to_dict(), window=window)
+        expected = detect_anomalies(df)
+        assert result.anomaly_score == pytest.approx(expected.anomaly_score)
+        assert result.anomaly_types == expected.anomaly_types
+
+
+def test_precomputed_inputs_require_frame_or_both():
+    with pytest.raises(ValueError):
+        detect_anomalies(latest={'Volume_Surge_Factor': 4.0})
+
+
+def test_skipping_pattern_keeps_anomaly_decision(engineered_frames):
+    for news_flag in (False, True):
+        full = detect_anomalies_batch(engineered_frames, news_flag=news_flag)
+        fast = detect_anomalies_batch(engineered_frames, news_flag=news_flag, include_pattern=False)
+        for f, q in zip(full, fast):
+            assert q.is_anomaly == f.is_anomaly
+            assert q.anomaly_score <= f.anomaly_score + 1e-12
+
+
+def test_empty_batch():
+    assert detect_anomalies_batch([]) == []
+
+
+def test_polars_frame_matches_pandas(engineered_frames):
+    pl = pytest.importorskip('polars')
+    for df in engineered_frames:
+        result = detect_anomalies(pl.from_pandas(df.reset_index()))
+        expected = detect_anomalies(df)
+        assert result.anomaly_score == pytest.approx(expected.anomaly_score)
+        assert result.anomaly_types == expected.anomaly_types
+
+
+def test_pump_and_dump_peak_ignores_missing_closes():
+    close = np.array([10, 10, 11, 12, 15, 18, 20, np.nan, 16, 14, 13, 12, 12, 12], dtype=float)
+    df = pd.DataFrame({
+        'Close': close,
+        'Volume_Surge_Factor': np.ones(14),
+        'Price_Change_1d': np.zeros(14),
+        'Price_Change_7d': np.zeros(14),
+        'Return': np.zeros(14),
+    })
+    result = detect_pattern_anomalies(df)
+    assert 'pump_and_dump_pattern' in result.anomaly_types
+
+
+def test_float32_batch_matches_float64(engineered_frames):
+    full = detect_anomalies_batch(engineered_frames)
+    reduced = detect_anomalies_batch(engineered_frames, dtype=np.float32)
+    for f, r in zip(full, reduced):
+        assert r.is_anomaly == f.is_anomaly
+        assert r.anomaly_types == f.anomaly_types
+        assert r.anomaly_score == pytest.approx(f.anomaly_score, rel=1e-5)
+
+
+def test_repeated_calls_are_memoized(engineered_frames):
+    from anomaly_detection import _detect_anomalies_cached
+    df = engineered_frames[1]
+    first = detect_anomalies(df, sensitivity=1.3)
+    hits = _detect_anomalies_cached.cache_info().hits
+    second = detect_anomalies(df, sensitivity=1.3)
+    assert _detect_anomalies_cached.cache_info().hits == hits + 1
+    assert second == first
+    second.anomaly_types.append('caller_annotation')
+    assert 'caller_annotation' not in detect_anomalies(df, sensitivity=1.3).anomaly_types
+
+
+def test_memoized_nested_details_are_not_shared(engineered_frames):
+    df = engineered_frames[1]
+    first = detect_anomalies(df, sensitivity=1.7)
+    first.details['component_scores']['zscore'] = -1.0
+    first.details['surge_analysis'].anomaly_types.append('caller_annotation')
+    first.details['surge_analysis'].volume_surge_factor = -1.0
+    second = detect_anomalies(df, sensitivity=1.7)
+    assert second.details['component_scores']['zscore'] != -1.0
+    assert 'caller_annotation' not in second.details['surge_analysis'].anomaly_types
+    assert second.details['surge_analysis'].volume_surge_factor != -1.0
+
+
+def test_float32_frame_pattern_window_matches_float64():
+    from data_ingestion import generate_synthetic_stock_data, preprocess_price_data
+    df = engineer_all_features(preprocess_price_data(
+        generate_synthetic_stock_data('PUMP32', days=40, include_pump=True)
+    ))
+    reduced = df.astype({col: np.float32 for col in df.select_dtypes('float64').columns})
+    pattern = detect_pattern_anomalies(reduced)
+    result = detect_anomalies(reduced)
+    assert pattern.anomaly_score > 0
+    assert result.details['pattern_analysis'].anomaly_score == pytest.approx(pattern.anomaly_score)
+    assert result.anomaly_score == pytest.approx(detect_anomalies(df).anomaly_score, rel=1e-5)
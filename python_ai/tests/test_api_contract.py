@@ -106,6 +106,29 @@ def test_news_flag_is_accepted(client):
     assert r.status_code == 200, r.text
 
 
+def test_repeat_analyze_is_served_from_cache(client, monkeypatch):
+    payload = {'ticker': 'CACHE', 'use_live_data': False}
+    first = client.post('/analyze', headers={'X-API-Key': API_KEY}, json=payload)
+    assert first.status_code == 200, first.text
+
+    async def no_pipeline():
+        raise AssertionError('cache hit must not touch the pipeline')
+
+    monkeypatch.setattr(api_server, 'get_pipeline', no_pipeline)
+    second = client.post('/analyze', headers={'X-API-Key': API_KEY}, json={**payload, 'ticker': 'cache'})
+    assert second.status_code == 200
+    assert second.json() == first.json()
+
+
+def test_zero_cache_size_disables_cache(client, monkeypatch):
+    monkeypatch.setattr(api_server, 'ANALYSIS_CACHE_MAX_SIZE', 0)
+    monkeypatch.setattr(api_server, '_ANALYSIS_CACHE', {})
+    r = client.post('/analyze', headers={'X-API-Key': API_KEY},
+                    json={'ticker': 'NOCACHE', 'use_live_data': False})
+    assert r.status_code == 200, r.text
+    assert api_server._ANALYSIS_CACHE == {}
+
+
 def test_batch_endpoint_rejects_oversized_input(client):
     r = client.post(
         '/pre-pump-scan',
@@ -139,3 +162,28 @@ def test_synthetic_fundamentals_still_work():
     fund = get_stock_fundamentals('TEST', use_synthetic=True, is_scam_scenario=True)
     assert fund['market_cap'] is not None
     assert fund['exchange'] in ('OTC', 'PINK', 'OTCBB')
+
+
+def test_batcher_tracks_dispatches_until_they_finish():
+    import asyncio
+
+    class FailingPipeline:
+        def prepare_analysis(self, ticker):
+            raise ValueError(ticker)
+
+    async def run():
+        batcher = api_server.AnalyzeBatcher(max_size=4, max_latency_ms=5)
+        p = FailingPipeline()
+        results = await asyncio.gather(
+            *(batcher.submit(p, {'ticker': t}) for t in ('A', 'B')),
+            return_exceptions=True,
+        )
+        assert [str(r) for r in results] == ['A', 'B']
+        # Callers resolve just before the dispatch task itself completes
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert not batcher._inflight
+        await batcher.close()
+        assert batcher.collector is None
+
+    asyncio.run(run())
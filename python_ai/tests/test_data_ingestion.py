@@ -0,0 +1,188 @@
+"""
+Tests for the data ingestion module: live-data cache, synthetic generators,
+preprocessing and context creation.
+"""
+
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, '.')
+import data_ingestion
+from data_ingestion import load_stock_data
+
+
+def test_concurrent_history_misses_fetch_once(monkeypatch):
+    calls = []
+
+    def fake_fetch(ticker, days):
+        calls.append(ticker)
+        time.sleep(0.05)
+        return pd.DataFrame({'Close': [1.0] * days})
+
+    monkeypatch.setattr(data_ingestion, '_fetch_stock_history', fake_fetch)
+    monkeypatch.setattr(data_ingestion, '_LIVE_CACHE', data_ingestion.OrderedDict())
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(load_stock_data('SNGL', days=5, use_synthetic=False)))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert calls == ['SNGL']
+    assert len(results) == 4 and all(len(df) == 5 for df in results)
+
+
+def test_live_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(data_ingestion, '_LIVE_CACHE', data_ingestion.OrderedDict())
+    monkeypatch.setattr(data_ingestion, 'LIVE_CACHE_MAX_ENTRIES', 2)
+    for key in ('a', 'b', 'c'):
+        data_ingestion._cache_set(key, key)
+    assert data_ingestion._cache_get('a') is None
+    assert data_ingestion._cache_get('c') == 'c'
+
+
+def test_asset_contexts_batch_matches_single():
+    tickers = ['AAA', 'BBB', 'CCC']
+    batch = data_ingestion.create_asset_contexts_batch(tickers, is_scam_scenario=True, max_workers=2)
+    assert [ctx['ticker'] for ctx in batch] == tickers
+    for ticker, ctx in zip(tickers, batch):
+        single = data_ingestion.create_asset_context(ticker, is_scam_scenario=True)
+        pd.testing.assert_frame_equal(ctx['price_data'].drop(columns='Date'), single['price_data'].drop(columns='Date'))
+        assert ctx['fundamentals'] == single['fundamentals']
+    assert len({ctx['created_at'] for ctx in batch}) == 1
+
+
+def test_sec_check_results_are_independent_copies():
+    flagged = data_ingestion.check_sec_flagged_list('scam')
+    assert flagged['is_flagged'] is True
+    clear = data_ingestion.check_sec_flagged_list('AAPL')
+    clear['is_flagged'] = True
+    assert data_ingestion.check_sec_flagged_list('AAPL')['is_flagged'] is False
+
+
+def test_preprocess_matches_pandas_fills_and_returns():
+    df = data_ingestion.generate_synthetic_stock_data('GAPS', days=40).astype({'Volume': float})
+    df.loc[[0, 5, 6, 20], 'Close'] = float('nan')
+    df.loc[[3, 21], 'Volume'] = float('nan')
+    result = data_ingestion.preprocess_price_data(df)
+
+    close = df['Close'].ffill()
+    volume = df['Volume'].fillna(0)
+    expected = {
+        'Return': close.pct_change(),
+        'Return_7d': close.pct_change(periods=7),
+        'Return_30d': close.pct_change(periods=30),
+        'Dollar_Volume': close * volume,
+    }
+    for col, values in expected.items():
+        pd.testing.assert_series_equal(result[col], values.fillna(0), check_names=False)
+    assert result['Close'].iloc[0] == 0
+    assert result['Close'].iloc[6] == close.iloc[4]
+
+
+def test_presorted_preprocess_matches_default():
+    for df in (data_ingestion.generate_synthetic_stock_data('SORT', days=60, include_pump=True),
+               data_ingestion.generate_synthetic_crypto_data('SORT', minutes=500)):
+        pd.testing.assert_frame_equal(
+            data_ingestion.preprocess_price_data(df, presorted=True),
+            data_ingestion.preprocess_price_data(df)
+        )
+
+
+def test_preprocess_fills_object_dtype_prices():
+    df = pd.DataFrame({
+        'Date': pd.date_range('2024-01-01', periods=5),
+        'Open': [1.0] * 5, 'High': [1.0] * 5, 'Low': [1.0] * 5,
+        'Close': pd.Series([1, 2, None, 4, 5], dtype=object),
+        'Volume': [100] * 5,
+    })
+    out = data_ingestion.preprocess_price_data(df)
+    assert out['Close'].tolist() == [1.0, 2.0, 2.0, 4.0, 5.0]
+    assert out['Return'].tolist()[1:] == [1.0, 0.0, 1.0, 0.25]
+
+
+def test_presorted_preprocess_rejects_unsorted_dates():
+    df = data_ingestion.generate_synthetic_stock_data('SORT', days=30)
+    shuffled = df.iloc[::-1].reset_index(drop=True)
+    with pytest.raises(ValueError):
+        data_ingestion.preprocess_price_data(shuffled, presorted=True)
+
+
+def test_synthetic_data_is_memoized_and_caller_owned():
+    data_ingestion.clear_synthetic_cache()
+    first = data_ingestion.generate_synthetic_stock_data('MEMO', days=30)
+    first.loc[0, 'Close'] = -1.0
+    first['Volume'].values[0] = -1
+    first['Date'].values[0] = np.datetime64('2000-01-01')
+    second = data_ingestion.generate_synthetic_stock_data('MEMO', days=30)
+    assert data_ingestion._synthetic_stock_values.cache_info().hits == 1
+    assert second.loc[0, 'Close'] > 0
+    assert second.loc[0, 'Volume'] > 0
+    assert second['Date'].iloc[0] == pd.Timestamp.now().normalize() - pd.Timedelta(days=29)
+
+    data_ingestion.clear_synthetic_cache()
+    assert data_ingestion._synthetic_stock_values.cache_info().currsize == 0
+    pd.testing.assert_frame_equal(data_ingestion.generate_synthetic_stock_data('MEMO', days=30), second)
+
+
+def test_float32_synthetic_data_keeps_dtype_through_preprocess():
+    full = data_ingestion.generate_synthetic_stock_data('HALF', days=60, include_pump=True)
+    half = data_ingestion.generate_synthetic_stock_data('HALF', days=60, include_pump=True, dtype=np.float32)
+    assert (half[['Open', 'High', 'Low', 'Close']].dtypes == np.float32).all()
+    np.testing.assert_allclose(half['Close'], full['Close'], rtol=1e-6)
+
+    processed = data_ingestion.preprocess_price_data(half)
+    assert (processed[['Return', 'Log_Return', 'Dollar_Volume']].dtypes == np.float32).all()
+
+
+def test_synthetic_fundamentals_are_memoized_copies():
+    first = data_ingestion.get_stock_fundamentals('MEMO', is_scam_scenario=True)
+    first['_thresholds'] = {}
+    second = data_ingestion.get_stock_fundamentals('MEMO', is_scam_scenario=True)
+    assert '_thresholds' not in second
+    assert second == {k: v for k, v in first.items() if k != '_thresholds'}
+    assert data_ingestion.get_crypto_metrics('MEMO') == data_ingestion.get_crypto_metrics('MEMO')
+
+
+def test_stock_data_batch_matches_single():
+    batch = data_ingestion.generate_synthetic_stock_data_batch(['AAA', 'BBB', 'AAA'], days=40, include_pump=True)
+    assert list(batch) == ['AAA', 'BBB']
+    for ticker, df in batch.items():
+        pd.testing.assert_frame_equal(df, data_ingestion.generate_synthetic_stock_data(ticker, days=40, include_pump=True))
+
+
+def test_synthetic_generators_leave_global_rng_alone():
+    data_ingestion.clear_synthetic_cache()
+    state = np.random.get_state()
+    data_ingestion.create_asset_context('RNG', is_scam_scenario=True)
+    data_ingestion.create_asset_context('RNG', asset_type='crypto')
+    after = np.random.get_state()
+    assert state[0] == after[0] and np.array_equal(state[1], after[1]) and state[2:] == after[2:]
+
+
+def test_pump_and_dump_phases_land_on_their_days():
+    df = data_ingestion.generate_synthetic_stock_data('PHASE', days=60, include_pump=True, pump_start_day=40)
+    returns = df['Close'].pct_change().to_numpy()
+    assert ((returns[40:47] >= 0.05 - 1e-9) & (returns[40:47] <= 0.15 + 1e-9)).all()
+    assert ((returns[47:50] >= -0.15 - 1e-9) & (returns[47:50] <= -0.08 + 1e-9)).all()
+
+    crypto = data_ingestion.generate_synthetic_crypto_data('PHASE', minutes=3000, include_pump=True)
+    returns = crypto['Close'].pct_change().to_numpy()
+    pump_start = 3000 - 1440
+    assert (returns[pump_start:pump_start + 720] >= 0.001 - 1e-9).all()
+    assert (returns[pump_start + 720:pump_start + 1080] <= -0.002 + 1e-9).all()
+
+
+def test_fetch_locks_stay_bounded():
+    locks = {data_ingestion._fetch_lock(f'history:T{i}:90') for i in range(1000)}
+    assert len(locks) <= data_ingestion._FETCH_LOCK_STRIPES
+    assert data_ingestion._fetch_lock('history:A:90') is data_ingestion._fetch_lock('history:A:90')
@@ -25,7 +25,7 @@ from data_ingestion import (
     check_sec_flagged_list,
 )
 from ml_model import ScamDetectorRF
-from pipeline import ScamDetectionPipeline, ml_models_enabled
+from pipeline import ScamDetectionPipeline, calibrate_probabilities, ml_models_enabled
 
 
 # ---------------------------------------------------------------------------
@@ -72,6 +72,22 @@ def test_trained_rf_predicts_on_serving_vector_without_mismatch():
     assert list(det.feature_names) == list(RF_FEATURE_NAMES)
 
 
+def test_rf_retrain_and_save_drop_stale_onnx_copy(tmp_path, monkeypatch):
+    det = ScamDetectorRF()
+    det.onnx_session = object()  # stands in for a session on an older forest
+    det.train(*det.generate_synthetic_training_data(n_scam_samples=20, n_normal_samples=20))
+    assert det.onnx_session is None
+
+    def failing_export(onnx_path=None):
+        raise RuntimeError("converter unavailable")
+
+    monkeypatch.setattr(det, 'export_onnx', failing_export)
+    stale = tmp_path / 'rf.onnx'
+    stale.write_bytes(b'old forest')
+    det.save(str(tmp_path / 'rf.joblib'), str(tmp_path / 'scaler.joblib'))
+    assert not stale.exists()
+
+
 # ---------------------------------------------------------------------------
 # PY-C4: OTC exchange detection (real Yahoo strings)
 # ---------------------------------------------------------------------------
@@ -120,6 +136,16 @@ def test_ml_disabled_by_default():
     assert ml_models_enabled() is False
 
 
+def test_calibration_buckets_match_thresholds():
+    from config import RISK_THRESHOLDS
+    p = ScamDetectionPipeline(load_models=False)
+    low, medium = RISK_THRESHOLDS['LOW'], RISK_THRESHOLDS['MEDIUM']
+    probs = [0.0, low - 1e-9, low, medium - 1e-9, medium, 1.0]
+    expected = ['LOW', 'LOW', 'MEDIUM', 'MEDIUM', 'HIGH', 'HIGH']
+    assert [p.calibrate_probability(x) for x in probs] == expected
+    assert calibrate_probabilities(probs).tolist() == expected
+
+
 def test_structural_only_stack_caps_at_medium():
     """price<$5 + small cap + low liquidity with a flat chart must be MEDIUM."""
     p = ScamDetectionPipeline(load_models=False)
@@ -167,3 +193,121 @@ def test_insufficient_history_with_sec_flag_stays_high():
     assert a.risk_level == 'HIGH'
     assert a.sec_flagged is True
     assert a.data_available is False
+
+
+def test_analyze_batch_matches_analyze():
+    """Batching the model step must not change any per-ticker assessment."""
+    p = ScamDetectionPipeline(load_models=False)
+    n = 60
+    frames = {
+        'FLAT': pd.DataFrame({
+            'Date': pd.date_range('2024-01-01', periods=n),
+            'Open': [2.0] * n, 'High': [2.01] * n, 'Low': [1.99] * n,
+            'Close': [2.0] * n, 'Volume': [50_000] * n,
+        }),
+        'THIN': pd.DataFrame({
+            'Date': pd.date_range('2024-01-01', periods=5),
+            'Open': [1.0] * 5, 'High': [1.1] * 5, 'Low': [0.9] * 5,
+            'Close': [1.0] * 5, 'Volume': [1000] * 5,
+        }),
+    }
+    fundamentals = {'market_cap': 20_000_000, 'exchange': 'PNK', 'is_otc': True, 'avg_daily_volume': 50_000}
+    requests = [
+        {'ticker': t, 'price_data': df.copy(), 'fundamentals': dict(fundamentals), 'use_synthetic': False}
+        for t, df in frames.items()
+    ]
+    batch = p.analyze_batch(requests)
+    for req, a in zip(requests, batch):
+        single = p.analyze(**{**req, 'price_data': frames[req['ticker']].copy(), 'fundamentals': dict(fundamentals)})
+        assert a.risk_level == single.risk_level
+        assert [s.code for s in a.signals] == [s.code for s in single.signals]
+        assert a.data_available == single.data_available
+        assert a.explanation == single.explanation
+        assert a.detailed_report['model_outputs'] == single.detailed_report['model_outputs']
+
+
+def test_analyze_batch_can_return_exceptions():
+    p = ScamDetectionPipeline(load_models=False)
+    results = p.analyze_batch([{'ticker': 'BAD', 'price_data': pd.DataFrame(), 'fundamentals': {}}],
+                              return_exceptions=True)
+    assert isinstance(results[0], Exception)
+
+
+def test_wilder_atr_follows_rma_recurrence():
+    df = preprocess_price_data(generate_synthetic_stock_data('TEST', days=60))
+    period = 14
+    atr = fe.compute_atr(df, period=period, smoothing='wilder')
+    tr = atr['True_Range'].to_numpy()
+    expected = np.empty_like(tr)
+    expected[0] = tr[0]
+    for i in range(1, len(tr)):
+        expected[i] = expected[i - 1] + (tr[i] - expected[i - 1]) / period
+    assert np.isnan(atr['ATR'].to_numpy()[:period - 1]).all()
+    np.testing.assert_allclose(atr['ATR'].to_numpy()[period - 1:], expected[period - 1:])
+    sma = fe.compute_atr(df, period=period, smoothing='sma')
+    np.testing.assert_allclose(sma['ATR'].to_numpy()[period - 1:], pd.Series(tr).rolling(period).mean().to_numpy()[period - 1:])
+
+
+def test_wilder_rsi_follows_rma_recurrence():
+    close = preprocess_price_data(generate_synthetic_stock_data('TEST', days=60))['Close']
+    period = 14
+    rsi = fe.compute_rsi(close, period=period, smoothing='wilder')
+    delta = np.diff(close.to_numpy())
+    avg_gain, avg_loss = max(delta[0], 0), max(-delta[0], 0)
+    expected = [np.nan] * period
+    for i, d in enumerate(delta[1:], start=2):
+        avg_gain += (max(d, 0) - avg_gain) / period
+        avg_loss += (max(-d, 0) - avg_loss) / period
+        if i >= period:
+            expected.append(100 - 100 / (1 + avg_gain / avg_loss) if avg_loss else 50)
+    np.testing.assert_allclose(rsi[period:], expected[period:])
+    assert np.all(rsi[:period] == 50)
+
+
+def test_flag_columns_are_uint8():
+    df = fe.engineer_all_features(preprocess_price_data(generate_synthetic_stock_data('TEST', days=60, include_pump=True)))
+    for column in ('Keltner_Breakout_Upper', 'Is_Pumping_7d', 'Volume_Explosion_Moderate',
+                   'Pump_Pattern', 'Price_Acceleration', 'Volume_Acceleration'):
+        assert df[column].dtype == np.uint8
+        assert set(df[column].unique()) <= {0, 1}
+    vector, names = fe.create_feature_vector(df, {'market_cap': 1e7}, {'is_flagged': False})
+    assert vector.dtype == np.float64
+    assert vector[names.index('pump_days_7d')] == df['Is_Pumping_7d'].to_numpy()[-7:].sum()
+
+
+def test_batch_feature_vectors_match_single():
+    frames = [
+        fe.engineer_all_features(preprocess_price_data(generate_synthetic_stock_data(t, days=60, include_pump=pump)))
+        for t, pump in (('AAA', False), ('BBB', True))
+    ]
+    fund = [{'market_cap': 1e7, 'exchange': 'OTC'}, {'market_cap': 5e9, 'exchange': 'NASDAQ'}]
+    sec = [{'is_flagged': True}, {'is_flagged': False}]
+    matrix, names = fe.create_feature_vectors(frames, fund, sec, news_flags=[False, True],
+                                              sentiment_scores=[0.3, None])
+    assert matrix.shape == (2, len(RF_FEATURE_NAMES))
+    assert names == list(fe.FEATURE_ORDER)
+    for row, df, f, s, news, sentiment in zip(matrix, frames, fund, sec, (False, True), (0.3, None)):
+        single, _ = fe.create_feature_vector(df, f, s, news_flag=news, sentiment_score=sentiment)
+        np.testing.assert_array_equal(row, single)
+
+
+def test_contextual_batch_matches_single():
+    fund = [
+        {'market_cap': 2e7, 'float_shares': 1e6, 'avg_daily_volume': 30_000, 'exchange': 'PNK'},
+        {'market_cap': 8e9, 'float_shares': 0, 'avg_daily_volume': 2e6, 'exchange': 'NYSE', 'is_otc': True},
+        {},
+    ]
+    sec = [{'is_flagged': True}, {}, {'is_flagged': False}]
+    ctx = fe.extract_contextual_features_batch(fund, sec, [True, False, False], [0.4, None, -0.2])
+    for row, f, s, news, sentiment in zip(ctx, fund, sec, (True, False, False), (0.4, None, -0.2)):
+        single = fe.extract_contextual_features(f, s, news, sentiment)
+        assert row.tolist() == [float(single[name]) for name, _ in fe._CONTEXT_FEATURES]
+
+
+def test_gpu_rolling_threshold_falls_back_without_cudf(monkeypatch):
+    import dataclasses
+    df = preprocess_price_data(generate_synthetic_stock_data('TEST', days=60))
+    expected = fe.engineer_all_features(df)
+    monkeypatch.setattr(fe, 'FEATURE_PARAMS', dataclasses.replace(fe.FEATURE_PARAMS, gpu_min_rows=1))
+    monkeypatch.setattr(fe, '_load_cudf', lambda: None)
+    pd.testing.assert_frame_equal(fe.engineer_all_features(df), expected)
@@ -167,3 +167,46 @@ def test_volume_acceleration_detected(pump_price_data):
 def test_normal_data_no_acceleration(sample_price_data):
     result = compute_surge_metrics(sample_price_data)
     assert result['Price_Acceleration'].sum() < 5
+
+
+def test_config_exports_every_public_constant():
+    import config
+    import types
+    public = {
+        name for name, value in vars(config).items()
+        if not name.startswith('_') and not isinstance(value, types.ModuleType)
+        and getattr(value, '__module__', 'config') == 'config'
+    }
+    assert public == set(config.__all__)
+
+
+def test_typed_views_mirror_config_dicts():
+    from dataclasses import asdict
+    from config import ANOMALY_PARAMS, MARKET_LIMITS, MARKET_THRESHOLDS
+    assert asdict(ANOMALY_PARAMS) == dict(ANOMALY_CONFIG)
+    assert asdict(MARKET_LIMITS) == dict(MARKET_THRESHOLDS)
+
+
+def test_config_mappings_are_read_only():
+    with pytest.raises(TypeError):
+        ANOMALY_CONFIG['z_score_threshold'] = 0.0
+    otc = get_thresholds(is_otc=True)
+    otc['z_score_threshold'] = 0.0
+    assert get_thresholds(is_otc=True)['z_score_threshold'] == OTC_THRESHOLDS['z_score_threshold']
+
+
+def test_resolve_lstm_path_prefers_present_artifacts(tmp_path):
+    from config import resolve_lstm_path
+    keras_path = str(tmp_path / 'lstm.keras')
+    assert resolve_lstm_path(keras_path) == ('keras', keras_path)
+    (tmp_path / 'lstm.tflite').write_bytes(b'')
+    assert resolve_lstm_path(keras_path) == ('tflite', str(tmp_path / 'lstm.tflite'))
+
+
+def test_tier_thresholds_match_get_thresholds():
+    from config import ThresholdTier, threshold_tier, tier_thresholds
+    for is_otc in (False, True):
+        for on_watchlist in (False, True):
+            tier = threshold_tier(is_otc, on_watchlist)
+            assert dict(tier_thresholds(tier)) == get_thresholds(is_otc, on_watchlist)
+    assert threshold_tier(True, True) is ThresholdTier.WATCHLIST